@@ -0,0 +1,36 @@
+"""add keyset pagination indexes
+
+Revision ID: 64a8e5a09330
+Revises:
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '64a8e5a09330'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_audit_logs_timestamp_id',
+        'audit_logs',
+        ['timestamp', 'id'],
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_events_date_start_time_id',
+        'events',
+        ['date', 'start_time', 'id'],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_date_start_time_id', table_name='events', if_exists=True)
+    op.drop_index('ix_audit_logs_timestamp_id', table_name='audit_logs', if_exists=True)
@@ -0,0 +1,29 @@
+"""add venue conflict index
+
+Revision ID: b3f1c2d4e5a6
+Revises: 64a8e5a09330
+Create Date: 2026-10-16 12:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f1c2d4e5a6'
+down_revision = '64a8e5a09330'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_events_venue_date_start_time_end_time',
+        'events',
+        ['venue', 'date', 'start_time', 'end_time'],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_venue_date_start_time_end_time', table_name='events', if_exists=True)
@@ -0,0 +1,29 @@
+"""add organizer statistics index
+
+Revision ID: c7d2e8f1a903
+Revises: b3f1c2d4e5a6
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d2e8f1a903'
+down_revision = 'b3f1c2d4e5a6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_events_organizer_id_status_date',
+        'events',
+        ['organizer_id', 'status', 'date'],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_organizer_id_status_date', table_name='events', if_exists=True)
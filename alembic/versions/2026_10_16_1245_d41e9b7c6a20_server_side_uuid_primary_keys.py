@@ -0,0 +1,31 @@
+"""server-side uuid primary keys
+
+Revision ID: d41e9b7c6a20
+Revises: c7d2e8f1a903
+Create Date: 2026-10-16 12:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41e9b7c6a20'
+down_revision = 'c7d2e8f1a903'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ['audit_logs', 'categories', 'events', 'organizer_approval_requests']
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text("gen_random_uuid()::text"))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,40 @@
+"""waitlist notification preference as varchar
+
+Revision ID: e5a0c3b9d714
+Revises: d41e9b7c6a20
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a0c3b9d714'
+down_revision = 'd41e9b7c6a20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The native enum stored member names (EMAIL/SMS/BOTH); the column now
+    # stores the lowercase values.
+    op.execute(
+        "ALTER TABLE waitlist ALTER COLUMN notification_preference "
+        "TYPE VARCHAR(8) USING lower(notification_preference::text)"
+    )
+    op.execute("DROP TYPE IF EXISTS notificationpreference")
+    op.create_check_constraint(
+        'ck_waitlist_notification_preference',
+        'waitlist',
+        "notification_preference IN ('email', 'sms', 'both')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_waitlist_notification_preference', 'waitlist', type_='check')
+    op.execute("CREATE TYPE notificationpreference AS ENUM ('EMAIL', 'SMS', 'BOTH')")
+    op.execute(
+        "ALTER TABLE waitlist ALTER COLUMN notification_preference "
+        "TYPE notificationpreference USING upper(notification_preference)::notificationpreference"
+    )
@@ -0,0 +1,54 @@
+"""add partial and covering indexes
+
+Revision ID: f8b4d62e1c57
+Revises: e5a0c3b9d714
+Create Date: 2026-10-16 13:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f8b4d62e1c57'
+down_revision = 'e5a0c3b9d714'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_events_published_date',
+        'events',
+        ['date', 'start_time', 'id'],
+        postgresql_where=sa.text("status = 'PUBLISHED'"),
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_events_pending_created_at',
+        'events',
+        ['created_at'],
+        postgresql_where=sa.text("status = 'PENDING'"),
+        if_not_exists=True
+    )
+    # Supersedes ix_audit_logs_timestamp_id with the same key plus INCLUDE columns
+    op.create_index(
+        'ix_audit_logs_timestamp_covering',
+        'audit_logs',
+        ['timestamp', 'id'],
+        postgresql_include=['action', 'actor_id', 'target_type', 'target_id'],
+        if_not_exists=True
+    )
+    op.drop_index('ix_audit_logs_timestamp_id', table_name='audit_logs', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_audit_logs_timestamp_id',
+        'audit_logs',
+        ['timestamp', 'id'],
+        if_not_exists=True
+    )
+    op.drop_index('ix_audit_logs_timestamp_covering', table_name='audit_logs', if_exists=True)
+    op.drop_index('ix_events_pending_created_at', table_name='events', if_exists=True)
+    op.drop_index('ix_events_published_date', table_name='events', if_exists=True)
@@ -0,0 +1,32 @@
+"""add audit details trigram index
+
+Revision ID: 0a9c5e7f2b18
+Revises: f8b4d62e1c57
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a9c5e7f2b18'
+down_revision = 'f8b4d62e1c57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_audit_logs_details_trgm',
+        'audit_logs',
+        ['details'],
+        postgresql_using='gin',
+        postgresql_ops={'details': 'gin_trgm_ops'},
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_details_trgm', table_name='audit_logs', if_exists=True)
@@ -0,0 +1,58 @@
+"""add registration and waitlist indexes
+
+Revision ID: 1b7e3f9a4c62
+Revises: 0a9c5e7f2b18
+Create Date: 2026-10-16 13:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b7e3f9a4c62'
+down_revision = '0a9c5e7f2b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_registrations_event_id_status',
+        'registrations',
+        ['event_id', 'status'],
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_registrations_event_id_check_in_status',
+        'registrations',
+        ['event_id', 'check_in_status'],
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_registrations_user_id_event_id_status',
+        'registrations',
+        ['user_id', 'event_id', 'status'],
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_registrations_reminder_pending',
+        'registrations',
+        ['event_id'],
+        postgresql_where=sa.text("reminder_sent = false AND status = 'CONFIRMED'"),
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_waitlist_event_id_position',
+        'waitlist',
+        ['event_id', 'position'],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_waitlist_event_id_position', table_name='waitlist', if_exists=True)
+    op.drop_index('ix_registrations_reminder_pending', table_name='registrations', if_exists=True)
+    op.drop_index('ix_registrations_user_id_event_id_status', table_name='registrations', if_exists=True)
+    op.drop_index('ix_registrations_event_id_check_in_status', table_name='registrations', if_exists=True)
+    op.drop_index('ix_registrations_event_id_status', table_name='registrations', if_exists=True)
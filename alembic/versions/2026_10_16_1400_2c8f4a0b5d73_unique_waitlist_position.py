@@ -0,0 +1,50 @@
+"""unique waitlist position per event
+
+Revision ID: 2c8f4a0b5d73
+Revises: 1b7e3f9a4c62
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c8f4a0b5d73'
+down_revision = '1b7e3f9a4c62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Earlier concurrent joins could produce duplicate positions; renumber
+    # each event's queue 1..n in its current order before enforcing uniqueness.
+    op.execute(
+        """
+        UPDATE waitlist AS w
+        SET position = ranked.new_position
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY event_id ORDER BY position, joined_at, id
+            ) AS new_position
+            FROM waitlist
+        ) AS ranked
+        WHERE w.id = ranked.id AND w.position <> ranked.new_position
+        """
+    )
+    op.drop_index('ix_waitlist_event_id_position', table_name='waitlist', if_exists=True)
+    op.create_unique_constraint(
+        'uq_waitlist_event_id_position',
+        'waitlist',
+        ['event_id', 'position']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_waitlist_event_id_position', 'waitlist', type_='unique')
+    op.create_index(
+        'ix_waitlist_event_id_position',
+        'waitlist',
+        ['event_id', 'position'],
+        if_not_exists=True
+    )
@@ -0,0 +1,60 @@
+"""backfill event registration and waitlist counters
+
+Revision ID: 3d9a5b1c6e84
+Revises: 2c8f4a0b5d73
+Create Date: 2026-10-16 14:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d9a5b1c6e84'
+down_revision = '2c8f4a0b5d73'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # events.registered_count and events.waitlist_count are the source of truth
+    # for capacity checks. Before counter updates were atomic, concurrent requests
+    # could lose increments, so recompute both from the rows once.
+    # registered_count counts attendees: each confirmed registration plus its guests.
+    op.execute(
+        """
+        UPDATE events AS e
+        SET registered_count = COALESCE(counts.attendees, 0)
+        FROM events AS src
+        LEFT JOIN (
+            SELECT event_id, SUM(
+                1 + CASE WHEN json_typeof(guests) = 'array'
+                         THEN json_array_length(guests) ELSE 0 END
+            ) AS attendees
+            FROM registrations
+            WHERE status = 'CONFIRMED'
+            GROUP BY event_id
+        ) AS counts ON counts.event_id = src.id
+        WHERE e.id = src.id
+          AND e.registered_count <> COALESCE(counts.attendees, 0)
+        """
+    )
+    op.execute(
+        """
+        UPDATE events AS e
+        SET waitlist_count = COALESCE(counts.entries, 0)
+        FROM events AS src
+        LEFT JOIN (
+            SELECT event_id, COUNT(*) AS entries
+            FROM waitlist
+            GROUP BY event_id
+        ) AS counts ON counts.event_id = src.id
+        WHERE e.id = src.id
+          AND e.waitlist_count <> COALESCE(counts.entries, 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    # Data-only migration; the recomputed counts are left in place.
+    pass
@@ -0,0 +1,41 @@
+"""cover reminder pending index
+
+Revision ID: 4e1b7c2d8f95
+Revises: 3d9a5b1c6e84
+Create Date: 2026-10-16 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e1b7c2d8f95'
+down_revision = '3d9a5b1c6e84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Carry user_id and id so the reminder job reads registrations from the
+    # partial index alone (index-only scan) before joining users.
+    op.drop_index('ix_registrations_reminder_pending', table_name='registrations', if_exists=True)
+    op.create_index(
+        'ix_registrations_reminder_pending',
+        'registrations',
+        ['event_id'],
+        postgresql_include=['user_id', 'id'],
+        postgresql_where=sa.text("reminder_sent = false AND status = 'CONFIRMED'"),
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_registrations_reminder_pending', table_name='registrations', if_exists=True)
+    op.create_index(
+        'ix_registrations_reminder_pending',
+        'registrations',
+        ['event_id'],
+        postgresql_where=sa.text("reminder_sent = false AND status = 'CONFIRMED'"),
+        if_not_exists=True
+    )
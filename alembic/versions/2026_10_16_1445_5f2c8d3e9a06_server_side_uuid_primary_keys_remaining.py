@@ -0,0 +1,30 @@
+"""server-side uuid primary keys for remaining tables
+
+Revision ID: 5f2c8d3e9a06
+Revises: 4e1b7c2d8f95
+Create Date: 2026-10-16 14:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2c8d3e9a06'
+down_revision = '4e1b7c2d8f95'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ['registrations', 'users', 'venues', 'waitlist']
+
+
+def upgrade() -> None:
+    # pgcrypto was enabled by d41e9b7c6a20 for servers older than PostgreSQL 13
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text("gen_random_uuid()::text"))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,39 @@
+"""add published title and popularity indexes
+
+Revision ID: 6a3d9e4f0b17
+Revises: 5f2c8d3e9a06
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a3d9e4f0b17'
+down_revision = '5f2c8d3e9a06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keyset pagination for the title and popularity orderings of the public listing
+    op.create_index(
+        'ix_events_published_title_id',
+        'events',
+        ['title', 'id'],
+        postgresql_where=sa.text("status = 'PUBLISHED'"),
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_events_published_popularity',
+        'events',
+        [sa.text('registered_count DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text("status = 'PUBLISHED'"),
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_published_popularity', table_name='events', if_exists=True)
+    op.drop_index('ix_events_published_title_id', table_name='events', if_exists=True)
@@ -0,0 +1,40 @@
+"""cover published events list filters
+
+Revision ID: 7b4e0a5f1c28
+Revises: 6a3d9e4f0b17
+Create Date: 2026-10-16 15:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b4e0a5f1c28'
+down_revision = '6a3d9e4f0b17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Supersedes ix_events_published_date with the same key plus INCLUDE columns
+    op.create_index(
+        'ix_events_published_date_covering',
+        'events',
+        ['date', 'start_time', 'id'],
+        postgresql_include=['category_id', 'organizer_id', 'registered_count', 'capacity'],
+        postgresql_where=sa.text("status = 'PUBLISHED'"),
+        if_not_exists=True
+    )
+    op.drop_index('ix_events_published_date', table_name='events', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_events_published_date',
+        'events',
+        ['date', 'start_time', 'id'],
+        postgresql_where=sa.text("status = 'PUBLISHED'"),
+        if_not_exists=True
+    )
+    op.drop_index('ix_events_published_date_covering', table_name='events', if_exists=True)
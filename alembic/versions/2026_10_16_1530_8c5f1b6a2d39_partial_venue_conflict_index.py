@@ -0,0 +1,39 @@
+"""partial venue conflict index
+
+Revision ID: 8c5f1b6a2d39
+Revises: 7b4e0a5f1c28
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c5f1b6a2d39'
+down_revision = '7b4e0a5f1c28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Supersedes ix_events_venue_date_start_time_end_time with the same key,
+    # limited to the statuses check_venue_conflict looks at
+    op.create_index(
+        'ix_events_venue_booked',
+        'events',
+        ['venue', 'date', 'start_time', 'end_time'],
+        postgresql_where=sa.text("status IN ('PENDING', 'PUBLISHED')"),
+        if_not_exists=True
+    )
+    op.drop_index('ix_events_venue_date_start_time_end_time', table_name='events', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_events_venue_date_start_time_end_time',
+        'events',
+        ['venue', 'date', 'start_time', 'end_time'],
+        if_not_exists=True
+    )
+    op.drop_index('ix_events_venue_booked', table_name='events', if_exists=True)
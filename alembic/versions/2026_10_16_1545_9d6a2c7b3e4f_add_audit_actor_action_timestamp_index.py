@@ -0,0 +1,32 @@
+"""add audit actor action timestamp index
+
+Revision ID: 9d6a2c7b3e4f
+Revises: 8c5f1b6a2d39
+Create Date: 2026-10-16 15:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d6a2c7b3e4f'
+down_revision = '8c5f1b6a2d39'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Backs count_by_action_and_actor (the daily announcement limit) so it
+    # reads only the actor's matching rows instead of everything since the
+    # cutoff or every row by the actor
+    op.create_index(
+        'ix_audit_logs_actor_id_action_timestamp',
+        'audit_logs',
+        ['actor_id', 'action', 'timestamp'],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_actor_id_action_timestamp', table_name='audit_logs', if_exists=True)
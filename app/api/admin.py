@@ -302,17 +302,7 @@ async def get_all_categories(
     categories = admin_service.get_all_categories(current_user, include_inactive=includeInactive)
 
     # Convert to response format
-    category_responses = [CategoryResponse(
-        id=cat.id,
-        name=cat.name,
-        slug=cat.slug,
-        description=cat.description,
-        color=cat.color,
-        icon=cat.icon,
-        isActive=cat.is_active,
-        createdAt=cat.created_at.isoformat() if cat.created_at else None,
-        updatedAt=cat.updated_at.isoformat() if cat.updated_at else None
-    ) for cat in categories]
+    category_responses = [CategoryResponse(**cat) for cat in categories]
 
     return CategoriesResponse(categories=category_responses)
 
@@ -457,16 +447,7 @@ async def get_all_venues(
     venues = admin_service.get_all_venues(current_user, include_inactive=includeInactive)
 
     # Convert to response format
-    venue_responses = [VenueResponse(
-        id=venue.id,
-        name=venue.name,
-        building=venue.building,
-        capacity=venue.capacity,
-        facilities=venue.facilities if venue.facilities else [],
-        isActive=venue.is_active,
-        createdAt=venue.created_at.isoformat() if venue.created_at else None,
-        updatedAt=venue.updated_at.isoformat() if venue.updated_at else None
-    ) for venue in venues]
+    venue_responses = [VenueResponse(**venue) for venue in venues]
 
     return VenuesResponse(venues=venue_responses)
 
@@ -594,6 +575,7 @@ async def get_audit_logs(
     search: Optional[str] = Query(None, description="Search in details"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (overrides page)"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -607,9 +589,12 @@ async def get_audit_logs(
     - startDate: ISO 8601 date
     - endDate: ISO 8601 date
     - userId: Filter by user
-    - search: Search in details
+    - search: Search in details (at least 3 characters; shorter terms match nothing)
     - page: Pagination page number
     - limit: Items per page (max 100)
+    - cursor: `nextCursor` from a previous page; seeks directly to the next
+      page instead of using page offsets. When supplied, `totalItems` and
+      `totalPages` are null; request page 1 without a cursor for totals.
 
     **Business Rules:**
     - Append-only (cannot edit or delete)
@@ -620,7 +605,7 @@ async def get_audit_logs(
     - Paginated list of audit log entries
     """
     admin_service = AdminService(db)
-    logs, total_count = admin_service.get_audit_logs(
+    logs, total_count, next_cursor = admin_service.get_audit_logs(
         admin=current_user,
         action=action,
         start_date=startDate,
@@ -628,7 +613,8 @@ async def get_audit_logs(
         user_id=userId,
         search=search,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
 
     # Convert to response format
@@ -654,13 +640,14 @@ async def get_audit_logs(
             metadata=log.metadata if isinstance(log.metadata, dict) else None
         ))
 
-    # Calculate pagination
-    total_pages = (total_count + limit - 1) // limit
+    # Calculate pagination (totals are None on cursor requests)
+    total_pages = (total_count + limit - 1) // limit if total_count is not None else None
     pagination = PaginationInfo(
         currentPage=page,
         totalPages=total_pages,
         totalItems=total_count,
-        itemsPerPage=limit
+        itemsPerPage=limit,
+        nextCursor=next_cursor
     )
 
     return AuditLogsResponse(logs=log_responses, pagination=pagination)
@@ -689,15 +676,14 @@ async def export_audit_logs(
     """
     admin_service = AdminService(db)
 
-    # Get all logs (no pagination for export)
-    logs, _ = admin_service.get_audit_logs(
+    # Stream all matching logs (no pagination for export)
+    logs = admin_service.iter_audit_logs(
         admin=current_user,
         action=action,
         start_date=startDate,
         end_date=endDate,
         user_id=userId,
         search=search,
-        page=1,
         limit=10000  # Large limit for export
     )
 
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.core.security import run_password_task
 from app.services.auth_service import AuthService
 from app.middleware.auth import get_current_user, get_current_active_user
 from app.models.user import User
@@ -27,6 +28,7 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 )
 async def login(
     credentials: UserLogin,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -49,7 +51,10 @@ async def login(
     auth_service = AuthService(db)
     
     try:
-        user, token = auth_service.authenticate_user(credentials)
+        # Password hashing is CPU-bound; keep it off the event loop
+        user, token = await run_password_task(
+            auth_service.authenticate_user, credentials, background_tasks
+        )
         
         return TokenResponse(
             success=True,
@@ -105,7 +110,8 @@ async def register(
     auth_service = AuthService(db)
     
     try:
-        user = auth_service.register_user(user_data)
+        # Password hashing is CPU-bound; keep it off the event loop
+        user = await run_password_task(auth_service.register_user, user_data)
         
         # Automatically log in the user
         from app.core.security import create_access_token
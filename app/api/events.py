@@ -1,26 +1,63 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
+from datetime import date
 from app.core.database import get_db
 from app.services.event_service import EventService
 from app.schemas.event import (
     EventsListResponse,
-    EventDetailResponse,
-    EventListResponse,
-    PaginationInfo,
-    CategoryInfo,
-    OrganizerInfo
+    EventsCountResponse,
+    EventListParams,
+    EventDetailResponse
 )
 from app.schemas.category import CategoriesResponse, CategoryResponse
 from app.schemas.venue import VenuesResponse, VenueResponse
 from app.schemas.auth import ErrorResponse
 from app.middleware.auth import get_current_active_user
 from app.models.user import User, UserRole
-from app.services.registration_service import RegistrationService
 
 
 router = APIRouter(prefix="/api", tags=["Events"])
 
+# Detail responses may be reused briefly by the browser, then revalidated
+EVENT_DETAIL_CACHE_CONTROL = "private, max-age=60"
+
+
+def _event_list_item(row) -> dict:
+    """Shape a get_all_published row like EventListResponse."""
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "description": row["description"],
+        "category": {
+            "id": row["category_id"],
+            "name": row["category_name"],
+            "slug": row["category_slug"],
+            "color": row["category_color"]
+        } if row["category_id"] else None,
+        "organizer": {
+            "id": row["organizer_id"],
+            "name": row["organizer_name"],
+            "email": row["organizer_email"],
+            "department": row["organizer_department"]
+        } if row["organizer_id"] else None,
+        "date": row["date"],
+        "startTime": row["start_time"].strftime("%H:%M") if row["start_time"] else None,
+        "endTime": row["end_time"].strftime("%H:%M") if row["end_time"] else None,
+        "venue": row["venue"],
+        "location": row["location"],
+        "capacity": row["capacity"],
+        "registeredCount": row["registered_count"],
+        "waitlistCount": row["waitlist_count"],
+        "status": row["status"].value,
+        "imageUrl": row["image_url"],
+        "tags": row["tags"] or [],
+        "isFeatured": row["is_featured"],
+        "createdAt": row["created_at"],
+        "publishedAt": row["published_at"]
+    }
+
 
 @router.get(
     "/events",
@@ -30,49 +67,8 @@ router = APIRouter(prefix="/api", tags=["Events"])
         404: {"model": ErrorResponse, "description": "Category not found"}
     }
 )
-async def get_events(
-    search: Optional[str] = Query(
-        None,
-        description="Search in title, description, tags, venue, organizer"
-    ),
-    category: Optional[str] = Query(
-        None,
-        description="Category slug (academic, career, cultural, etc.)"
-    ),
-    startDate: Optional[str] = Query(
-        None,
-        alias="startDate",
-        description="ISO 8601 date (filter events after this date)"
-    ),
-    endDate: Optional[str] = Query(
-        None,
-        alias="endDate",
-        description="ISO 8601 date (filter events before this date)"
-    ),
-    organizer: Optional[str] = Query(
-        None,
-        description="Organizer name search"
-    ),
-    availability: Optional[bool] = Query(
-        None,
-        description="If true, only show events with available spots"
-    ),
-    sortBy: Optional[str] = Query(
-        "date",
-        alias="sortBy",
-        description="Sort by: 'date', 'title', or 'popularity' (default: 'date')"
-    ),
-    page: int = Query(
-        1,
-        ge=1,
-        description="Page number (default: 1)"
-    ),
-    limit: int = Query(
-        20,
-        ge=1,
-        le=100,
-        description="Items per page (default: 20, max: 100)"
-    ),
+def get_events(
+    params: EventListParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -96,97 +92,82 @@ async def get_events(
     - **sortBy**: Sort by 'date', 'title', or 'popularity'
     - **page**: Page number (starts at 1)
     - **limit**: Items per page (1-100)
+    - **cursor**: `nextCursor` from a previous page; seeks directly to the
+      next page instead of using page offsets (pass the same sortBy)
     
     **Returns:**
-    - List of events with pagination information
+    - List of events with pagination information. Totals are not computed
+      here; `hasMore` says whether another page exists and
+      `GET /api/events/count` returns the total for the same filters.
     """
     event_service = EventService(db)
     
-    try:
-        events, total_count = event_service.get_published_events(
-            search=search,
-            category=category,
-            start_date=startDate,
-            end_date=endDate,
-            organizer=organizer,
-            availability=availability,
-            sort_by=sortBy,
-            page=page,
-            limit=limit
-        )
-        ## make a call to the registrations API to get the registrations for the user
-       
+    events, next_cursor, has_more = event_service.get_published_events(
+        search=params.search,
+        category=params.category,
+        start_date=params.startDate,
+        end_date=params.endDate,
+        organizer=params.organizer,
+        availability=params.availability,
+        sort_by=params.sortBy,
+        page=params.page,
+        limit=params.limit,
+        cursor=params.cursor,
+        # Students don't see events they're already registered for
+        user_id=current_user.id,
+        exclude_registered=current_user.role == UserRole.STUDENT
+    )
+    
+    # Rows go straight to orjson as plain dicts (dates and datetimes are
+    # encoded natively); response_model stays for the OpenAPI schema only
+    return ORJSONResponse(content={
+        "success": True,
+        "events": [_event_list_item(row) for row in events],
+        "pagination": {
+            "currentPage": params.page,
+            "itemsPerPage": params.limit,
+            "hasMore": has_more,
+            "nextCursor": next_cursor,
+            "totalPages": None,
+            "totalItems": None
+        }
+    })
 
-        ## if the user is a student, we need to check if they are registered for the event
-        if current_user and current_user.role == UserRole.STUDENT:
-            registration_service = RegistrationService(db)
-            registrations = registration_service.get_user_registrations(user_id=current_user.id)
-            events = [event for event in events if event.id not in [registration.event_id for registration in registrations]]
 
-        ## if the user is an organizer, only show the events that they are organizing
-        # if current_user and current_user.role == UserRole.ORGANIZER:
-        #     events = [event for event in events if event.organizer_id == current_user.id]
-                
-        
-        # Convert events to response format
-        event_responses = []
-        for event in events:
-            event_data = EventListResponse(
-                id=event.id,
-                title=event.title,
-                description=event.description,
-                category=CategoryInfo(
-                    id=event.category.id,
-                    name=event.category.name,
-                    slug=event.category.slug,
-                    color=event.category.color
-                ) if event.category else None,
-                organizer=OrganizerInfo(
-                    id=event.organizer.id,
-                    name=event.organizer.name,
-                    email=event.organizer.email,
-                    department=event.organizer.department
-                ) if event.organizer else None,
-                date=event.date.isoformat() if event.date else None,
-                startTime=event.start_time.strftime("%H:%M") if event.start_time else None,
-                endTime=event.end_time.strftime("%H:%M") if event.end_time else None,
-                venue=event.venue,
-                location=event.location,
-                capacity=event.capacity,
-                registeredCount=event.registered_count,
-                waitlistCount=event.waitlist_count,
-                status=event.status.value,
-                imageUrl=event.image_url,
-                tags=event.tags if event.tags else [],
-                isFeatured=event.is_featured,
-                createdAt=event.created_at.isoformat() if event.created_at else None,
-                publishedAt=event.published_at.isoformat() if event.published_at else None
-            )
-            event_responses.append(event_data)
-        
-        # Calculate pagination info
-        total_pages = (total_count + limit - 1) // limit  # Ceiling division
-        
-        pagination = PaginationInfo(
-            currentPage=page,
-            totalPages=total_pages,
-            totalItems=total_count,
-            itemsPerPage=limit
-        )
-        
-        return EventsListResponse(
-            success=True,
-            events=event_responses,
-            pagination=pagination
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve events: {str(e)}"
-        )
+@router.get(
+    "/events/count",
+    response_model=EventsCountResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid parameters"},
+        404: {"model": ErrorResponse, "description": "Category not found"}
+    }
+)
+def get_events_count(
+    search: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    startDate: Optional[date] = Query(None, alias="startDate"),
+    endDate: Optional[date] = Query(None, alias="endDate"),
+    availability: Optional[bool] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Count published events matching the `GET /api/events` filters.
+    
+    For clients that show page totals. Counts are cached for a few seconds
+    per filter set, so they can briefly lag behind new events.
+    """
+    event_service = EventService(db)
+    
+    total_items = event_service.count_published_events(
+        search=search,
+        category=category,
+        start_date=startDate,
+        end_date=endDate,
+        availability=availability
+    )
+    
+    return EventsCountResponse(success=True, totalItems=total_items)
 
 
 @router.get(
@@ -196,8 +177,10 @@ async def get_events(
         404: {"model": ErrorResponse, "description": "Event not found"}
     }
 )
-async def get_event_detail(
+def get_event_detail(
     event_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -219,62 +202,70 @@ async def get_event_detail(
       - Capacity and registration counts
       - Remaining capacity
       - Tags and featured status
+    
+    **Caching:**
+    - Responses carry an `ETag` derived from the event's `updatedAt`; send it
+      back in `If-None-Match` to get `304 Not Modified` when nothing changed
     """
     event_service = EventService(db)
     
-    try:
-        event = event_service.get_event_by_id(event_id)
-        
-        # Build response with full event details
-        event_response = EventDetailResponse(
-            success=True,
-            event={
-                "id": event.id,
-                "title": event.title,
-                "description": event.description,
-                "categoryId": event.category_id,
-                "organizerId": event.organizer_id,
-                "date": event.date.isoformat() if event.date else None,
-                "startTime": event.start_time.strftime("%H:%M") if event.start_time else None,
-                "endTime": event.end_time.strftime("%H:%M") if event.end_time else None,
-                "venue": event.venue,
-                "location": event.location,
-                "capacity": event.capacity,
-                "registeredCount": event.registered_count,
-                "waitlistCount": event.waitlist_count,
-                "remainingCapacity": event.remaining_capacity,
-                "status": event.status.value,
-                "imageUrl": event.image_url,
-                "tags": event.tags if event.tags else [],
-                "isFeatured": event.is_featured,
-                "createdAt": event.created_at.isoformat() if event.created_at else None,
-                "updatedAt": event.updated_at.isoformat() if event.updated_at else None,
-                "publishedAt": event.published_at.isoformat() if event.published_at else None,
-                "cancelledAt": event.cancelled_at.isoformat() if event.cancelled_at else None,
-                "category": {
-                    "id": event.category.id,
-                    "name": event.category.name,
-                    "slug": event.category.slug,
-                    "color": event.category.color
-                } if event.category else None,
-                "organizer": {
-                    "id": event.organizer.id,
-                    "name": event.organizer.name,
-                    "email": event.organizer.email,
-                    "department": event.organizer.department
-                } if event.organizer else None
-            }
-        )
-        
-        return event_response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve event: {str(e)}"
-        )
+    # Revalidation reads only updated_at; the full event and its
+    # relations are loaded only when the client's copy is stale
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = event_service.get_event_etag(event_id)
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": EVENT_DETAIL_CACHE_CONTROL}
+            )
+    
+    event = event_service.get_event_by_id(event_id)
+    response.headers["ETag"] = event_service.event_etag(event.id, event.updated_at)
+    response.headers["Cache-Control"] = EVENT_DETAIL_CACHE_CONTROL
+    
+    # Build response with full event details
+    event_response = EventDetailResponse(
+        success=True,
+        event={
+            "id": event.id,
+            "title": event.title,
+            "description": event.description,
+            "categoryId": event.category_id,
+            "organizerId": event.organizer_id,
+            "date": event.date.isoformat() if event.date else None,
+            "startTime": event.start_time.strftime("%H:%M") if event.start_time else None,
+            "endTime": event.end_time.strftime("%H:%M") if event.end_time else None,
+            "venue": event.venue,
+            "location": event.location,
+            "capacity": event.capacity,
+            "registeredCount": event.registered_count,
+            "waitlistCount": event.waitlist_count,
+            "remainingCapacity": event.remaining_capacity,
+            "status": event.status.value,
+            "imageUrl": event.image_url,
+            "tags": event.tags if event.tags else [],
+            "isFeatured": event.is_featured,
+            "createdAt": event.created_at.isoformat() if event.created_at else None,
+            "updatedAt": event.updated_at.isoformat() if event.updated_at else None,
+            "publishedAt": event.published_at.isoformat() if event.published_at else None,
+            "cancelledAt": event.cancelled_at.isoformat() if event.cancelled_at else None,
+            "category": {
+                "id": event.category.id,
+                "name": event.category.name,
+                "slug": event.category.slug,
+                "color": event.category.color
+            } if event.category else None,
+            "organizer": {
+                "id": event.organizer.id,
+                "name": event.organizer.name,
+                "email": event.organizer.email,
+                "department": event.organizer.department
+            } if event.organizer else None
+        }
+    )
+    
+    return event_response
 
 
 @router.get(
@@ -284,7 +275,7 @@ async def get_event_detail(
         500: {"model": ErrorResponse, "description": "Internal server error"}
     }
 )
-async def get_categories(
+def get_categories(
     db: Session = Depends(get_db)
 ):
     """
@@ -306,39 +297,20 @@ async def get_categories(
       - Description
       - Color code for UI
       - Icon identifier
+    
+    Served from an in-process cache (CATEGORY_CACHE_TTL_SECONDS); changes
+    made through another worker show up once its copy expires.
     """
     event_service = EventService(db)
     
-    try:
-        categories = event_service.get_all_categories(active_only=True)
-        
-        category_responses = [
-            CategoryResponse(
-                id=cat.id,
-                name=cat.name,
-                slug=cat.slug,
-                description=cat.description,
-                color=cat.color,
-                icon=cat.icon,
-                isActive=cat.is_active,
-                createdAt=cat.created_at.isoformat() if cat.created_at else None,
-                updatedAt=cat.updated_at.isoformat() if cat.updated_at else None
-            )
-            for cat in categories
-        ]
-        
-        return CategoriesResponse(
-            success=True,
-            categories=category_responses
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve categories: {str(e)}"
-        )
+    categories = event_service.get_all_categories(active_only=True)
+    
+    category_responses = [CategoryResponse(**cat) for cat in categories]
+    
+    return CategoriesResponse(
+        success=True,
+        categories=category_responses
+    )
 
 
 @router.get(
@@ -348,7 +320,7 @@ async def get_categories(
         500: {"model": ErrorResponse, "description": "Internal server error"}
     }
 )
-async def get_venues(
+def get_venues(
     db: Session = Depends(get_db)
 ):
     """
@@ -359,38 +331,20 @@ async def get_venues(
       - ID, name, building
       - Capacity
       - Available facilities (projector, WiFi, etc.)
+    
+    Served from an in-process cache (VENUE_CACHE_TTL_SECONDS); changes
+    made through another worker show up once its copy expires.
     """
     event_service = EventService(db)
     
-    try:
-        venues = event_service.get_all_venues(active_only=True)
-        
-        venue_responses = [
-            VenueResponse(
-                id=venue.id,
-                name=venue.name,
-                building=venue.building,
-                capacity=venue.capacity,
-                facilities=venue.facilities if venue.facilities else [],
-                isActive=venue.is_active,
-                createdAt=venue.created_at.isoformat() if venue.created_at else None,
-                updatedAt=venue.updated_at.isoformat() if venue.updated_at else None
-            )
-            for venue in venues
-        ]
-        
-        return VenuesResponse(
-            success=True,
-            venues=venue_responses
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve venues: {str(e)}"
-        )
+    venues = event_service.get_all_venues(active_only=True)
+    
+    venue_responses = [VenueResponse(**venue) for venue in venues]
+    
+    return VenuesResponse(
+        success=True,
+        venues=venue_responses
+    )
 
 
 # Health check endpoint
@@ -2,8 +2,8 @@
 Organizer API routes for Phase 4: Organizer Management.
 Handles event creation, management, attendee management, and communication.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List
 import io
@@ -22,11 +22,7 @@ from app.schemas.event import (
     CategoryInfo,
     OrganizerInfo
 )
-from app.schemas.registration import (
-    AttendeesResponse,
-    AttendeeInfo,
-    AttendeeStatistics
-)
+from app.schemas.registration import AttendeesResponse
 from app.schemas.waitlist import WaitlistResponse
 from app.schemas.auth import ErrorResponse, MessageResponse
 from pydantic import BaseModel, Field
@@ -420,6 +416,7 @@ async def update_event(
 async def cancel_event(
     event_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(require_organizer),
     db: Session = Depends(get_db)
 ):
@@ -429,7 +426,7 @@ async def cancel_event(
     **Business Rules:**
     - Only event owner or admin can cancel
     - Cannot cancel already cancelled events
-    - Registered attendees will be notified (planned)
+    - Registered attendees are notified by email after the response is sent
     - Waitlist entries remain for reference
     
     **Path Parameters:**
@@ -447,7 +444,8 @@ async def cancel_event(
             event_id=event_id,
             organizer=current_user,
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            background_tasks=background_tasks
         )
         
         return EventCancelResponse(
@@ -583,6 +581,8 @@ async def get_event_attendees(
         alias="checkInStatus",
         description="Filter by check-in status: checked_in, not_checked_in"
     ),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Attendees per page"),
+    cursor: Optional[str] = Query(None, description="nextCursor from a previous page"),
     current_user: User = Depends(require_organizer),
     db: Session = Depends(get_db)
 ):
@@ -599,48 +599,33 @@ async def get_event_attendees(
     
     **Query Parameters:**
     - checkInStatus: Filter by check-in status (checked_in, not_checked_in)
+    - limit: Attendees per page (max 500); every attendee is returned when omitted
+    - cursor: `nextCursor` from a previous page
     
     **Returns:**
     - List of attendees with details
-    - Statistics (total, checked-in, capacity usage)
+    - Statistics (total, checked-in, capacity usage) over all matching attendees
+    - nextCursor when another page exists
     """
     organizer_service = OrganizerService(db)
     
     try:
-        attendees, statistics = organizer_service.get_event_attendees(
+        attendees, statistics, next_cursor = organizer_service.get_event_attendees(
             event_id=event_id,
             organizer=current_user,
-            check_in_filter=checkInStatus
-        )
-        
-        # Convert to response format
-        attendee_responses = [
-            AttendeeInfo(
-                id=a["id"] or "",
-                registrationId=a["registrationId"],
-                name=a["name"],
-                email=a["email"],
-                registeredAt=a["registeredAt"] or "",
-                checkInStatus=a["checkInStatus"],
-                checkedInAt=a["checkedInAt"],
-                guests=a["guests"]
-            )
-            for a in attendees
-        ]
-        
-        stats_response = AttendeeStatistics(
-            totalRegistrations=statistics["totalRegistrations"],
-            checkedIn=statistics["checkedIn"],
-            notCheckedIn=statistics["notCheckedIn"],
-            totalAttendees=statistics["totalAttendees"],
-            capacityUsed=statistics["capacityUsed"]
+            check_in_filter=checkInStatus,
+            limit=limit,
+            cursor=cursor
         )
         
-        return AttendeesResponse(
-            success=True,
-            attendees=attendee_responses,
-            statistics=stats_response
-        )
+        # Attendee dicts go straight to orjson (datetimes are encoded
+        # natively); response_model stays for the OpenAPI schema only
+        return ORJSONResponse(content={
+            "success": True,
+            "attendees": attendees,
+            "statistics": statistics,
+            "nextCursor": next_cursor
+        })
         
     except HTTPException:
         raise
@@ -684,14 +669,14 @@ async def export_attendees_csv(
     organizer_service = OrganizerService(db)
     
     try:
-        csv_content = organizer_service.export_attendees_csv(
+        csv_chunks = organizer_service.export_attendees_csv(
             event_id=event_id,
             organizer=current_user
         )
         
-        # Return as streaming response with CSV content type
+        # Stream CSV chunks as rows are fetched
         return StreamingResponse(
-            iter([csv_content]),
+            csv_chunks,
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=attendees_{event_id}.csv"
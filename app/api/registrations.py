@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.services.registration_service import RegistrationService
@@ -28,6 +28,7 @@ router = APIRouter(prefix="/api/registrations", tags=["Registrations"])
 )
 async def register_for_event(
     registration_data: RegistrationCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -95,7 +96,9 @@ async def register_for_event(
         # Create registration (all business logic in service)
         registration = registration_service.create_registration(
             user_id=current_user.id,
-            registration_data=registration_data
+            registration_data=registration_data,
+            background_tasks=background_tasks,
+            user=current_user
         )
 
         # Convert to response format
@@ -277,6 +280,7 @@ async def get_user_registrations(
 )
 async def cancel_registration(
     registration_id: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -315,7 +319,8 @@ async def cancel_registration(
         # Cancel the registration (all business logic in service)
         cancelled_registration = registration_service.cancel_registration(
             registration_id=registration_id,
-            user_id=current_user.id
+            user_id=current_user.id,
+            background_tasks=background_tasks
         )
 
         # Return success response
@@ -2,7 +2,7 @@
 Core configuration settings for TerpSpark Backend API.
 Loads environment variables and provides application-wide settings.
 """
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 from functools import lru_cache
 
@@ -24,6 +24,33 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 1800  # Seconds; replace connections before firewall/proxy idle timeouts
+    DATABASE_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection before erroring
+    # LIFO reuses the most recently returned connection, so under light load the
+    # rest sit idle long enough to be recycled and the hot set stays small.
+    # FIFO (False) spreads use evenly and keeps every pooled connection warm.
+    DATABASE_POOL_USE_LIFO: bool = True
+    DATABASE_QUERY_CACHE_SIZE: int = 1200
+    DATABASE_POOL_WARMUP: int = 5  # Connections opened at startup so first requests skip connect
+    # Worker processes sharing the database (uvicorn/gunicorn read the same
+    # variable); used to check the combined pool size against max_connections
+    WEB_CONCURRENCY: int = 1
+    # PostgreSQL session settings applied to every pooled connection. JIT
+    # compilation costs more than it saves on short OLTP queries.
+    DATABASE_JIT: bool = False
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 30000  # 0 disables the timeout
+    STRICT_ORM_LOADING: bool = False  # Raise on relationship lazy loads in list queries
+    
+    # Caching
+    CATEGORY_CACHE_TTL_SECONDS: int = 300
+    VENUE_CACHE_TTL_SECONDS: int = 300
+    EVENT_COUNT_CACHE_TTL_SECONDS: int = 30  # Totals served by /api/events/count
+    ORGANIZER_STATS_CACHE_TTL_SECONDS: int = 90  # Organizer dashboard aggregates
+    
+    # Audit Log
+    AUDIT_LOG_BATCHING: bool = False  # Opt-in: buffer audit rows off-transaction; queued rows are lost on crash
+    AUDIT_LOG_BATCH_SIZE: int = 500
+    AUDIT_LOG_FLUSH_INTERVAL_MS: int = 200
     
     # JWT
     JWT_SECRET_KEY: str
@@ -33,6 +60,7 @@ class Settings(BaseSettings):
     
     # Security
     BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 0  # Threads for password hashing; 0 = 2 x CPU count
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
     
     # Email Configuration
@@ -44,6 +72,7 @@ class Settings(BaseSettings):
     SMTP_FROM_EMAIL: str = "terpspark.events@gmail.com"
     SMTP_FROM_NAME: str = "TerpSpark"
     SMTP_USE_TLS: bool = True
+    EMAIL_SEND_CONCURRENCY: int = 20  # Parallel sends for announcements and cancellation notices
     
     # Rate Limiting
     RATE_LIMIT_LOGIN: str = "5/15minutes"
@@ -72,9 +101,7 @@ class Settings(BaseSettings):
         """Parse allowed image types into a list."""
         return [img_type.strip() for img_type in self.ALLOWED_IMAGE_TYPES.split(",")]
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
 
 @lru_cache()
@@ -1,15 +1,41 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, insert, make_url, text, update, String
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.orm import sessionmaker, Session, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Any, Generator, Optional, Tuple, Type, TypeVar
 from app.core.config import settings
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+def _connect_args() -> dict:
+    """PostgreSQL per-connection settings, sent as libpq startup options."""
+    if make_url(settings.DATABASE_URL).get_backend_name() != "postgresql":
+        return {}
+    
+    options = [
+        f"-c jit={'on' if settings.DATABASE_JIT else 'off'}",
+        f"-c statement_timeout={settings.DATABASE_STATEMENT_TIMEOUT_MS}",
+    ]
+    return {"options": " ".join(options)}
+
 
 engine = create_engine(
     settings.DATABASE_URL,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_use_lifo=settings.DATABASE_POOL_USE_LIFO,
     pool_pre_ping=True,  # Verify connections before using
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,  # Compiled SQL cache entries
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    connect_args=_connect_args(),
 )
 
 SessionLocal = sessionmaker(
@@ -21,10 +47,40 @@ SessionLocal = sessionmaker(
 Base = declarative_base()
 
 
+class gen_random_uuid(FunctionElement):
+    """
+    Server-side UUID primary key default.
+    
+    Renders gen_random_uuid() on PostgreSQL and an equivalent random v4
+    UUID expression on SQLite (used by the test suite).
+    
+    Usage:
+        id = Column(String(36), primary_key=True, server_default=gen_random_uuid())
+    """
+    type = String(36)
+    inherit_cache = True
+
+
+@compiles(gen_random_uuid)
+def _compile_gen_random_uuid(element, compiler, **kw):
+    return "gen_random_uuid()::text"
+
+
+@compiles(gen_random_uuid, "sqlite")
+def _compile_gen_random_uuid_sqlite(element, compiler, **kw):
+    return (
+        "lower(hex(randomblob(4)) || '-' || hex(randomblob(2)) || '-4' || "
+        "substr(hex(randomblob(2)), 2) || '-' || "
+        "substr('89AB', 1 + (abs(random()) % 4), 1) || "
+        "substr(hex(randomblob(2)), 2) || '-' || hex(randomblob(6)))"
+    )
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
-    Automatically closes session after use.
+    Rolls back on error, invalidates the connection on connection-level
+    errors, and drops identity-map references before closing.
     
     Usage:
         @app.get("/users")
@@ -34,10 +90,159 @@ def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
+    except OperationalError:
+        # The connection may be broken; don't return it to the pool
+        db.invalidate()
+        raise
+    except Exception:
+        db.rollback()
+        raise
     finally:
+        db.expunge_all()
         db.close()
 
 
+def strict_loading() -> Tuple:
+    """
+    Loader options that forbid lazy loading any relationship not eagerly loaded.
+    Append after a query's explicit selectinload/joinedload options.
+    
+    Only active when STRICT_ORM_LOADING is enabled; otherwise returns no options.
+    
+    Usage:
+        query.options(selectinload(Event.category), *strict_loading())
+    """
+    if settings.STRICT_ORM_LOADING:
+        return (raiseload("*"),)
+    return ()
+
+
+ModelT = TypeVar("ModelT")
+
+
+def commit_preserving(db: Session, *instances: Any) -> None:
+    """
+    Commit, then put back the column values `instances` had loaded, so
+    reading them after the commit needs no refresh SELECT.
+    
+    Used to finish a transaction made of several commit=False writes.
+    
+    Usage:
+        user = user_repo.create_if_not_exists(..., commit=False)
+        request = approval_repo.create(user_id=user.id, reason=reason, commit=False)
+        commit_preserving(db, user, request)
+    """
+    snapshots = []
+    for instance in instances:
+        state = inspect(instance)
+        snapshots.append((instance, {
+            attr.key: state.dict[attr.key]
+            for attr in state.mapper.column_attrs
+            if attr.key in state.dict
+        }))
+    db.commit()
+
+    for instance, loaded in snapshots:
+        for key, value in loaded.items():
+            set_committed_value(instance, key, value)
+
+
+def update_returning(
+    db: Session,
+    instance: ModelT,
+    commit: bool = True,
+    where: Tuple = (),
+    **values: Any
+) -> Optional[ModelT]:
+    """
+    Update one row with a single UPDATE ... RETURNING and commit.
+    
+    The returned columns are loaded back onto the instance after the commit,
+    so callers don't pay for a refresh SELECT. Values may be SQL expressions
+    (e.g. func.now()), which are evaluated by the database. With
+    commit=False the caller finishes the transaction (see commit_preserving).
+    
+    `where` adds guard conditions checked atomically by the UPDATE itself;
+    if they don't hold, nothing is written and None is returned.
+    
+    Usage:
+        update_returning(db, registration, checked_in_at=func.now())
+        update_returning(db, event, where=(Event.registered_count <= 50,), capacity=50)
+    """
+    mapper = inspect(instance).mapper
+    attrs = list(mapper.column_attrs)
+    stmt = (
+        update(mapper.local_table)
+        .where(mapper.primary_key[0] == mapper.primary_key_from_instance(instance)[0], *where)
+        .values({mapper.column_attrs[key].columns[0]: value for key, value in values.items()})
+        .returning(*(attr.columns[0] for attr in attrs))
+    )
+    result = db.execute(stmt)
+    row = result.one_or_none() if where else result.one()
+    if row is None:
+        return None
+    if commit:
+        db.commit()
+
+    for attr, value in zip(attrs, row):
+        set_committed_value(instance, attr.key, value)
+    return instance
+
+
+def insert_returning(db: Session, model: Type[ModelT], commit: bool = True, **values: Any) -> ModelT:
+    """
+    Insert one row with INSERT ... RETURNING and commit.
+    
+    Skips the unit-of-work flush used by db.add(); the returned instance is
+    persistent in the session and keeps its columns loaded after the commit,
+    so no refresh SELECT is needed. Mapper insert events do not fire. With
+    commit=False the caller finishes the transaction (see commit_preserving).
+    
+    Usage:
+        venue = insert_returning(db, Venue, id=venue_id, name=name, building=building)
+    """
+    instance = db.scalars(insert(model).values(**values).returning(model)).one()
+    if commit:
+        commit_preserving(db, instance)
+    return instance
+
+
+def warm_pool(size: int = settings.DATABASE_POOL_WARMUP) -> None:
+    """
+    Open up to `size` pooled connections and return them to the pool,
+    so the first requests after startup don't pay for connection setup.
+    """
+    connections = []
+    try:
+        for _ in range(min(size, settings.DATABASE_POOL_SIZE)):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def check_pool_budget() -> None:
+    """
+    Warn when every worker's pool at full overflow could exceed the
+    server's max_connections (PostgreSQL only).
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    with engine.connect() as connection:
+        max_connections = int(connection.execute(text("SHOW max_connections")).scalar())
+    
+    per_worker = settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+    budget = per_worker * settings.WEB_CONCURRENCY
+    if budget > max_connections:
+        logger.warning(
+            f"Database pools may open {budget} connections "
+            f"({settings.WEB_CONCURRENCY} workers x {per_worker}) but "
+            f"max_connections is {max_connections}; lower DATABASE_POOL_SIZE "
+            f"or DATABASE_MAX_OVERFLOW"
+        )
+
+
 def init_db() -> None:
     """
     Initialize database - create all tables.
@@ -1,10 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+from typing import Callable, Optional, Dict, Any, Tuple, TypeVar
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+import asyncio
+import functools
+import os
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id with the OWASP-recommended parameters (19 MiB,
+# 2 iterations). Existing bcrypt hashes still verify and are upgraded to
+# argon2id on the user's next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
+
+# Hashing gets its own threads so a burst of logins can't occupy every
+# threadpool worker FastAPI uses for sync endpoints. argon2 releases the
+# GIL, so these run in parallel across cores.
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS or (os.cpu_count() or 1) * 2,
+    thread_name_prefix="password-hash",
+)
+
+T = TypeVar("T")
+
+# The JWT key object is built once rather than by python-jose on every
+# encode/decode; decode_token runs on every authenticated request.
+_jwt_key = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+
+
+async def run_password_task(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a call that hashes or verifies a password on the password-hashing
+    threads and await its result.
+    
+    Args:
+        func: Blocking callable, e.g. AuthService.authenticate_user
+        *args: Positional arguments for func
+        
+    Returns:
+        Whatever func returns (exceptions propagate)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, functools.partial(func, *args))
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -21,6 +65,40 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+@functools.lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    return pwd_context.hash("terpspark-dummy-password")
+
+
+def verify_dummy_password(plain_password: str) -> None:
+    """
+    Spend the time of a real verification when there is no stored hash, so
+    an unknown email can't be told apart from a wrong password by latency.
+    
+    Args:
+        plain_password: The submitted plain text password
+    """
+    pwd_context.verify(plain_password, _dummy_hash())
+
+
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored hash is outdated.
+    
+    Args:
+        plain_password: The plain text password
+        hashed_password: The hashed password from database
+        
+    Returns:
+        Tuple[bool, Optional[str]]: Whether the password matches, and a
+        replacement hash to store if the old one uses a deprecated scheme
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """
     Hash a plain text password.
@@ -64,7 +142,7 @@ def create_access_token(
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
+        _jwt_key,
         algorithm=settings.JWT_ALGORITHM
     )
     
@@ -94,7 +172,7 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET_KEY,
+        _jwt_key,
         algorithm=settings.JWT_ALGORITHM
     )
     
@@ -114,7 +192,7 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET_KEY,
+            _jwt_key,
             algorithms=[settings.JWT_ALGORITHM]
         )
         return payload
@@ -10,13 +10,16 @@ from app.repositories.user_repository import UserRepository
 security = HTTPBearer()
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """
     Get current authenticated user from JWT token.
     
+    A plain def so FastAPI runs the blocking user lookup in its threadpool
+    instead of on the event loop.
+    
     Args:
         credentials: HTTP Bearer credentials
         db: Database session
@@ -163,7 +166,7 @@ async def require_admin(
 
 
 
-async def get_optional_user(
+def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: Session = Depends(get_db)
 ) -> Optional[User]:
@@ -182,6 +185,6 @@ async def get_optional_user(
         return None
     
     try:
-        return await get_current_user(credentials, db)
+        return get_current_user(credentials, db)
     except HTTPException:
         return None
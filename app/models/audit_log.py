@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Text, JSON, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, gen_random_uuid
 
 
 class AuditAction(str, enum.Enum):
@@ -67,7 +67,7 @@ class AuditLog(Base):
     __tablename__ = "audit_logs"
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, index=True, server_default=gen_random_uuid())
     
     # Timestamp
     timestamp = Column(
@@ -121,6 +121,27 @@ class AuditLog(Base):
     # Relationships
     actor = relationship("User", foreign_keys=[actor_id], backref="audit_logs")
     
+    __table_args__ = (
+        # Keyset pagination order (timestamp DESC, id DESC) via backward scan;
+        # the INCLUDE columns let filtered counts run as index-only scans.
+        Index(
+            "ix_audit_logs_timestamp_covering",
+            "timestamp",
+            "id",
+            postgresql_include=["action", "actor_id", "target_type", "target_id"]
+        ),
+        # Per-actor rate limits (count of one action since a time), e.g. the
+        # daily announcement limit; a range scan over that actor's rows only
+        Index("ix_audit_logs_actor_id_action_timestamp", "actor_id", "action", "timestamp"),
+        # Substring search on details (ILIKE '%term%'); requires pg_trgm
+        Index(
+            "ix_audit_logs_details_trgm",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "gin_trgm_ops"}
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<AuditLog(id={self.id}, action={self.action}, actor_id={self.actor_id})>"
     
@@ -151,3 +172,10 @@ class AuditLog(Base):
             "userAgent": self.user_agent,
         }
 
+
+# The details trigram index needs pg_trgm when create_all builds the table
+event.listen(
+    AuditLog.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
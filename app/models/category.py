@@ -1,7 +1,7 @@
 from sqlalchemy import Column, String, Boolean, DateTime, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, gen_random_uuid
 
 
 class Category(Base):
@@ -13,7 +13,7 @@ class Category(Base):
     __tablename__ = "categories"
     
     
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, index=True, server_default=gen_random_uuid())
     
     
     name = Column(String(100), nullable=False, unique=True)
@@ -41,7 +41,8 @@ class Category(Base):
     )
     
     
-    events = relationship("Event", back_populates="category", lazy="dynamic")
+    # Never loaded implicitly; use selectinload(Category.events) where needed
+    events = relationship("Event", back_populates="category", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<Category(id={self.id}, name={self.name}, slug={self.slug})>"
@@ -51,7 +52,7 @@ class Category(Base):
         Convert category to dictionary.
         
         Returns:
-            dict: Category data as dictionary
+            dict: Category data as dictionary (timestamps as datetime)
         """
         return {
             "id": self.id,
@@ -61,7 +62,7 @@ class Category(Base):
             "color": self.color,
             "icon": self.icon,
             "isActive": self.is_active,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
-            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
         }
 
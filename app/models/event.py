@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text, Enum as SQLEnum, JSON, ForeignKey, Date, Time
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text, Enum as SQLEnum, JSON, ForeignKey, Date, Time, Index
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, gen_random_uuid
 
 
 class EventStatus(str, enum.Enum):
@@ -21,7 +21,7 @@ class Event(Base):
     __tablename__ = "events"
     
     
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, index=True, server_default=gen_random_uuid())
     
     
     title = Column(String(200), nullable=False)
@@ -83,6 +83,52 @@ class Event(Base):
     registrations = relationship("Registration", back_populates="event", lazy="dynamic")
     waitlist = relationship("WaitlistEntry", back_populates="event", lazy="dynamic")
     
+    __table_args__ = (
+        # Keyset pagination order for the published events listing
+        Index("ix_events_date_start_time_id", "date", "start_time", "id"),
+        # Venue conflict lookup on event create/update; only pending and
+        # published events can conflict, so drafts and cancelled rows are left out
+        Index(
+            "ix_events_venue_booked",
+            "venue",
+            "date",
+            "start_time",
+            "end_time",
+            postgresql_where=text("status IN ('PENDING', 'PUBLISHED')")
+        ),
+        # Organizer dashboard statistics
+        Index("ix_events_organizer_id_status_date", "organizer_id", "status", "date"),
+        # Partial indexes for the public listing and the admin approval queue
+        # (the native enum stores member names)
+        # INCLUDE carries the list filters (category, organizer, availability)
+        # so the default date-ordered page can be found by an index-only scan
+        Index(
+            "ix_events_published_date_covering",
+            "date",
+            "start_time",
+            "id",
+            postgresql_include=["category_id", "organizer_id", "registered_count", "capacity"],
+            postgresql_where=text("status = 'PUBLISHED'")
+        ),
+        Index(
+            "ix_events_published_title_id",
+            "title",
+            "id",
+            postgresql_where=text("status = 'PUBLISHED'")
+        ),
+        Index(
+            "ix_events_published_popularity",
+            text("registered_count DESC"),
+            text("id DESC"),
+            postgresql_where=text("status = 'PUBLISHED'")
+        ),
+        Index(
+            "ix_events_pending_created_at",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'")
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<Event(id={self.id}, title={self.title}, status={self.status})>"
     
@@ -126,10 +172,10 @@ class Event(Base):
             "imageUrl": self.image_url,
             "tags": self.tags if self.tags else [],
             "isFeatured": self.is_featured,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
-            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
-            "publishedAt": self.published_at.isoformat() if self.published_at else None,
-            "cancelledAt": self.cancelled_at.isoformat() if self.cancelled_at else None,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
+            "publishedAt": self.published_at,
+            "cancelledAt": self.cancelled_at,
         }
         
         if include_category and self.category:
@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Te
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, gen_random_uuid
 
 
 class ApprovalStatus(str, enum.Enum):
@@ -14,7 +14,7 @@ class ApprovalStatus(str, enum.Enum):
 class OrganizerApprovalRequest(Base):
     __tablename__ = "organizer_approval_requests"
     
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, index=True, server_default=gen_random_uuid())
     
     
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, JSON, ForeignKey, Text
-from sqlalchemy.sql import func
+from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, JSON, ForeignKey, Text, Index
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, gen_random_uuid
 
 
 class CheckInStatus(str, enum.Enum):
@@ -19,7 +19,7 @@ class Registration(Base):
     __tablename__ = "registrations"
     
     
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, index=True, server_default=gen_random_uuid())
     
     
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
@@ -72,9 +72,24 @@ class Registration(Base):
     )
     cancelled_at = Column(DateTime(timezone=True), nullable=True)
     
-    user = relationship("User", backref="registrations")
+    user = relationship("User", back_populates="registrations")
     event = relationship("Event", back_populates="registrations")
     
+    __table_args__ = (
+        # Attendee lists, counts and check-in filters per event
+        Index("ix_registrations_event_id_status", "event_id", "status"),
+        Index("ix_registrations_event_id_check_in_status", "event_id", "check_in_status"),
+        # "Already registered?" and My Registrations lookups
+        Index("ix_registrations_user_id_event_id_status", "user_id", "event_id", "status"),
+        # Reminder job: confirmed registrations still awaiting a reminder
+        Index(
+            "ix_registrations_reminder_pending",
+            "event_id",
+            postgresql_include=["user_id", "id"],
+            postgresql_where=text("reminder_sent = false AND status = 'CONFIRMED'")
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<Registration(id={self.id}, user_id={self.user_id}, event_id={self.event_id}, status={self.status})>"
     
@@ -1,8 +1,9 @@
 from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
-from app.core.database import Base
+from app.core.database import Base, gen_random_uuid
 
 
 class UserRole(str, enum.Enum):
@@ -20,7 +21,7 @@ class User(Base):
     __tablename__ = "users"
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, index=True, server_default=gen_random_uuid())
     
     # Authentication
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -66,6 +67,9 @@ class User(Base):
     )
     last_login = Column(DateTime(timezone=True), nullable=True)
     
+    # Never loaded implicitly; query registrations through RegistrationRepository
+    registrations = relationship("Registration", back_populates="user", lazy="raise")
+    
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
     
@@ -1,12 +1,12 @@
 from sqlalchemy import Column, String, Boolean, DateTime, Integer, JSON
 from sqlalchemy.sql import func
-from app.core.database import Base
+from app.core.database import Base, gen_random_uuid
 
 
 class Venue(Base):
     __tablename__ = "venues"
     
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, index=True, server_default=gen_random_uuid())
     
     name = Column(String(200), nullable=False)
     building = Column(String(200), nullable=False)
@@ -43,7 +43,7 @@ class Venue(Base):
             "capacity": self.capacity,
             "facilities": self.facilities if self.facilities else [],
             "isActive": self.is_active,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
-            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
         }
 
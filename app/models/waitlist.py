@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, DateTime, Integer, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, DateTime, Integer, Enum as SQLEnum, ForeignKey, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
-from app.core.database import Base
+from app.core.database import Base, gen_random_uuid
 
 
 class NotificationPreference(str, enum.Enum):
@@ -14,7 +14,7 @@ class NotificationPreference(str, enum.Enum):
 class WaitlistEntry(Base):
     __tablename__ = "waitlist"
     
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(String(36), primary_key=True, index=True, server_default=gen_random_uuid())
     
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     event_id = Column(String(36), ForeignKey("events.id"), nullable=False, index=True)
@@ -26,8 +26,17 @@ class WaitlistEntry(Base):
         comment="Position in waitlist (lower number = higher priority)"
     )
     
+    # Stored as VARCHAR with a CHECK constraint rather than a native enum
+    # type: no ALTER TYPE on change, and usable in partial index predicates.
     notification_preference = Column(
-        SQLEnum(NotificationPreference),
+        SQLEnum(
+            NotificationPreference,
+            native_enum=False,
+            create_constraint=True,
+            length=8,
+            name="ck_waitlist_notification_preference",
+            values_callable=lambda preferences: [p.value for p in preferences]
+        ),
         nullable=False,
         default=NotificationPreference.EMAIL
     )
@@ -41,6 +50,12 @@ class WaitlistEntry(Base):
     user = relationship("User", backref="waitlist_entries")
     event = relationship("Event", back_populates="waitlist")
     
+    __table_args__ = (
+        # One entry per place in an event's queue; also serves first-in-line
+        # and the position shift UPDATE
+        UniqueConstraint("event_id", "position", name="uq_waitlist_event_id_position"),
+    )
+    
     def __repr__(self) -> str:
         return f"<WaitlistEntry(id={self.id}, user_id={self.user_id}, event_id={self.event_id}, position={self.position})>"
     
@@ -50,7 +65,7 @@ class WaitlistEntry(Base):
             "userId": self.user_id,
             "eventId": self.event_id,
             "position": self.position,
-            "joinedAt": self.joined_at.isoformat() if self.joined_at else None,
+            "joinedAt": self.joined_at,
             "notificationPreference": self.notification_preference.value,
         }
         
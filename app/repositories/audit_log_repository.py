@@ -1,8 +1,111 @@
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Any, Iterator
 from sqlalchemy.orm import Session
-from datetime import datetime, date
+from sqlalchemy.engine import Engine
+from sqlalchemy import func, select, tuple_
+from datetime import datetime, date, timedelta, timezone
+from app.core.config import settings
 from app.models.audit_log import AuditLog, AuditAction, TargetType
-import uuid
+from app.utils.pagination import encode_cursor, decode_cursor
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Trigram index lookups need at least one full trigram; shorter patterns
+# would fall back to scanning the whole table.
+MIN_SEARCH_LENGTH = 3
+
+
+class AuditLogBatcher:
+    """
+    Buffers audit log rows in-process and writes them in batches.
+    
+    Rows are drained by a background thread every flush interval (or as
+    soon as a full batch is queued) and inserted with a single Core
+    executemany, instead of one ORM add/commit/refresh per entry.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, engine: Engine, batch_size: int, flush_interval: float):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="audit-log-batcher",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def enqueue(self, row: Dict[str, Any]) -> None:
+        self._queue.put(row)
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush everything still queued and stop the background thread."""
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+    
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            self._write(batch)
+    
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(AuditLog.__table__.insert(), batch)
+        except Exception:
+            logger.exception(f"Failed to write batch of {len(batch)} audit log entries")
+
+
+_batchers: Dict[Engine, AuditLogBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_audit_log_batcher(engine: Engine) -> AuditLogBatcher:
+    """Get the process-wide batcher for an engine, starting it on first use."""
+    with _batchers_lock:
+        batcher = _batchers.get(engine)
+        if batcher is None:
+            batcher = AuditLogBatcher(
+                engine,
+                batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+                flush_interval=settings.AUDIT_LOG_FLUSH_INTERVAL_MS / 1000
+            )
+            _batchers[engine] = batcher
+        return batcher
+
+
+def shutdown_audit_log_batchers() -> None:
+    """Flush and stop all batchers. Called on application shutdown."""
+    with _batchers_lock:
+        batchers = list(_batchers.values())
+        _batchers.clear()
+    for batcher in batchers:
+        batcher.stop()
 
 
 class AuditLogRepository:
@@ -23,38 +126,140 @@ class AuditLogRepository:
         target_id: Optional[str] = None,
         search: Optional[str] = None,
         page: int = 1,
-        limit: int = 50
-    ) -> Tuple[List[AuditLog], int]:
-        query = self.db.query(AuditLog)
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[int], Optional[str]]:
+        """
+        Get a page of audit logs, newest first, with the total count and
+        a cursor for the next page.
+        
+        With a cursor the total is None: counting from the cursor onward
+        would not be the total for the filters, and page numbers don't
+        apply to keyset pages.
+        """
+        if search and len(search) < MIN_SEARCH_LENGTH:
+            return [], None if cursor else 0, None
+        
+        filters = self._build_audit_filters(
+            action, start_date, end_date, actor_id, target_type, target_id, search
+        )
+        
+        if cursor:
+            # Keyset pagination: seek past the last row of the previous page
+            # instead of scanning and discarding OFFSET rows.
+            last_timestamp, last_id = decode_cursor(cursor, 2)
+            query = self.db.query(AuditLog).filter(
+                *filters,
+                tuple_(AuditLog.timestamp, AuditLog.id)
+                < tuple_(datetime.fromisoformat(last_timestamp), last_id)
+            )
+            logs = query.order_by(
+                AuditLog.timestamp.desc(), AuditLog.id.desc()
+            ).limit(limit).all()
+            total_count = None
+        else:
+            # Total row count rides along as a window column so the page and
+            # the count come back in a single round-trip.
+            query = self.db.query(AuditLog, func.count().over().label("total_count")).filter(*filters)
+            rows = query.order_by(
+                AuditLog.timestamp.desc(), AuditLog.id.desc()
+            ).offset((page - 1) * limit).limit(limit).all()
+            
+            if rows:
+                total_count = rows[0].total_count
+            elif page > 1:
+                # Past the last page the window has no rows to report on
+                total_count = self._count(*filters)
+            else:
+                total_count = 0
+            
+            logs = [row.AuditLog for row in rows]
+        
+        next_cursor = None
+        if len(logs) == limit:
+            next_cursor = encode_cursor(logs[-1].timestamp, logs[-1].id)
+        
+        return logs, total_count, next_cursor
+    
+    def iter_all(
+        self,
+        action: Optional[AuditAction] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        actor_id: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: int = 500
+    ) -> Iterator[AuditLog]:
+        """
+        Stream audit logs newest first, for exports.
+        
+        Rows are fetched `batch` at a time and expunged once the caller moves
+        on, so memory stays bounded however many entries match.
+        """
+        if search and len(search) < MIN_SEARCH_LENGTH:
+            return iter(())
+        
+        stmt = select(AuditLog).where(
+            *self._build_audit_filters(action, start_date, end_date, actor_id, None, None, search)
+        ).order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).limit(limit)
+        
+        return self._stream(stmt, batch)
+    
+    def iter_by_actor(self, actor_id: str, batch: int = 500) -> Iterator[AuditLog]:
+        """Stream all audit logs for an actor, newest first."""
+        stmt = select(AuditLog).where(
+            AuditLog.actor_id == actor_id
+        ).order_by(AuditLog.timestamp.desc())
+        
+        return self._stream(stmt, batch)
+    
+    def _stream(self, stmt, batch: int) -> Iterator[AuditLog]:
+        result = self.db.execute(stmt.execution_options(yield_per=batch))
+        try:
+            for log in result.scalars():
+                yield log
+                self.db.expunge(log)
+        finally:
+            result.close()
+    
+    @staticmethod
+    def _build_audit_filters(
+        action: Optional[AuditAction] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        actor_id: Optional[str] = None,
+        target_type: Optional[TargetType] = None,
+        target_id: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> List:
+        criteria = []
         
         if action:
-            query = query.filter(AuditLog.action == action)
+            criteria.append(AuditLog.action == action)
         
+        # Half-open [start_date, end_date + 1 day) range on the index
         if start_date:
-            query = query.filter(AuditLog.timestamp >= datetime.combine(start_date, datetime.min.time()))
+            criteria.append(AuditLog.timestamp >= start_date)
         
         if end_date:
-            query = query.filter(AuditLog.timestamp <= datetime.combine(end_date, datetime.max.time()))
+            criteria.append(AuditLog.timestamp < end_date + timedelta(days=1))
         
         if actor_id:
-            query = query.filter(AuditLog.actor_id == actor_id)
+            criteria.append(AuditLog.actor_id == actor_id)
         
         if target_type:
-            query = query.filter(AuditLog.target_type == target_type)
+            criteria.append(AuditLog.target_type == target_type)
         
         if target_id:
-            query = query.filter(AuditLog.target_id == target_id)
+            criteria.append(AuditLog.target_id == target_id)
         
         if search:
+            # Served by the ix_audit_logs_details_trgm GIN index on Postgres
             search_pattern = f"%{search}%"
-            query = query.filter(AuditLog.details.ilike(search_pattern))
+            criteria.append(AuditLog.details.ilike(search_pattern))
         
-        total_count = query.count()
-        
-        offset = (page - 1) * limit
-        logs = query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit).all()
-        
-        return logs, total_count
+        return criteria
     
     def create(
         self,
@@ -68,26 +273,45 @@ class AuditLogRepository:
         details: Optional[str] = None,
         metadata: Optional[dict] = None,
         ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        commit: bool = True
     ) -> AuditLog:
-        log_id = str(uuid.uuid4())
-        
-        log = AuditLog(
-            id=log_id,
-            action=action,
-            actor_id=actor_id,
-            actor_name=actor_name,
-            actor_role=actor_role,
-            target_type=target_type,
-            target_id=target_id,
-            target_name=target_name,
-            details=details,
-            extra_metadata=metadata,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
+        """
+        Record an audit entry.
+        
+        With commit=False the entry is only added to the session and is
+        written by the caller's commit, together with the change it
+        records. Otherwise it is committed right away, or, if
+        AUDIT_LOG_BATCHING is on, queued for the background batcher: the
+        returned instance is then transient, its id is None, and the row
+        is written outside the caller's transaction.
+        """
+        row = {
+            "timestamp": datetime.now(timezone.utc),
+            "action": action,
+            "actor_id": actor_id,
+            "actor_name": actor_name,
+            "actor_role": actor_role,
+            "target_type": target_type,
+            "target_id": target_id,
+            "target_name": target_name,
+            "details": details,
+            "extra_metadata": metadata,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
+        
+        if commit and settings.AUDIT_LOG_BATCHING:
+            # Hand the row to the batcher rather than paying a round-trip
+            # per entry. The id is assigned by the database on insert.
+            get_audit_log_batcher(self.db.get_bind()).enqueue(row)
+            return AuditLog(**row)
+        
+        log = AuditLog(**row)
         
         self.db.add(log)
+        if not commit:
+            return log
         self.db.commit()
         self.db.refresh(log)
         return log
@@ -125,12 +349,16 @@ class AuditLogRepository:
         actor_id: str,
         since: datetime = None
     ) -> int:
-        query = self.db.query(AuditLog).filter(
-            AuditLog.action == action,
-            AuditLog.actor_id == actor_id
-        )
+        filters = [AuditLog.action == action, AuditLog.actor_id == actor_id]
 
         if since:
-            query = query.filter(AuditLog.timestamp >= since)
+            filters.append(AuditLog.timestamp >= since)
+
+        return self._count(*filters)
 
-        return query.count()
+    def _count(self, *filters) -> int:
+        # Plain SELECT count(*) ... WHERE, rather than Query.count()'s
+        # subquery over every column, so Postgres can answer from an index.
+        return self.db.execute(
+            select(func.count()).select_from(AuditLog).where(*filters)
+        ).scalar_one()
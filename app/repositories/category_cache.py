@@ -0,0 +1,105 @@
+"""
+In-process caches for categories.
+
+Categories are a small, rarely changing table, so slug lookups and the
+active category list are served from module-level snapshots. Both are
+cleared whenever a Category row is inserted, updated or deleted in this
+process, and expire after CATEGORY_CACHE_TTL_SECONDS so changes made by
+other workers are picked up.
+"""
+from typing import Optional, List, Dict, NamedTuple
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.category import Category
+import threading
+import time
+
+
+class CategoryDTO(NamedTuple):
+    """Detached category fields needed for slug resolution."""
+    id: str
+    name: str
+    slug: str
+    color: str
+    is_active: bool
+
+
+_lock = threading.Lock()
+_by_slug: Optional[Dict[str, CategoryDTO]] = None
+_by_slug_expires_at = 0.0
+_active_list: Optional[List[dict]] = None
+_active_list_expires_at = 0.0
+
+
+def get(db: Session, slug: str) -> Optional[CategoryDTO]:
+    """
+    Resolve a category slug, loading the slug map on first use.
+
+    Args:
+        db: Session used only when the map needs (re)loading
+        slug: Category slug
+
+    Returns:
+        Optional[CategoryDTO]: Category fields if the slug exists, None otherwise
+    """
+    with _lock:
+        by_slug = _by_slug if _by_slug_expires_at > time.monotonic() else None
+
+    if by_slug is None:
+        by_slug = _load_slug_map(db)
+
+    return by_slug.get(slug)
+
+
+def warm(db: Session) -> None:
+    """Load the slug map ahead of the first category-filtered request."""
+    _load_slug_map(db)
+
+
+def _load_slug_map(db: Session) -> Dict[str, CategoryDTO]:
+    global _by_slug, _by_slug_expires_at
+
+    rows = db.execute(
+        select(Category.id, Category.name, Category.slug, Category.color, Category.is_active)
+    ).all()
+    by_slug = {row.slug: CategoryDTO(*row) for row in rows}
+
+    with _lock:
+        _by_slug = by_slug
+        _by_slug_expires_at = time.monotonic() + settings.CATEGORY_CACHE_TTL_SECONDS
+
+    return by_slug
+
+
+def get_active_list() -> Optional[List[dict]]:
+    """Get a copy of the cached active category list, or None on a miss."""
+    with _lock:
+        if _active_list is None or _active_list_expires_at <= time.monotonic():
+            return None
+        return [dict(category) for category in _active_list]
+
+
+def set_active_list(categories: List[dict]) -> None:
+    """Cache the active category list (Category.to_dict() dicts)."""
+    global _active_list, _active_list_expires_at
+
+    with _lock:
+        _active_list = [dict(category) for category in categories]
+        _active_list_expires_at = time.monotonic() + settings.CATEGORY_CACHE_TTL_SECONDS
+
+
+def clear_category_cache() -> None:
+    """Drop all cached category data so the next read goes to the database."""
+    global _by_slug, _active_list
+
+    with _lock:
+        _by_slug = None
+        _active_list = None
+
+
+@event.listens_for(Category, "after_insert")
+@event.listens_for(Category, "after_update")
+@event.listens_for(Category, "after_delete")
+def _invalidate(mapper, connection, target) -> None:
+    clear_category_cache()
@@ -1,8 +1,11 @@
 from typing import Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, not_, select, lambda_stmt
+from app.core.database import update_returning
 from app.models.category import Category
-import uuid
+from app.repositories import category_cache
+from app.repositories.category_cache import CategoryDTO, clear_category_cache
 
 
 class CategoryRepository:
@@ -11,16 +14,42 @@ class CategoryRepository:
         self.db = db
     
     def get_by_id(self, category_id: str) -> Optional[Category]:
-        return self.db.query(Category).filter(Category.id == category_id).first()
+        stmt = lambda_stmt(lambda: select(Category))
+        stmt += lambda s: s.where(Category.id == category_id)
+        return self.db.execute(stmt).scalar_one_or_none()
     
-    def get_by_slug(self, slug: str) -> Optional[Category]:
-        return self.db.query(Category).filter(Category.slug == slug).first()
+    def get_is_active(self, category_id: str) -> Optional[bool]:
+        """Get a category's is_active flag, or None if it doesn't exist."""
+        stmt = lambda_stmt(lambda: select(Category.is_active))
+        stmt += lambda s: s.where(Category.id == category_id)
+        return self.db.execute(stmt).scalar_one_or_none()
     
-    def get_all(self, active_only: bool = True) -> List[Category]:
+    def get_by_slug(self, slug: str) -> Optional[CategoryDTO]:
+        """Resolve a slug from the in-process slug map (see category_cache)."""
+        return category_cache.get(self.db, slug)
+    
+    def get_all(self, active_only: bool = True) -> List[dict]:
+        """
+        Get categories as dictionaries (see Category.to_dict), ordered by name.
+        
+        The active list is served from an in-process cache for
+        CATEGORY_CACHE_TTL_SECONDS; the admin list including inactive
+        categories always reads from the database.
+        """
+        if active_only:
+            cached = category_cache.get_active_list()
+            if cached is not None:
+                return cached
+        
         query = self.db.query(Category)
         if active_only:
             query = query.filter(Category.is_active == True)
-        return query.order_by(Category.name).all()
+        categories = [category.to_dict() for category in query.order_by(Category.name).all()]
+        
+        if active_only:
+            category_cache.set_active_list(categories)
+        
+        return categories
     
     def create(
         self,
@@ -30,10 +59,7 @@ class CategoryRepository:
         description: Optional[str] = None,
         icon: Optional[str] = None
     ) -> Category:
-        category_id = str(uuid.uuid4())
-        
         category = Category(
-            id=category_id,
             name=name,
             slug=slug,
             color=color,
@@ -46,6 +72,7 @@ class CategoryRepository:
             self.db.add(category)
             self.db.commit()
             self.db.refresh(category)
+            clear_category_cache()
             return category
         except IntegrityError:
             self.db.rollback()
@@ -58,15 +85,17 @@ class CategoryRepository:
         
         self.db.commit()
         self.db.refresh(category)
+        clear_category_cache()
         return category
     
     def toggle_active(self, category: Category) -> Category:
-        category.is_active = not category.is_active
-        self.db.commit()
-        self.db.refresh(category)
+        category = update_returning(self.db, category, is_active=not_(Category.is_active))
+        clear_category_cache()
         return category
     
     def count_events_using_category(self, category_id: str) -> int:
         from app.models.event import Event
-        return self.db.query(Event).filter(Event.category_id == category_id).count()
+        stmt = lambda_stmt(lambda: select(func.count(Event.id)))
+        stmt += lambda s: s.where(Event.category_id == category_id)
+        return self.db.execute(stmt).scalar_one()
 
@@ -0,0 +1,43 @@
+"""
+In-process cache for published-event totals.
+
+The events list no longer counts matching rows on every page, so clients
+that still show page totals ask /api/events/count instead. Totals are
+cached per filter set for EVENT_COUNT_CACHE_TTL_SECONDS; a count that is
+a few seconds stale is fine for a page indicator, so writes don't clear
+it.
+"""
+from typing import Hashable, Optional, Dict, Tuple
+from app.core.config import settings
+import threading
+import time
+
+
+# Distinct filter sets kept at once; the oldest entry is dropped past this
+_MAX_ENTRIES = 256
+
+_lock = threading.Lock()
+_counts: Dict[Hashable, Tuple[int, float]] = {}
+
+
+def get_count(key: Hashable) -> Optional[int]:
+    """Get the cached total for a filter set, or None on a miss."""
+    with _lock:
+        entry = _counts.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+
+def set_count(key: Hashable, count: int) -> None:
+    """Cache the total for a filter set."""
+    with _lock:
+        if key not in _counts and len(_counts) >= _MAX_ENTRIES:
+            _counts.pop(next(iter(_counts)))
+        _counts[key] = (count, time.monotonic() + settings.EVENT_COUNT_CACHE_TTL_SECONDS)
+
+
+def clear_event_count_cache() -> None:
+    """Drop every cached total."""
+    with _lock:
+        _counts.clear()
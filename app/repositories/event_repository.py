@@ -1,12 +1,48 @@
 from typing import Optional, List, Tuple
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import or_, and_, func
-from datetime import date, datetime
+from sqlalchemy import or_, and_, case, func, insert, literal, select, tuple_, exists
+from datetime import date, datetime, time
+from app.core.database import strict_loading, update_returning, commit_preserving
 from app.models.event import Event, EventStatus
-import uuid
+from app.models.category import Category
+from app.models.user import User
+from app.models.registration import Registration, RegistrationStatus
+from app.repositories import event_count_cache, organizer_stats_cache
+from app.utils.pagination import encode_cursor, decode_cursor
 
 
+# Columns of a published-events list row (see get_all_published), built
+# once instead of on every page request
+_LIST_COLUMNS = (
+    Event.id,
+    Event.title,
+    Event.description,
+    Event.date,
+    Event.start_time,
+    Event.end_time,
+    Event.venue,
+    Event.location,
+    Event.capacity,
+    Event.registered_count,
+    Event.waitlist_count,
+    Event.status,
+    Event.image_url,
+    Event.tags,
+    Event.is_featured,
+    Event.created_at,
+    Event.published_at,
+    Category.id.label("category_id"),
+    Category.name.label("category_name"),
+    Category.slug.label("category_slug"),
+    Category.color.label("category_color"),
+    User.id.label("organizer_id"),
+    User.name.label("organizer_name"),
+    User.email.label("organizer_email"),
+    User.department.label("organizer_department"),
+)
+
 class EventRepository:
     
     def __init__(self, db: Session):
@@ -21,6 +57,23 @@ class EventRepository:
             )
         return query.first()
     
+    def get_by_id_for_update(self, event_id: str) -> Optional[Event]:
+        """
+        Get an event and lock its row until the transaction ends, so a
+        capacity check and the counter update that follows can't interleave
+        with another registration's.
+        """
+        return self.db.query(Event).filter(Event.id == event_id).with_for_update().first()
+    
+    def get_published_updated_at(self, event_id: str) -> Optional[datetime]:
+        """Get a published event's updated_at without loading the row, or None."""
+        return self.db.execute(
+            select(Event.updated_at).where(
+                Event.id == event_id,
+                Event.status == EventStatus.PUBLISHED
+            )
+        ).scalar_one_or_none()
+    
     def get_all_published(
         self,
         search: Optional[str] = None,
@@ -31,13 +84,125 @@ class EventRepository:
         availability: Optional[bool] = None,
         sort_by: str = "date",
         page: int = 1,
-        limit: int = 20
-    ) -> Tuple[List[Event], int]:
-        query = self.db.query(Event).filter(Event.status == EventStatus.PUBLISHED)
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        exclude_user_id: Optional[str] = None
+    ) -> Tuple[List[RowMapping], Optional[str], bool]:
+        """
+        Get one page of published events as (rows, next_cursor, has_more).
+        
+        Rows are flat mappings of the list columns plus category_* and
+        organizer_* fields; no ORM objects are built. No total is computed;
+        one extra row is fetched to tell whether another page exists. Use
+        count_published for totals. With exclude_user_id, events that user
+        holds a confirmed registration for are left out.
+        """
+        criteria = self._published_criteria(
+            search=search,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            organizer_id=organizer_id,
+            availability=availability
+        )
+        
+        if exclude_user_id:
+            # Semi-join on ix_registrations_user_id_event_id_status, so pages
+            # stay full instead of being filtered after the LIMIT
+            criteria.append(
+                ~exists().where(
+                    Registration.event_id == Event.id,
+                    Registration.user_id == exclude_user_id,
+                    Registration.status == RegistrationStatus.CONFIRMED
+                )
+            )
+        
+        # Every ordering ends in Event.id so rows are totally ordered and can
+        # be paged by keyset
+        if sort_by == "title":
+            order_by = (Event.title, Event.id)
+        elif sort_by == "popularity":
+            order_by = (Event.registered_count.desc(), Event.id.desc())
+        else:  
+            order_by = (Event.date, Event.start_time, Event.id)
+        
+        offset = None
+        if cursor:
+            # Keyset pagination: seek past the last row of the previous page
+            # instead of scanning and discarding OFFSET rows.
+            criteria.append(self._after_cursor(sort_by, cursor))
+        else:
+            offset = (page - 1) * limit
+        
+        # Deferred join: filter, sort and limit over ids only (the sort
+        # indexes carry every key), then fetch full rows for just this page,
+        # so skipped and filtered rows never pull description/tags off the heap.
+        page_ids = select(Event.id).where(*criteria).order_by(
+            *order_by
+        ).offset(offset).limit(limit + 1).subquery()
+        
+        # Category and organizer are joined in for the page's rows only
+        stmt = select(*_LIST_COLUMNS).join_from(
+            Event, page_ids, Event.id == page_ids.c.id
+        ).outerjoin(
+            Category, Category.id == Event.category_id
+        ).outerjoin(
+            User, User.id == Event.organizer_id
+        ).order_by(*order_by)
+        
+        events = self.db.execute(stmt).mappings().all()
+        has_more = len(events) > limit
+        events = events[:limit]
+        
+        next_cursor = None
+        if has_more:
+            next_cursor = self._page_cursor(sort_by, events[-1])
+        
+        return events, next_cursor, has_more
+    
+    def count_published(
+        self,
+        search: Optional[str] = None,
+        category_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        organizer_id: Optional[str] = None,
+        availability: Optional[bool] = None
+    ) -> int:
+        """Count published events matching the list filters (briefly cached)."""
+        key = (search, category_id, start_date, end_date, organizer_id, availability)
+        cached = event_count_cache.get_count(key)
+        if cached is not None:
+            return cached
+        
+        criteria = self._published_criteria(
+            search=search,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            organizer_id=organizer_id,
+            availability=availability
+        )
+        count = self.db.execute(
+            select(func.count()).select_from(Event).where(*criteria)
+        ).scalar_one()
+        event_count_cache.set_count(key, count)
+        return count
+    
+    @staticmethod
+    def _published_criteria(
+        search: Optional[str] = None,
+        category_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        organizer_id: Optional[str] = None,
+        availability: Optional[bool] = None
+    ) -> list:
+        criteria = [Event.status == EventStatus.PUBLISHED]
         
         if search:
             search_pattern = f"%{search}%"
-            query = query.filter(
+            criteria.append(
                 or_(
                     Event.title.ilike(search_pattern),
                     Event.description.ilike(search_pattern),
@@ -47,37 +212,58 @@ class EventRepository:
             )
         
         if category_id:
-            query = query.filter(Event.category_id == category_id)
+            criteria.append(Event.category_id == category_id)
         
         if start_date:
-            query = query.filter(Event.date >= start_date)
+            criteria.append(Event.date >= start_date)
         
         if end_date:
-            query = query.filter(Event.date <= end_date)
+            criteria.append(Event.date <= end_date)
         
         if organizer_id:
-            query = query.filter(Event.organizer_id == organizer_id)
+            criteria.append(Event.organizer_id == organizer_id)
         
         if availability:
-            query = query.filter(Event.registered_count < Event.capacity)
-        
-        total_count = query.count()
+            criteria.append(Event.registered_count < Event.capacity)
         
+        return criteria
+    
+    # Cursors lead with the sort option so a cursor from one ordering is
+    # rejected by another instead of seeking to the wrong place.
+    @staticmethod
+    def _page_cursor(sort_by: str, row: RowMapping) -> str:
+        if sort_by == "title":
+            # Title goes last: decode_cursor leaves separators in the final value
+            return encode_cursor(sort_by, row["id"], row["title"])
+        if sort_by == "popularity":
+            return encode_cursor(sort_by, row["registered_count"], row["id"])
+        return encode_cursor(sort_by, row["date"], row["start_time"], row["id"])
+    
+    @staticmethod
+    def _after_cursor(sort_by: str, cursor: str):
         if sort_by == "title":
-            query = query.order_by(Event.title)
+            cursor_sort, last_id, last_title = decode_cursor(cursor, 3)
+            criterion = tuple_(Event.title, Event.id) > tuple_(last_title, last_id)
         elif sort_by == "popularity":
-            query = query.order_by(Event.registered_count.desc())
-        else:  
-            query = query.order_by(Event.date, Event.start_time)
-        
-        offset = (page - 1) * limit
-        query = query.options(
-            joinedload(Event.category),
-            joinedload(Event.organizer)
-        ).offset(offset).limit(limit)
+            cursor_sort, last_count, last_id = decode_cursor(cursor, 3)
+            criterion = (
+                tuple_(Event.registered_count, Event.id)
+                < tuple_(int(last_count), last_id)
+            )
+        else:
+            cursor_sort, last_date, last_start_time, last_id = decode_cursor(cursor, 4)
+            criterion = (
+                tuple_(Event.date, Event.start_time, Event.id)
+                > tuple_(
+                    date.fromisoformat(last_date),
+                    time.fromisoformat(last_start_time),
+                    last_id
+                )
+            )
         
-        events = query.all()
-        return events, total_count
+        if cursor_sort != sort_by:
+            raise ValueError("Invalid pagination cursor")
+        return criterion
     
     def get_by_organizer(
         self,
@@ -89,7 +275,11 @@ class EventRepository:
         if status:
             query = query.filter(Event.status == status)
         
-        return query.options(joinedload(Event.category)).order_by(Event.date.desc()).all()
+        return query.options(
+            joinedload(Event.category),
+            joinedload(Event.organizer),
+            *strict_loading()
+        ).order_by(Event.date.desc()).all()
     
     def create(
         self,
@@ -109,13 +299,10 @@ class EventRepository:
     ) -> Event:
         from datetime import time
         
-        event_id = str(uuid.uuid4())
-        
         start_hour, start_minute = map(int, start_time.split(':'))
         end_hour, end_minute = map(int, end_time.split(':'))
         
         event = Event(
-            id=event_id,
             title=title,
             description=description,
             category_id=category_id,
@@ -137,102 +324,170 @@ class EventRepository:
         try:
             self.db.add(event)
             self.db.commit()
+            organizer_stats_cache.invalidate(organizer_id)
             self.db.refresh(event)
             return event
         except IntegrityError:
             self.db.rollback()
             raise
     
-    def update(self, event: Event, **kwargs) -> Event:
+    def duplicate(self, event: Event, organizer_id: str, title_suffix: str = " (Copy)") -> Event:
+        """
+        Copy an event as a new draft owned by organizer_id, in a single
+        INSERT ... SELECT ... RETURNING; the source row never round-trips
+        through Python. Counters start at zero and the copy is unfeatured.
+        """
+        copied = (
+            Event.title + title_suffix,
+            Event.description,
+            Event.category_id,
+            literal(organizer_id),
+            Event.date,
+            Event.start_time,
+            Event.end_time,
+            Event.venue,
+            Event.location,
+            Event.capacity,
+            literal(0),
+            literal(0),
+            literal(EventStatus.DRAFT, Event.status.type),
+            Event.image_url,
+            Event.tags,
+            literal(False)
+        )
+        columns = (
+            "title", "description", "category_id", "organizer_id", "date",
+            "start_time", "end_time", "venue", "location", "capacity",
+            "registered_count", "waitlist_count", "status", "image_url",
+            "tags", "is_featured"
+        )
+        stmt = insert(Event).from_select(
+            columns,
+            select(*copied).where(Event.id == event.id)
+        ).returning(Event)
+        
+        new_event = self.db.scalars(stmt).one()
+        commit_preserving(self.db, new_event, event)
+        organizer_stats_cache.invalidate(organizer_id)
+        return new_event
+    
+    def update(self, event: Event, **kwargs) -> Optional[Event]:
+        """
+        Update an event's editable fields in one UPDATE ... RETURNING.
+        
+        A new capacity is only written if it still covers registered_count
+        at the moment of the UPDATE; otherwise nothing changes and None is
+        returned, so a concurrent registration can't slip past the check.
+        """
         from datetime import time
         
+        values = {}
         for key, value in kwargs.items():
             if hasattr(event, key) and key not in ['id', 'registered_count', 'waitlist_count']:
                 # Parse time strings if updating times
                 if key in ['start_time', 'end_time'] and isinstance(value, str):
                     hour, minute = map(int, value.split(':'))
                     value = time(hour, minute)
-                setattr(event, key, value)
+                values[key] = value
+        
+        where = ()
+        if 'capacity' in values:
+            where = (Event.registered_count <= values['capacity'],)
         
-        self.db.commit()
-        self.db.refresh(event)
+        organizer_id = event.organizer_id
+        event = update_returning(self.db, event, where=where, **values)
+        if event is not None:
+            organizer_stats_cache.invalidate(organizer_id)
         return event
     
     def publish(self, event: Event) -> Event:
-        event.status = EventStatus.PUBLISHED
-        event.published_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(event)
+        organizer_id = event.organizer_id
+        event = update_returning(
+            self.db,
+            event,
+            status=EventStatus.PUBLISHED,
+            published_at=func.now()
+        )
+        organizer_stats_cache.invalidate(organizer_id)
         return event
     
     def cancel(self, event: Event) -> Event:
-        event.status = EventStatus.CANCELLED
-        event.cancelled_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(event)
+        organizer_id = event.organizer_id
+        event = update_returning(
+            self.db,
+            event,
+            status=EventStatus.CANCELLED,
+            cancelled_at=func.now()
+        )
+        organizer_stats_cache.invalidate(organizer_id)
         return event
     
-    def increment_registered_count(self, event: Event, count: int = 1) -> Event:
-        event.registered_count += count
-        self.db.commit()
-        self.db.refresh(event)
+    # Counter updates are single atomic UPDATEs so concurrent registrations
+    # can't lose increments; the committed event is expired and reloads lazily.
+    # With commit=False the caller finishes the transaction (see
+    # commit_preserving), e.g. to keep a row lock across check and update.
+    def _adjust_counter(self, event: Event, column, delta: int, commit: bool = True) -> Event:
+        if delta >= 0:
+            new_value = column + delta
+        else:
+            new_value = case((column > -delta, column + delta), else_=0)
+        
+        self.db.query(Event).filter(Event.id == event.id).update(
+            {column: new_value},
+            synchronize_session="fetch"
+        )
+        if commit:
+            self.db.commit()
         return event
     
-    def decrement_registered_count(self, event: Event, count: int = 1) -> Event:
-        event.registered_count = max(0, event.registered_count - count)
-        self.db.commit()
-        self.db.refresh(event)
-        return event
+    def increment_registered_count(self, event: Event, count: int = 1, commit: bool = True) -> Event:
+        return self._adjust_counter(event, Event.registered_count, count, commit)
+    
+    def decrement_registered_count(self, event: Event, count: int = 1, commit: bool = True) -> Event:
+        return self._adjust_counter(event, Event.registered_count, -count, commit)
     
     def increment_waitlist_count(self, event: Event, count: int = 1) -> Event:
-        event.waitlist_count += count
-        self.db.commit()
-        self.db.refresh(event)
-        return event
+        return self._adjust_counter(event, Event.waitlist_count, count)
     
     def decrement_waitlist_count(self, event: Event, count: int = 1) -> Event:
-        event.waitlist_count = max(0, event.waitlist_count - count)
-        self.db.commit()
-        self.db.refresh(event)
-        return event
+        return self._adjust_counter(event, Event.waitlist_count, -count)
     
     def get_pending_events(self) -> List[Event]:
         return self.db.query(Event).filter(
             Event.status == EventStatus.PENDING
         ).options(
             joinedload(Event.category),
-            joinedload(Event.organizer)
+            joinedload(Event.organizer),
+            *strict_loading()
         ).order_by(Event.created_at).all()
     
     def get_organizer_statistics(self, organizer_id: str) -> dict:
-        from sqlalchemy import func
-        
-        total = self.db.query(func.count(Event.id)).filter(
-            Event.organizer_id == organizer_id
-        ).scalar()
+        cached = organizer_stats_cache.get_stats(organizer_id)
+        if cached is not None:
+            return cached
         
-        by_status = self.db.query(
-            Event.status, func.count(Event.id)
+        # One pass over the organizer's events: per-status counts plus the
+        # upcoming and registration totals, rolled up in Python.
+        rows = self.db.query(
+            Event.status,
+            func.count(Event.id),
+            func.count(Event.id).filter(
+                Event.status == EventStatus.PUBLISHED,
+                Event.date >= date.today()
+            ),
+            func.coalesce(func.sum(Event.registered_count), 0)
         ).filter(
             Event.organizer_id == organizer_id
         ).group_by(Event.status).all()
         
-        upcoming = self.db.query(func.count(Event.id)).filter(
-            Event.organizer_id == organizer_id,
-            Event.status == EventStatus.PUBLISHED,
-            Event.date >= date.today()
-        ).scalar()
-        
-        total_registrations = self.db.query(func.sum(Event.registered_count)).filter(
-            Event.organizer_id == organizer_id
-        ).scalar() or 0
-        
-        return {
-            "total": total,
-            "upcoming": upcoming,
-            "total_registrations": total_registrations,
-            "by_status": {status.value: count for status, count in by_status}
+        stats = {
+            "total": sum(row[1] for row in rows),
+            "upcoming": sum(row[2] for row in rows),
+            "total_registrations": sum(row[3] for row in rows),
+            "by_status": {row[0].value: row[1] for row in rows}
         }
+        organizer_stats_cache.set_stats(organizer_id, stats)
+        return stats
 
     def check_venue_conflict(
         self,
@@ -255,18 +510,19 @@ class EventRepository:
         Returns:
             Optional[Event]: Conflicting event if found, None otherwise
         """
-        from datetime import time
-
-        # Parse times
         start = time.fromisoformat(start_time)
         end = time.fromisoformat(end_time)
 
-        # Build query for events at same venue on same date
+        # Same venue, same date, pending or published, and overlapping in
+        # time: new_start < existing_end AND new_end > existing_start. The
+        # status predicate matches ix_events_venue_booked literally.
         query = self.db.query(Event).filter(
             and_(
                 Event.venue == venue,
                 Event.date == event_date,
-                Event.status.in_([EventStatus.PENDING, EventStatus.PUBLISHED])  # Only check non-cancelled events
+                Event.start_time < end,
+                Event.end_time > start,
+                Event.status.in_([EventStatus.PENDING, EventStatus.PUBLISHED])
             )
         )
 
@@ -274,18 +530,4 @@ class EventRepository:
         if exclude_event_id:
             query = query.filter(Event.id != exclude_event_id)
 
-        # Get all events at this venue on this date
-        events = query.all()
-
-        # Check for time overlap
-        for existing_event in events:
-            existing_start = existing_event.start_time
-            existing_end = existing_event.end_time
-
-            # Check if times overlap
-            # Overlap occurs if: new_start < existing_end AND new_end > existing_start
-            if start < existing_end and end > existing_start:
-                return existing_event
-
-        return None
-
+        return query.first()
@@ -1,9 +1,9 @@
 from typing import Optional, List
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime
+from sqlalchemy import func, select
+from app.core.database import strict_loading, insert_returning, update_returning
 from app.models.organizer_approval import OrganizerApprovalRequest, ApprovalStatus
-import uuid
 
 
 class OrganizerApprovalRepository:
@@ -34,27 +34,24 @@ class OrganizerApprovalRepository:
             query = query.filter(OrganizerApprovalRequest.status == status)
         
         return query.options(
-            joinedload(OrganizerApprovalRequest.user)
+            joinedload(OrganizerApprovalRequest.user),
+            joinedload(OrganizerApprovalRequest.reviewer),
+            *strict_loading()
         ).order_by(OrganizerApprovalRequest.requested_at).all()
     
     def get_pending(self) -> List[OrganizerApprovalRequest]:
         return self.get_all(status=ApprovalStatus.PENDING)
     
-    def create(self, user_id: str, reason: str) -> OrganizerApprovalRequest:
-        request_id = str(uuid.uuid4())
-        
-        request = OrganizerApprovalRequest(
-            id=request_id,
-            user_id=user_id,
-            reason=reason,
-            status=ApprovalStatus.PENDING
-        )
-        
+    def create(self, user_id: str, reason: str, commit: bool = True) -> OrganizerApprovalRequest:
         try:
-            self.db.add(request)
-            self.db.commit()
-            self.db.refresh(request)
-            return request
+            return insert_returning(
+                self.db,
+                OrganizerApprovalRequest,
+                commit=commit,
+                user_id=user_id,
+                reason=reason,
+                status=ApprovalStatus.PENDING
+            )
         except IntegrityError:
             self.db.rollback()
             raise
@@ -65,14 +62,14 @@ class OrganizerApprovalRepository:
         reviewer_id: str,
         notes: Optional[str] = None
     ) -> OrganizerApprovalRequest:
-        request.status = ApprovalStatus.APPROVED
-        request.reviewed_by = reviewer_id
-        request.reviewed_at = datetime.utcnow()
-        request.notes = notes
-        
-        self.db.commit()
-        self.db.refresh(request)
-        return request
+        return update_returning(
+            self.db,
+            request,
+            status=ApprovalStatus.APPROVED,
+            reviewed_by=reviewer_id,
+            reviewed_at=func.now(),
+            notes=notes
+        )
     
     def reject(
         self,
@@ -80,17 +77,19 @@ class OrganizerApprovalRepository:
         reviewer_id: str,
         notes: str
     ) -> OrganizerApprovalRequest:
-        request.status = ApprovalStatus.REJECTED
-        request.reviewed_by = reviewer_id
-        request.reviewed_at = datetime.utcnow()
-        request.notes = notes
-        
-        self.db.commit()
-        self.db.refresh(request)
-        return request
+        return update_returning(
+            self.db,
+            request,
+            status=ApprovalStatus.REJECTED,
+            reviewed_by=reviewer_id,
+            reviewed_at=func.now(),
+            notes=notes
+        )
     
     def count_pending(self) -> int:
-        return self.db.query(OrganizerApprovalRequest).filter(
-            OrganizerApprovalRequest.status == ApprovalStatus.PENDING
-        ).count()
+        return self.db.execute(
+            select(func.count()).select_from(OrganizerApprovalRequest).where(
+                OrganizerApprovalRequest.status == ApprovalStatus.PENDING
+            )
+        ).scalar_one()
 
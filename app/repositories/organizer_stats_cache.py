@@ -0,0 +1,50 @@
+"""
+In-process cache for organizer dashboard statistics.
+
+The organizer events list and statistics pages both aggregate the
+organizer's events on every load. The result is cached per organizer for
+ORGANIZER_STATS_CACHE_TTL_SECONDS and dropped whenever EventRepository
+creates, updates, publishes or cancels one of their events in this
+process. Registration counter changes are left to the TTL, so
+total_registrations may briefly lag.
+"""
+from typing import Optional, Dict, Tuple
+from app.core.config import settings
+import threading
+import time
+
+
+# Organizers kept at once; the oldest entry is dropped past this
+_MAX_ENTRIES = 10_000
+
+_lock = threading.Lock()
+_stats: Dict[str, Tuple[dict, float]] = {}
+
+
+def get_stats(organizer_id: str) -> Optional[dict]:
+    """Get an organizer's cached statistics, or None on a miss."""
+    with _lock:
+        entry = _stats.get(organizer_id)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+
+def set_stats(organizer_id: str, stats: dict) -> None:
+    """Cache an organizer's statistics."""
+    with _lock:
+        if organizer_id not in _stats and len(_stats) >= _MAX_ENTRIES:
+            _stats.pop(next(iter(_stats)))
+        _stats[organizer_id] = (stats, time.monotonic() + settings.ORGANIZER_STATS_CACHE_TTL_SECONDS)
+
+
+def invalidate(organizer_id: Optional[str]) -> None:
+    """Drop one organizer's cached statistics."""
+    with _lock:
+        _stats.pop(organizer_id, None)
+
+
+def clear_organizer_stats_cache() -> None:
+    """Drop every cached statistics entry."""
+    with _lock:
+        _stats.clear()
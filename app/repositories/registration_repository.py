@@ -1,9 +1,12 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Set, Tuple, Iterator
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import JSON, case, cast, func, select, true, tuple_, update, Row
 from datetime import datetime
+from app.core.database import strict_loading, insert_returning, update_returning, commit_preserving
 from app.models.registration import Registration, RegistrationStatus, CheckInStatus
-import uuid
+from app.models.user import User
+from app.utils.pagination import encode_cursor, decode_cursor
 
 
 class RegistrationRepository:
@@ -16,7 +19,8 @@ class RegistrationRepository:
         if include_relations:
             query = query.options(
                 joinedload(Registration.user),
-                joinedload(Registration.event)
+                joinedload(Registration.event),
+                *strict_loading()
             )
         return query.first()
     
@@ -25,11 +29,13 @@ class RegistrationRepository:
         user_id: str,
         event_id: str
     ) -> Optional[Registration]:
-        return self.db.query(Registration).filter(
-            Registration.user_id == user_id,
-            Registration.event_id == event_id,
-            Registration.status == RegistrationStatus.CONFIRMED
-        ).first()
+        return self.db.execute(
+            select(Registration).where(
+                Registration.user_id == user_id,
+                Registration.event_id == event_id,
+                Registration.status == RegistrationStatus.CONFIRMED
+            ).limit(1)
+        ).scalar_one_or_none()
     
     def get_user_registrations(
         self,
@@ -50,8 +56,19 @@ class RegistrationRepository:
         if not include_past:
             query = query.filter(Event.date >= date.today())
         
+        # The registrations list only shows an event summary, so skip the
+        # event description/tags and everything but the organizer's name.
         return query.options(
-            joinedload(Registration.event).joinedload(Event.organizer)
+            selectinload(Registration.event).load_only(
+                Event.id,
+                Event.title,
+                Event.date,
+                Event.start_time,
+                Event.end_time,
+                Event.venue,
+                Event.organizer_id
+            ).selectinload(Event.organizer).load_only(User.id, User.name),
+            *strict_loading()
         ).order_by(Event.date, Event.start_time).all()
     
     def get_event_registrations(
@@ -60,19 +77,226 @@ class RegistrationRepository:
         status: Optional[RegistrationStatus] = None,
         check_in_status: Optional[CheckInStatus] = None
     ) -> List[Registration]:
-        query = self.db.query(Registration).filter(
-            Registration.event_id == event_id
-        )
+        stmt = self._event_registrations_stmt(event_id, status, check_in_status)
+        return list(self.db.scalars(stmt))
+    
+    def get_registered_emails(self, event_id: str, emails: List[str]) -> Set[str]:
+        """Get which of `emails` belong to confirmed attendees of an event."""
+        return set(self.db.scalars(
+            select(User.email).join(
+                Registration, Registration.user_id == User.id
+            ).where(
+                Registration.event_id == event_id,
+                Registration.status == RegistrationStatus.CONFIRMED,
+                User.email.in_(emails)
+            )
+        ))
+    
+    def get_guest_emails(self, event_id: str, emails: List[str]) -> Set[str]:
+        """
+        Get which of `emails` (lowercase) are already guests on a confirmed
+        registration for an event.
+        
+        The guest lists are expanded and matched in the database, so only
+        matching emails come back rather than every guest list.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            # json_array_elements raises on a JSON null; expand those as []
+            guest_lists = case(
+                (func.json_typeof(Registration.guests) == "array", Registration.guests),
+                else_=cast("[]", JSON)
+            )
+            guest = func.json_array_elements(guest_lists).table_valued(
+                "value", joins_implicitly=True
+            ).alias("guest")
+            guest_email = func.lower(guest.c.value.op("->>")("email"))
+        else:
+            guest = func.json_each(Registration.guests).table_valued(
+                "value", joins_implicitly=True
+            ).alias("guest")
+            guest_email = func.lower(func.json_extract(guest.c.value, "$.email"))
+        
+        return set(self.db.scalars(
+            select(guest_email).select_from(Registration).join(
+                guest, true()
+            ).where(
+                Registration.event_id == event_id,
+                Registration.status == RegistrationStatus.CONFIRMED,
+                Registration.guests.is_not(None),
+                guest_email.in_(emails)
+            ).distinct()
+        ))
+    
+    def get_event_attendees_flat(
+        self,
+        event_id: str,
+        check_in_status: Optional[CheckInStatus] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        Get an event's confirmed attendees as flat rows for the check-in list.
+        
+        Rows carry registration_id, user_id, name, email, ticket_code,
+        check_in_status, checked_in_at, guests and registered_at; no ORM
+        objects are built. With a limit, rows come a page at a time in (registered_at, id)
+        order and the returned cursor seeks to the next page.
+        """
+        stmt = self._attendee_rows_stmt(event_id, check_in_status)
+        
+        if cursor:
+            last_registered_at, last_id = decode_cursor(cursor, 2)
+            stmt = stmt.where(
+                tuple_(Registration.registered_at, Registration.id)
+                > tuple_(datetime.fromisoformat(last_registered_at), last_id)
+            )
+        
+        if limit is None:
+            return self.db.execute(stmt).all(), None
+        
+        rows = self.db.execute(stmt.limit(limit + 1)).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].registered_at, rows[-1].registration_id)
+        return rows, next_cursor
+    
+    def iter_event_attendees_flat(
+        self,
+        event_id: str,
+        batch: int = 500
+    ) -> Iterator[Row]:
+        """
+        Stream an event's confirmed attendees as flat rows (see
+        get_event_attendees_flat), `batch` rows at a time, for exports.
+        """
+        stmt = self._attendee_rows_stmt(event_id)
+        result = self.db.execute(stmt.execution_options(yield_per=batch))
+        try:
+            yield from result
+        finally:
+            result.close()
+    
+    def get_event_attendee_stats(
+        self,
+        event_id: str,
+        check_in_status: Optional[CheckInStatus] = None
+    ) -> Row:
+        """
+        Aggregate an event's confirmed attendees in one query.
+        
+        The row carries registrations, checked_in and guests (the number of
+        guests across those registrations).
+        """
+        # guests is a JSON array; json_typeof/json_type guard against rows
+        # holding a JSON null
+        if self.db.get_bind().dialect.name == "postgresql":
+            is_array = func.json_typeof(Registration.guests) == "array"
+        else:
+            is_array = func.json_type(Registration.guests) == "array"
+        guest_count = case((is_array, func.json_array_length(Registration.guests)), else_=0)
+        
+        return self.db.execute(
+            select(
+                func.count(Registration.id).label("registrations"),
+                func.count(Registration.id).filter(
+                    Registration.check_in_status == CheckInStatus.CHECKED_IN
+                ).label("checked_in"),
+                func.coalesce(func.sum(guest_count), 0).label("guests")
+            ).where(
+                *self._attendee_criteria(event_id, check_in_status)
+            )
+        ).one()
+    
+    def _attendee_rows_stmt(
+        self,
+        event_id: str,
+        check_in_status: Optional[CheckInStatus] = None
+    ):
+        return select(
+            Registration.id.label("registration_id"),
+            User.id.label("user_id"),
+            User.name,
+            User.email,
+            Registration.ticket_code,
+            Registration.check_in_status,
+            Registration.checked_in_at,
+            Registration.guests,
+            Registration.registered_at
+        ).join(
+            User, User.id == Registration.user_id
+        ).where(
+            *self._attendee_criteria(event_id, check_in_status)
+        ).order_by(Registration.registered_at, Registration.id)
+    
+    @staticmethod
+    def _attendee_criteria(
+        event_id: str,
+        check_in_status: Optional[CheckInStatus] = None
+    ) -> list:
+        criteria = [
+            Registration.event_id == event_id,
+            Registration.status == RegistrationStatus.CONFIRMED
+        ]
+        if check_in_status:
+            criteria.append(Registration.check_in_status == check_in_status)
+        return criteria
+    
+    def get_event_recipients(self, event_id: str) -> List[Row]:
+        """
+        Get an event's confirmed attendees as flat rows for mailings.
+        
+        Rows carry the registration's id, ticket_code and guests plus the
+        attendee's name and email. They are plain rows, not ORM objects, so
+        they stay usable after the session's transaction has ended.
+        """
+        stmt = select(
+            Registration.id,
+            Registration.ticket_code,
+            Registration.guests,
+            User.name,
+            User.email
+        ).join(
+            User, User.id == Registration.user_id
+        ).where(
+            *self._attendee_criteria(event_id)
+        ).order_by(Registration.registered_at, Registration.id)
+        
+        return self.db.execute(stmt).all()
+    
+    def _event_registrations_stmt(
+        self,
+        event_id: str,
+        status: Optional[RegistrationStatus] = None,
+        check_in_status: Optional[CheckInStatus] = None
+    ):
+        stmt = select(Registration).where(Registration.event_id == event_id)
         
         if status:
-            query = query.filter(Registration.status == status)
+            stmt = stmt.where(Registration.status == status)
         
         if check_in_status:
-            query = query.filter(Registration.check_in_status == check_in_status)
+            stmt = stmt.where(Registration.check_in_status == check_in_status)
         
-        return query.options(joinedload(Registration.user)).order_by(
-            Registration.registered_at
-        ).all()
+        # Attendee lists, exports and mailings never read the QR code or
+        # sessions; the QR code alone is several KB per row.
+        stmt = stmt.options(
+            load_only(
+                Registration.id,
+                Registration.user_id,
+                Registration.event_id,
+                Registration.status,
+                Registration.ticket_code,
+                Registration.check_in_status,
+                Registration.checked_in_at,
+                Registration.guests,
+                Registration.registered_at
+            ),
+            selectinload(Registration.user).load_only(User.id, User.name, User.email),
+            *strict_loading()
+        ).order_by(Registration.registered_at)
+        
+        return stmt
     
     def create(
         self,
@@ -81,68 +305,127 @@ class RegistrationRepository:
         ticket_code: str,
         qr_code: Optional[str] = None,
         guests: Optional[List[dict]] = None,
-        sessions: Optional[List[str]] = None
+        sessions: Optional[List[str]] = None,
+        commit: bool = True
     ) -> Registration:
-        registration_id = str(uuid.uuid4())
-        
-        registration = Registration(
-            id=registration_id,
-            user_id=user_id,
-            event_id=event_id,
-            status=RegistrationStatus.CONFIRMED,
-            ticket_code=ticket_code,
-            qr_code=qr_code,
-            check_in_status=CheckInStatus.NOT_CHECKED_IN,
-            guests=guests if guests else [],
-            sessions=sessions if sessions else [],
-            reminder_sent=False
-        )
-        
         try:
-            self.db.add(registration)
-            self.db.commit()
-            self.db.refresh(registration)
-            return registration
+            return insert_returning(
+                self.db,
+                Registration,
+                commit=commit,
+                user_id=user_id,
+                event_id=event_id,
+                status=RegistrationStatus.CONFIRMED,
+                ticket_code=ticket_code,
+                qr_code=qr_code,
+                check_in_status=CheckInStatus.NOT_CHECKED_IN,
+                guests=guests if guests else [],
+                sessions=sessions if sessions else [],
+                reminder_sent=False
+            )
         except IntegrityError:
-            self.db.rollback()
+            # With commit=False the caller owns the transaction (and may be
+            # inside a savepoint), so leave the rollback to it
+            if commit:
+                self.db.rollback()
             raise
     
-    def cancel(self, registration: Registration) -> Registration:
-        registration.status = RegistrationStatus.CANCELLED
-        registration.cancelled_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(registration)
-        return registration
+    def cancel(self, registration: Registration, commit: bool = True) -> Optional[Registration]:
+        """
+        Cancel a confirmed registration. Returns None, having written
+        nothing, if it was already cancelled (e.g. by a concurrent request).
+        """
+        return update_returning(
+            self.db,
+            registration,
+            commit=commit,
+            where=(Registration.status == RegistrationStatus.CONFIRMED,),
+            status=RegistrationStatus.CANCELLED,
+            cancelled_at=func.now()
+        )
     
-    def check_in(self, registration: Registration) -> Registration:
-        registration.check_in_status = CheckInStatus.CHECKED_IN
-        registration.checked_in_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(registration)
+    def try_check_in(self, registration_id: str, event_id: str) -> Optional[Registration]:
+        """
+        Check in a confirmed, not yet checked-in registration for event_id
+        with one guarded UPDATE ... RETURNING, and commit.
+        
+        Returns None, having written nothing, if the registration doesn't
+        exist, belongs to another event or doesn't qualify; callers look it
+        up to say why.
+        """
+        registration = self.db.scalars(
+            update(Registration).where(
+                Registration.id == registration_id,
+                Registration.event_id == event_id,
+                Registration.status == RegistrationStatus.CONFIRMED,
+                Registration.check_in_status == CheckInStatus.NOT_CHECKED_IN
+            ).values(
+                check_in_status=CheckInStatus.CHECKED_IN,
+                checked_in_at=func.now()
+            ).returning(Registration)
+        ).one_or_none()
+        
+        if registration is not None:
+            commit_preserving(self.db, registration)
         return registration
     
     def mark_reminder_sent(self, registration: Registration) -> Registration:
-        registration.reminder_sent = True
-        self.db.commit()
-        self.db.refresh(registration)
-        return registration
+        return update_returning(self.db, registration, reminder_sent=True)
     
     def count_event_registrations(
         self,
         event_id: str,
         status: RegistrationStatus = RegistrationStatus.CONFIRMED
     ) -> int:
-        return self.db.query(Registration).filter(
-            Registration.event_id == event_id,
-            Registration.status == status
-        ).count()
+        """
+        Count registration rows for an event (guests not included).
+
+        Not for capacity checks: those read Event.registered_count, the
+        attendee counter kept by EventRepository's atomic counter updates.
+        """
+        return self.db.execute(
+            select(func.count()).select_from(Registration).where(
+                Registration.event_id == event_id,
+                Registration.status == status
+            )
+        ).scalar_one()
     
-    def get_registrations_needing_reminder(self, event_date) -> List[Registration]:
+    def get_registrations_needing_reminder(self, event_date) -> List[Tuple[str, str, str]]:
+        """
+        Get confirmed registrations for events on event_date that haven't had
+        a reminder yet, as (registration_id, user_email, event_id) tuples.
+        """
         from app.models.event import Event
         
-        return self.db.query(Registration).join(Event).filter(
+        # Predicates match ix_registrations_reminder_pending literally
+        # (reminder_sent = false, status = 'CONFIRMED') so the planner can
+        # use the partial index.
+        stmt = select(
+            Registration.id, User.email, Registration.event_id
+        ).join(
+            Event, Event.id == Registration.event_id
+        ).join(
+            User, User.id == Registration.user_id
+        ).where(
             Event.date == event_date,
             Registration.status == RegistrationStatus.CONFIRMED,
             Registration.reminder_sent == False
-        ).all()
+        )
+        
+        return self.db.execute(stmt).all()
+    
+    def bulk_mark_reminders_sent(self, registration_ids: List[str]) -> int:
+        """Flag a batch of registrations as reminded in one UPDATE and commit."""
+        if not registration_ids:
+            return 0
+        
+        result = self.db.execute(
+            update(Registration).where(
+                Registration.id.in_(registration_ids)
+            ).values(
+                reminder_sent=True
+            ).execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
 
@@ -1,21 +1,50 @@
 from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, select, lambda_stmt
+from sqlalchemy.dialects import postgresql, sqlite
+from app.core.database import insert_returning, update_returning, commit_preserving
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
-import uuid
 
 
 class UserRepository:
     
     def __init__(self, db: Session):
         self.db = db
+        # Users looked up during this session (i.e. this request), shared by
+        # every UserRepository on the same session. Values are the session's
+        # own instances, so a hit returns exactly what a query would.
+        self._cache = db.info.setdefault("_user_cache", {})
     
+    # Hot lookups (every authenticated request) are lambda statements so the
+    # compiled SQL is cached by the lambda's code location, not rebuilt per call.
     def get_by_id(self, user_id: str) -> Optional[User]:
-        return self.db.query(User).filter(User.id == user_id).first()
+        user = self._cache.get(("id", user_id))
+        if user is None:
+            stmt = lambda_stmt(lambda: select(User))
+            stmt += lambda s: s.where(User.id == user_id)
+            user = self._remember(self.db.execute(stmt).scalar_one_or_none())
+        return user
     
     def get_by_email(self, email: str) -> Optional[User]:
-        return self.db.query(User).filter(User.email == email.lower()).first()
+        email = email.lower()
+        user = self._cache.get(("email", email))
+        if user is None:
+            stmt = lambda_stmt(lambda: select(User))
+            stmt += lambda s: s.where(User.email == email)
+            user = self._remember(self.db.execute(stmt).scalar_one_or_none())
+        return user
+    
+    def _remember(self, user: Optional[User]) -> Optional[User]:
+        if user is not None:
+            self._cache[("id", user.id)] = user
+            self._cache[("email", user.email)] = user
+        return user
+    
+    def _forget(self, user: User) -> None:
+        self._cache.pop(("id", user.id), None)
+        self._cache.pop(("email", user.email), None)
     
     def create(
         self,
@@ -24,35 +53,74 @@ class UserRepository:
         name: str,
         role: UserRole = UserRole.STUDENT,
         department: Optional[str] = None,
-        phone: Optional[str] = None
+        phone: Optional[str] = None,
+        commit: bool = True
     ) -> User:
-        user_id = str(uuid.uuid4())
-        
+        try:
+            return insert_returning(
+                self.db,
+                User,
+                commit=commit,
+                **self._new_user_values(email, password, name, role, department, phone)
+            )
+        except IntegrityError:
+            self.db.rollback()
+            raise
+    
+    def create_if_not_exists(
+        self,
+        email: str,
+        password: str,
+        name: str,
+        role: UserRole = UserRole.STUDENT,
+        department: Optional[str] = None,
+        phone: Optional[str] = None,
+        commit: bool = True
+    ) -> Optional[User]:
+        """
+        Create a user unless the email is taken, in a single
+        INSERT ... ON CONFLICT (email) DO NOTHING RETURNING.
         
-        hashed_password = get_password_hash(password)
+        Returns None when the email already exists, with no separate lookup
+        and no window for a concurrent signup to slip in between.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            dialect_insert = postgresql.insert
+        else:
+            dialect_insert = sqlite.insert
         
+        stmt = dialect_insert(User).values(
+            **self._new_user_values(email, password, name, role, department, phone)
+        ).on_conflict_do_nothing(
+            index_elements=[User.email]
+        ).returning(User)
         
-        user = User(
-            id=user_id,
+        user = self.db.scalars(stmt).one_or_none()
+        if user is not None and commit:
+            commit_preserving(self.db, user)
+        return user
+    
+    @staticmethod
+    def _new_user_values(
+        email: str,
+        password: str,
+        name: str,
+        role: UserRole,
+        department: Optional[str],
+        phone: Optional[str]
+    ) -> dict:
+        return dict(
             email=email.lower(),
-            password=hashed_password,
+            password=get_password_hash(password),
             name=name,
             role=role,
             department=department,
             phone=phone,
             is_approved=(role == UserRole.STUDENT or role == UserRole.ADMIN)
         )
-        
-        try:
-            self.db.add(user)
-            self.db.commit()
-            self.db.refresh(user)
-            return user
-        except IntegrityError:
-            self.db.rollback()
-            raise
     
     def update(self, user: User, **kwargs) -> User:
+        self._forget(user)
         for key, value in kwargs.items():
             if hasattr(user, key):
                 setattr(user, key, value)
@@ -61,27 +129,19 @@ class UserRepository:
         self.db.refresh(user)
         return user
     
-    def update_last_login(self, user: User) -> User:
-        from datetime import datetime
-        user.last_login = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+    def update_last_login(self, user: User, **values) -> User:
+        """Stamp last_login, writing any other `values` in the same UPDATE."""
+        self._forget(user)
+        return update_returning(self.db, user, last_login=func.now(), **values)
     
     def approve_organizer(self, user: User) -> User:
-        user.is_approved = True
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        self._forget(user)
+        return update_returning(self.db, user, is_approved=True)
     
     def deactivate(self, user: User) -> User:
-        user.is_active = False
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        self._forget(user)
+        return update_returning(self.db, user, is_active=False)
     
     def activate(self, user: User) -> User:
-        user.is_active = True
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        self._forget(user)
+        return update_returning(self.db, user, is_active=True)
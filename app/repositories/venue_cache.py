@@ -0,0 +1,52 @@
+"""
+In-process cache for the active venue list.
+
+Venues change a few times a semester but are listed on every event
+create page, so the active list is served from a module-level snapshot.
+It is cleared whenever a Venue row is inserted, updated or deleted in
+this process, and expires after VENUE_CACHE_TTL_SECONDS so changes made
+by other workers are picked up.
+"""
+from typing import Optional, List
+from sqlalchemy import event
+from app.core.config import settings
+from app.models.venue import Venue
+import threading
+import time
+
+
+_lock = threading.Lock()
+_active_list: Optional[List[dict]] = None
+_active_list_expires_at = 0.0
+
+
+def get_active_list() -> Optional[List[dict]]:
+    """Get a copy of the cached active venue list, or None on a miss."""
+    with _lock:
+        if _active_list is None or _active_list_expires_at <= time.monotonic():
+            return None
+        return [dict(venue) for venue in _active_list]
+
+
+def set_active_list(venues: List[dict]) -> None:
+    """Cache the active venue list (Venue.to_dict() dicts)."""
+    global _active_list, _active_list_expires_at
+
+    with _lock:
+        _active_list = [dict(venue) for venue in venues]
+        _active_list_expires_at = time.monotonic() + settings.VENUE_CACHE_TTL_SECONDS
+
+
+def clear_venue_cache() -> None:
+    """Drop the cached venue list so the next read goes to the database."""
+    global _active_list
+
+    with _lock:
+        _active_list = None
+
+
+@event.listens_for(Venue, "after_insert")
+@event.listens_for(Venue, "after_update")
+@event.listens_for(Venue, "after_delete")
+def _invalidate(mapper, connection, target) -> None:
+    clear_venue_cache()
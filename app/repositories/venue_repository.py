@@ -1,8 +1,11 @@
 from typing import Optional, List
 from sqlalchemy.orm import Session
+from sqlalchemy import not_
 from sqlalchemy.exc import IntegrityError
+from app.core.database import insert_returning, update_returning
 from app.models.venue import Venue
-import uuid
+from app.repositories import venue_cache
+from app.repositories.venue_cache import clear_venue_cache
 
 
 class VenueRepository:
@@ -13,11 +16,28 @@ class VenueRepository:
     def get_by_id(self, venue_id: str) -> Optional[Venue]:
         return self.db.query(Venue).filter(Venue.id == venue_id).first()
     
-    def get_all(self, active_only: bool = True) -> List[Venue]:
+    def get_all(self, active_only: bool = True) -> List[dict]:
+        """
+        Get venues as Venue.to_dict() dicts, ordered by name.
+        
+        The active list is served from an in-process cache for
+        VENUE_CACHE_TTL_SECONDS; the admin list including inactive
+        venues always reads from the database.
+        """
+        if active_only:
+            cached = venue_cache.get_active_list()
+            if cached is not None:
+                return cached
+        
         query = self.db.query(Venue)
         if active_only:
             query = query.filter(Venue.is_active == True)
-        return query.order_by(Venue.name).all()
+        venues = [venue.to_dict() for venue in query.order_by(Venue.name).all()]
+        
+        if active_only:
+            venue_cache.set_active_list(venues)
+        
+        return venues
     
     def create(
         self,
@@ -26,21 +46,17 @@ class VenueRepository:
         capacity: Optional[int] = None,
         facilities: Optional[List[str]] = None
     ) -> Venue:
-        venue_id = str(uuid.uuid4())
-        
-        venue = Venue(
-            id=venue_id,
-            name=name,
-            building=building,
-            capacity=capacity,
-            facilities=facilities if facilities else [],
-            is_active=True
-        )
-        
         try:
-            self.db.add(venue)
-            self.db.commit()
-            self.db.refresh(venue)
+            venue = insert_returning(
+                self.db,
+                Venue,
+                name=name,
+                building=building,
+                capacity=capacity,
+                facilities=facilities if facilities else [],
+                is_active=True
+            )
+            clear_venue_cache()
             return venue
         except IntegrityError:
             self.db.rollback()
@@ -53,11 +69,11 @@ class VenueRepository:
         
         self.db.commit()
         self.db.refresh(venue)
+        clear_venue_cache()
         return venue
     
     def toggle_active(self, venue: Venue) -> Venue:
-        venue.is_active = not venue.is_active
-        self.db.commit()
-        self.db.refresh(venue)
+        venue = update_returning(self.db, venue, is_active=not_(Venue.is_active))
+        clear_venue_cache()
         return venue
 
@@ -1,8 +1,11 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete, func, insert, select, update
+from app.core.database import strict_loading, insert_returning
+from app.models.event import Event
 from app.models.waitlist import WaitlistEntry, NotificationPreference
-import uuid
+from app.models.user import User
 
 
 class WaitlistRepository:
@@ -15,7 +18,8 @@ class WaitlistRepository:
         if include_relations:
             query = query.options(
                 joinedload(WaitlistEntry.user),
-                joinedload(WaitlistEntry.event)
+                joinedload(WaitlistEntry.event),
+                *strict_loading()
             )
         return query.first()
     
@@ -33,76 +37,146 @@ class WaitlistRepository:
         return self.db.query(WaitlistEntry).filter(
             WaitlistEntry.user_id == user_id
         ).options(
-            joinedload(WaitlistEntry.event)
+            joinedload(WaitlistEntry.event),
+            *strict_loading()
         ).order_by(WaitlistEntry.joined_at).all()
     
     def get_event_waitlist(self, event_id: str) -> List[WaitlistEntry]:
+        # user is many-to-one and NOT NULL, so an inner join brings the
+        # attendee's name and email back in the same query
         return self.db.query(WaitlistEntry).filter(
             WaitlistEntry.event_id == event_id
         ).options(
-            joinedload(WaitlistEntry.user)
+            joinedload(WaitlistEntry.user, innerjoin=True).load_only(User.id, User.name, User.email),
+            *strict_loading()
         ).order_by(WaitlistEntry.position).all()
     
-    def get_next_position(self, event_id: str) -> int:
-        from sqlalchemy import func
-        
-        max_position = self.db.query(
-            func.max(WaitlistEntry.position)
-        ).filter(
-            WaitlistEntry.event_id == event_id
-        ).scalar()
-        
-        return (max_position or 0) + 1
-    
     def create(
         self,
         user_id: str,
         event_id: str,
-        notification_preference: NotificationPreference = NotificationPreference.EMAIL
+        notification_preference: NotificationPreference = NotificationPreference.EMAIL,
+        max_attempts: int = 3
     ) -> WaitlistEntry:
-        waitlist_id = str(uuid.uuid4())
-        position = self.get_next_position(event_id)
+        # Position is computed inside the INSERT itself. Two concurrent joins
+        # can still pick the same number; the (event_id, position) unique
+        # constraint rejects the loser, which simply retries.
+        next_position = select(
+            func.coalesce(func.max(WaitlistEntry.position), 0) + 1
+        ).where(
+            WaitlistEntry.event_id == event_id
+        ).scalar_subquery()
         
-        entry = WaitlistEntry(
-            id=waitlist_id,
-            user_id=user_id,
-            event_id=event_id,
-            position=position,
-            notification_preference=notification_preference
-        )
+        for attempt in range(max_attempts):
+            try:
+                return insert_returning(
+                    self.db,
+                    WaitlistEntry,
+                    user_id=user_id,
+                    event_id=event_id,
+                    position=next_position,
+                    notification_preference=notification_preference
+                )
+            except IntegrityError:
+                self.db.rollback()
+                if attempt == max_attempts - 1:
+                    raise
+    
+    def bulk_create(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Insert many waitlist entries with a single executemany.
         
-        try:
-            self.db.add(entry)
+        Each mapping needs user_id, event_id and position; ids come from
+        the database and notification_preference is filled in when missing.
+        """
+        rows = [
+            {
+                "notification_preference": NotificationPreference.EMAIL,
+                **entry
+            }
+            for entry in entries
+        ]
+        if rows:
+            self.db.execute(insert(WaitlistEntry), rows)
             self.db.commit()
-            self.db.refresh(entry)
-            return entry
-        except IntegrityError:
-            self.db.rollback()
-            raise
     
     def remove(self, entry: WaitlistEntry) -> None:
         event_id = entry.event_id
         position = entry.position
         
-        self.db.delete(entry)
-        self.db.commit()
+        # Delete, then close the gap, in one transaction. The row has to go
+        # first: shifting first would briefly give two entries this position.
+        try:
+            self.db.delete(entry)
+            self.db.flush()
+            self.shift_positions(event_id, position)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def shift_positions(self, event_id: str, from_position: int) -> None:
+        """
+        Move everyone behind from_position up one place.
+        Runs in the caller's transaction.
         
-        self.db.query(WaitlistEntry).filter(
-            WaitlistEntry.event_id == event_id,
-            WaitlistEntry.position > position
-        ).update(
-            {WaitlistEntry.position: WaitlistEntry.position - 1},
-            synchronize_session=False
+        Positions are unique per event and checked row by row, so a single
+        position - 1 UPDATE can collide mid-statement. The rows are first
+        parked on negative positions, then flipped back.
+        """
+        self.db.execute(
+            update(WaitlistEntry).where(
+                WaitlistEntry.event_id == event_id,
+                WaitlistEntry.position > from_position
+            ).values(
+                position=-(WaitlistEntry.position - 1)
+            ).execution_options(synchronize_session=False)
+        )
+        self.db.execute(
+            update(WaitlistEntry).where(
+                WaitlistEntry.event_id == event_id,
+                WaitlistEntry.position < 0
+            ).values(
+                position=-WaitlistEntry.position
+            ).execution_options(synchronize_session=False)
         )
-        self.db.commit()
     
-    def get_first_in_line(self, event_id: str) -> Optional[WaitlistEntry]:
-        return self.db.query(WaitlistEntry).filter(
+    def pop_first(self, event_id: str) -> Optional[WaitlistEntry]:
+        """
+        Delete and return the entry at the head of an event's waitlist, and
+        move everyone behind it up one place.
+        Runs in the caller's transaction; nothing is committed.
+        
+        The event row is locked first, so concurrent promotions for the same
+        event run one after the other and each sees the waitlist as the
+        previous one left it. (SKIP LOCKED on the head alone doesn't work:
+        shift_positions locks every remaining entry, so a concurrent pop
+        would skip them all and find nothing.)
+        """
+        self.db.execute(
+            select(Event.id).where(Event.id == event_id).with_for_update()
+        )
+        
+        head = select(WaitlistEntry.id).where(
             WaitlistEntry.event_id == event_id
-        ).order_by(WaitlistEntry.position).first()
+        ).order_by(
+            WaitlistEntry.position
+        ).limit(1).with_for_update().scalar_subquery()
+        
+        entry = self.db.scalars(
+            delete(WaitlistEntry).where(
+                WaitlistEntry.id == head
+            ).returning(WaitlistEntry)
+        ).one_or_none()
+        
+        if entry is not None:
+            self.shift_positions(event_id, entry.position)
+        return entry
     
     def count_event_waitlist(self, event_id: str) -> int:
-        return self.db.query(WaitlistEntry).filter(
-            WaitlistEntry.event_id == event_id
-        ).count()
+        return self.db.execute(
+            select(func.count()).select_from(WaitlistEntry).where(
+                WaitlistEntry.event_id == event_id
+            )
+        ).scalar_one()
 
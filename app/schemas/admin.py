@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -15,8 +15,7 @@ class OrganizerApprovalResponse(BaseModel):
     reviewedAt: Optional[str] = None
     notes: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OrganizerApprovalsResponse(BaseModel):
@@ -56,8 +55,7 @@ class EventApprovalResponse(BaseModel):
     submittedAt: str
     status: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EventApprovalsResponse(BaseModel):
@@ -66,7 +64,7 @@ class EventApprovalsResponse(BaseModel):
 
 
 class AuditLogActorInfo(BaseModel):
-    id: str
+    id: Optional[str] = None
     name: str
     role: str
 
@@ -88,15 +86,16 @@ class AuditLogResponse(BaseModel):
     userAgent: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginationInfo(BaseModel):
     currentPage: int
-    totalPages: int
-    totalItems: int
+    # None on cursor requests, where the total isn't computed
+    totalPages: Optional[int] = None
+    totalItems: Optional[int] = None
     itemsPerPage: int
+    nextCursor: Optional[str] = None
 
 
 class AuditLogsResponse(BaseModel):
@@ -1,19 +1,23 @@
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
 from typing import Optional
 from datetime import datetime
 from app.models.user import UserRole
 
 
+_UMD_SUFFIXES = ('@umd.edu', '@terpmail.umd.edu')
+
+
 class UserBase(BaseModel):
     email: EmailStr
     name: str = Field(..., min_length=2, max_length=255)
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_umd_email(cls, v):
-        email_lower = v.lower()
-        if not (email_lower.endswith('@umd.edu') or email_lower.endswith('@terpmail.umd.edu')):
+        v = v.lower()
+        if not v.endswith(_UMD_SUFFIXES):
             raise ValueError('Email must be a valid UMD email address (@umd.edu or @terpmail.umd.edu)')
-        return email_lower
+        return v
 
 
 class UserCreate(UserBase):
@@ -44,8 +48,7 @@ class UserResponse(BaseModel):
     updatedAt: Optional[str] = None
     lastLogin: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenResponse(BaseModel):
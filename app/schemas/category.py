@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
 from typing import Optional
 
 
@@ -28,11 +29,10 @@ class CategoryResponse(BaseModel):
     color: str
     icon: Optional[str] = None
     isActive: bool
-    createdAt: Optional[str] = None
-    updatedAt: Optional[str] = None
+    createdAt: Optional[datetime] = None
+    updatedAt: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoriesResponse(BaseModel):
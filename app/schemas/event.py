@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, ConfigDict
+from typing import Optional, List, Literal
 from datetime import date, time
 
 
@@ -19,7 +19,8 @@ class EventCreate(EventBase):
     startTime: str = Field(..., description="Start time in HH:MM format (24-hour)")
     endTime: str = Field(..., description="End time in HH:MM format (24-hour)")
     
-    @validator('date')
+    @field_validator('date')
+    @classmethod
     def validate_date(cls, v):
         try:
             event_date = date.fromisoformat(v)
@@ -31,7 +32,8 @@ class EventCreate(EventBase):
                 raise
             raise ValueError('Date must be in YYYY-MM-DD format')
     
-    @validator('startTime', 'endTime')
+    @field_validator('startTime', 'endTime')
+    @classmethod
     def validate_time(cls, v):
         try:
             time.fromisoformat(v)
@@ -39,10 +41,11 @@ class EventCreate(EventBase):
         except ValueError:
             raise ValueError('Time must be in HH:MM format (24-hour)')
     
-    @validator('endTime')
-    def validate_end_time(cls, v, values):
-        if 'startTime' in values:
-            start = time.fromisoformat(values['startTime'])
+    @field_validator('endTime')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
+        if 'startTime' in info.data:
+            start = time.fromisoformat(info.data['startTime'])
             end = time.fromisoformat(v)
             if end <= start:
                 raise ValueError('End time must be after start time')
@@ -52,19 +55,6 @@ class EventCreate(EventBase):
 class EventUpdate(EventCreate):
     status: Optional[str] = Field(None, description="Event status (draft, pending, published, cancelled)")
 
-class EventUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=5, max_length=200)
-    description: Optional[str] = Field(None, min_length=50)
-    categoryId: Optional[str] = None
-    date: Optional[str] = None
-    startTime: Optional[str] = None
-    endTime: Optional[str] = None
-    venue: Optional[str] = Field(None, min_length=2, max_length=200)
-    location: Optional[str] = Field(None, min_length=5, max_length=500)
-    capacity: Optional[int] = Field(None, ge=1, le=5000)
-    imageUrl: Optional[str] = Field(None, max_length=500)
-    tags: Optional[List[str]] = None
-
 
 class OrganizerInfo(BaseModel):
     id: str
@@ -106,8 +96,7 @@ class EventResponse(BaseModel):
     category: Optional[CategoryInfo] = None
     organizer: Optional[OrganizerInfo] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EventListResponse(BaseModel):
@@ -131,15 +120,36 @@ class EventListResponse(BaseModel):
     createdAt: Optional[str] = None
     publishedAt: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EventListParams(BaseModel):
+    """Query parameters for GET /api/events, injected with Depends()."""
+    search: Optional[str] = Field(None, description="Search in title, description, venue and location")
+    category: Optional[str] = Field(None, description="Category slug (academic, career, cultural, etc.)")
+    startDate: Optional[date] = Field(None, description="ISO 8601 date (filter events on or after this date)")
+    endDate: Optional[date] = Field(None, description="ISO 8601 date (filter events on or before this date)")
+    organizer: Optional[str] = Field(None, description="Organizer name search")
+    availability: Optional[bool] = Field(None, description="If true, only show events with available spots")
+    sortBy: Literal["date", "title", "popularity"] = "date"
+    page: int = Field(1, ge=1, description="Page number (default: 1)")
+    limit: int = Field(20, ge=1, le=100, description="Items per page (default: 20, max: 100)")
+    cursor: Optional[str] = Field(None, description="Cursor from a previous page (same sortBy; overrides page)")
 
 
 class PaginationInfo(BaseModel):
     currentPage: int
-    totalPages: int
-    totalItems: int
     itemsPerPage: int
+    hasMore: bool = False
+    nextCursor: Optional[str] = None
+    # Not computed by the list endpoint; see GET /api/events/count
+    totalPages: Optional[int] = None
+    totalItems: Optional[int] = None
+
+
+class EventsCountResponse(BaseModel):
+    success: bool = True
+    totalItems: int
 
 
 class EventsListResponse(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 
 
@@ -34,8 +34,7 @@ class OrganizerApprovalResponse(BaseModel):
     requestedAt: str
     reviewedAt: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OrganizerApprovalsListResponse(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
 from typing import Optional, List
 
 
@@ -6,16 +6,18 @@ class GuestInfo(BaseModel):
     name: str = Field(..., min_length=2, max_length=255)
     email: EmailStr
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_umd_email(cls, v):
-        if not v.lower().endswith('@umd.edu'):
+        v = v.lower()
+        if not v.endswith('@umd.edu'):
             raise ValueError('Guest email must be a valid UMD email address (@umd.edu)')
-        return v.lower()
+        return v
 
 
 class RegistrationCreate(BaseModel):
     eventId: str
-    guests: Optional[List[GuestInfo]] = Field(default_factory=list, max_items=2, description="Maximum 2 guests")
+    guests: Optional[List[GuestInfo]] = Field(default_factory=list, max_length=2, description="Maximum 2 guests")
     sessions: Optional[List[str]] = Field(default_factory=list, description="Session IDs for multi-session events")
     notificationPreference: Optional[str] = Field("email", pattern="^(email|sms|both|none)$")
 
@@ -46,8 +48,7 @@ class RegistrationResponse(BaseModel):
     cancelledAt: Optional[str] = None
     event: Optional[EventBasicInfo] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RegistrationCreateResponse(BaseModel):
@@ -84,4 +85,5 @@ class AttendeesResponse(BaseModel):
     success: bool = True
     attendees: List[AttendeeInfo]
     statistics: AttendeeStatistics
+    nextCursor: Optional[str] = None
 
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
 from typing import Optional, List
 
 
@@ -27,11 +28,10 @@ class VenueResponse(BaseModel):
     capacity: Optional[int] = None
     facilities: List[str] = []
     isActive: bool
-    createdAt: Optional[str] = None
-    updatedAt: Optional[str] = None
+    createdAt: Optional[datetime] = None
+    updatedAt: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VenuesResponse(BaseModel):
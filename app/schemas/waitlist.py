@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 
 
@@ -24,8 +24,7 @@ class WaitlistResponse(BaseModel):
     notificationPreference: str
     event: Optional[EventWaitlistInfo] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class WaitlistCreateResponse(BaseModel):
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from datetime import date, datetime
@@ -13,6 +13,7 @@ from app.models.audit_log import AuditLog, AuditAction, TargetType
 from app.models.registration import Registration, CheckInStatus, RegistrationStatus
 from app.repositories.user_repository import UserRepository
 from app.repositories.event_repository import EventRepository
+from app.repositories import organizer_stats_cache
 from app.repositories.category_repository import CategoryRepository
 from app.repositories.venue_repository import VenueRepository
 from app.repositories.audit_log_repository import AuditLogRepository
@@ -237,6 +238,7 @@ class AdminService:
 
         self.db.commit()
         self.db.refresh(event)
+        organizer_stats_cache.invalidate(event.organizer_id)
 
         return event
 
@@ -288,10 +290,11 @@ class AdminService:
 
         self.db.commit()
         self.db.refresh(event)
+        organizer_stats_cache.invalidate(event.organizer_id)
 
         return event
 
-    def get_all_categories(self, admin: User, include_inactive: bool = True) -> List[Category]:
+    def get_all_categories(self, admin: User, include_inactive: bool = True) -> List[dict]:
         self._verify_admin(admin)
         return self.category_repo.get_all(active_only=not include_inactive)
 
@@ -433,7 +436,7 @@ class AdminService:
 
         return category
 
-    def get_all_venues(self, admin: User, include_inactive: bool = True) -> List[Venue]:
+    def get_all_venues(self, admin: User, include_inactive: bool = True) -> List[dict]:
         self._verify_admin(admin)
         return self.venue_repo.get_all(active_only=not include_inactive)
 
@@ -564,8 +567,9 @@ class AdminService:
         user_id: Optional[str] = None,
         search: Optional[str] = None,
         page: int = 1,
-        limit: int = 50
-    ) -> Tuple[List[AuditLog], int]:
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLog], Optional[int], Optional[str]]:
         self._verify_admin(admin)
 
         start_date_obj = date.fromisoformat(start_date) if start_date else None
@@ -578,13 +582,51 @@ class AdminService:
             except KeyError:
                 pass
 
-        return self.audit_repo.get_all(
+        try:
+            return self.audit_repo.get_all(
+                action=action_enum,
+                start_date=start_date_obj,
+                end_date=end_date_obj,
+                actor_id=user_id,
+                search=search,
+                page=page,
+                limit=limit,
+                cursor=cursor
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+
+    def iter_audit_logs(
+        self,
+        admin: User,
+        action: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        user_id: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[AuditLog]:
+        self._verify_admin(admin)
+
+        start_date_obj = date.fromisoformat(start_date) if start_date else None
+        end_date_obj = date.fromisoformat(end_date) if end_date else None
+
+        action_enum = None
+        if action:
+            try:
+                action_enum = AuditAction[action]
+            except KeyError:
+                pass
+
+        return self.audit_repo.iter_all(
             action=action_enum,
             start_date=start_date_obj,
             end_date=end_date_obj,
             actor_id=user_id,
             search=search,
-            page=page,
             limit=limit
         )
 
@@ -625,16 +667,16 @@ class AdminService:
         category_analytics = []
         categories = self.category_repo.get_all(active_only=True)
         for cat in categories:
-            cat_events = self.db.query(Event).filter(Event.category_id == cat.id).all()
+            cat_events = self.db.query(Event).filter(Event.category_id == cat["id"]).all()
             cat_registrations = sum([e.registered_count for e in cat_events])
             cat_attendance = self.db.query(Registration).join(Event).filter(
-                Event.category_id == cat.id,
+                Event.category_id == cat["id"],
                 Registration.check_in_status == CheckInStatus.CHECKED_IN
             ).count()
             cat_rate = (cat_attendance / cat_registrations * 100) if cat_registrations > 0 else 0
 
             category_analytics.append({
-                "category": cat.name,
+                "category": cat["name"],
                 "events": len(cat_events),
                 "registrations": cat_registrations,
                 "attendance": cat_attendance,
@@ -1,10 +1,11 @@
 from typing import Optional, Tuple
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
 from app.repositories.organizer_approval_repository import OrganizerApprovalRepository
-from app.core.security import verify_password, create_access_token
+from app.core.database import commit_preserving
+from app.core.security import verify_and_update_password, verify_dummy_password, create_access_token
 from app.schemas.auth import UserLogin, UserCreate
 
 
@@ -15,17 +16,23 @@ class AuthService:
         self.user_repo = UserRepository(db)
         self.approval_repo = OrganizerApprovalRepository(db)
     
-    def authenticate_user(self, credentials: UserLogin) -> Tuple[User, str]:
+    def authenticate_user(
+        self,
+        credentials: UserLogin,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> Tuple[User, str]:
         user = self.user_repo.get_by_email(credentials.email)
         
         if not user:
+            verify_dummy_password(credentials.password)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials. Please check your email and password.",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        if not verify_password(credentials.password, user.password):
+        verified, new_hash = verify_and_update_password(credentials.password, user.password)
+        if not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials. Please check your email and password.",
@@ -44,7 +51,13 @@ class AuthService:
                     detail="Your account has been deactivated. Please contact an administrator."
                 )
         
-        self.user_repo.update_last_login(user)
+        # Nothing in the response depends on this write (it reports the
+        # previous lastLogin), so with background_tasks it runs after the
+        # response is sent
+        if background_tasks is not None:
+            background_tasks.add_task(self.record_login, user, new_hash)
+        else:
+            self.record_login(user, new_hash)
         
         token_data = {
             "sub": user.id,
@@ -56,23 +69,31 @@ class AuthService:
         
         return user, token
     
+    def record_login(self, user: User, new_hash: Optional[str] = None) -> None:
+        # An upgraded hash rides along with the last_login UPDATE
+        if new_hash:
+            self.user_repo.update_last_login(user, password=new_hash)
+        else:
+            self.user_repo.update_last_login(user)
+    
     def register_user(self, user_data: UserCreate) -> User:
-        existing_user = self.user_repo.get_by_email(user_data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Email already registered."
-            )
-        
+        # The user and their approval request commit together, so an
+        # organizer can't end up without a pending request
         try:
-            user = self.user_repo.create(
+            user = self.user_repo.create_if_not_exists(
                 email=user_data.email,
                 password=user_data.password,
                 name=user_data.name,
                 role=user_data.role,
                 department=user_data.department,
-                phone=user_data.phone
+                phone=user_data.phone,
+                commit=False
             )
+            if user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Email already registered."
+                )
 
             if user.role == UserRole.ORGANIZER:
                 reason = (
@@ -81,11 +102,17 @@ class AuthService:
                 )
                 self.approval_repo.create(
                     user_id=user.id,
-                    reason=reason
+                    reason=reason,
+                    commit=False
                 )
 
+            commit_preserving(self.db, user)
             return user
+        except HTTPException:
+            self.db.rollback()
+            raise
         except Exception as e:
+            self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to create user: {str(e)}"
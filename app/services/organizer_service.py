@@ -1,14 +1,19 @@
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Callable
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from datetime import date, datetime
 import uuid
 import csv
 import io
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+from app.core.config import settings
+from app.core.database import commit_preserving
 from app.models.event import Event, EventStatus
 from app.models.user import User, UserRole
 from app.models.registration import Registration, RegistrationStatus, CheckInStatus
@@ -19,11 +24,62 @@ from app.repositories.registration_repository import RegistrationRepository
 from app.repositories.waitlist_repository import WaitlistRepository
 from app.repositories.category_repository import CategoryRepository
 from app.repositories.audit_log_repository import AuditLogRepository
-from app.repositories.user_repository import UserRepository
 from app.schemas.event import EventCreate, EventUpdate
 from app.utils.email_service import EmailService
 
 
+# Status values accepted by update_event, by their lowercase value
+_EVENT_STATUSES = {event_status.value: event_status for event_status in EventStatus}
+
+_ATTENDEE_CSV_HEADER = (
+    "Name",
+    "Email",
+    "Registration Date",
+    "Ticket Code",
+    "Check-in Status",
+    "Checked-in At",
+    "Guest Count",
+    "Guest Names"
+)
+
+
+def _attendee_csv_record(row: Row) -> tuple:
+    """One attendee export row, in _ATTENDEE_CSV_HEADER order."""
+    guests = row.guests or []
+    return (
+        row.name,
+        row.email,
+        row.registered_at.isoformat() if row.registered_at else "",
+        row.ticket_code,
+        row.check_in_status.value,
+        row.checked_in_at.isoformat() if row.checked_in_at else "",
+        len(guests),
+        ", ".join([g.get("name", "") for g in guests])
+    )
+
+
+def _send_concurrently(send: Callable[[Row], Any], recipients: List[Row]) -> int:
+    """
+    Call send(recipient) for every recipient, up to EMAIL_SEND_CONCURRENCY
+    at a time so the SMTP round trips overlap. send must not use the
+    session. Failures are logged and counted; returns the failure count.
+    """
+    def attempt(recipient: Row) -> bool:
+        try:
+            send(recipient)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to send email to {recipient.email}: {str(e)}")
+            return False
+
+    if len(recipients) <= 1:
+        return sum(not attempt(recipient) for recipient in recipients)
+
+    workers = min(settings.EMAIL_SEND_CONCURRENCY, len(recipients))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(not sent for sent in pool.map(attempt, recipients))
+
+
 class OrganizerService:
     
     def __init__(self, db: Session):
@@ -33,7 +89,6 @@ class OrganizerService:
         self.waitlist_repo = WaitlistRepository(db)
         self.category_repo = CategoryRepository(db)
         self.audit_repo = AuditLogRepository(db)
-        self.user_repo = UserRepository(db)
         self.email_service = EmailService(db)
     
     def _verify_organizer(self, user: User) -> None:
@@ -52,6 +107,21 @@ class OrganizerService:
                 detail="Your organizer account is pending approval"
             )
     
+    def _release_connection(self, event: Event, *instances: Any) -> None:
+        """
+        End the current transaction ahead of slow email sends so the pooled
+        connection isn't held for the SMTP round trips. The event, its
+        organizer (read by the email templates) and instances keep their
+        loaded columns, so reading them afterwards needs no query.
+        """
+        loaded = [event, *instances]
+        if event.organizer is not None:
+            loaded.append(event.organizer)
+        commit_preserving(self.db, *loaded)
+        # Re-resolve the expired relationship from the identity map here, so
+        # email threads reading event.organizer never touch the session
+        event.organizer
+    
     def _verify_event_ownership(self, event: Event, user: User) -> None:
         if user.role == UserRole.ADMIN:
             return
@@ -71,14 +141,15 @@ class OrganizerService:
     ) -> Event:
         self._verify_organizer(organizer)
         
-        category = self.category_repo.get_by_id(event_data.categoryId)
-        if not category:
+        # Only the flag is needed, not the whole category row
+        category_active = self.category_repo.get_is_active(event_data.categoryId)
+        if category_active is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Category with ID '{event_data.categoryId}' not found"
             )
         
-        if not category.is_active:
+        if not category_active:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot create event with inactive category"
@@ -91,7 +162,6 @@ class OrganizerService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid date format. Use YYYY-MM-DD"
             )
-<<<<<<< Updated upstream
 
         # Check for venue conflicts
         conflicting_event = self.event_repo.check_venue_conflict(
@@ -108,9 +178,6 @@ class OrganizerService:
             )
 
         # Create event
-=======
-        
->>>>>>> Stashed changes
         try:
             event = self.event_repo.create(
                 title=event_data.title,
@@ -169,7 +236,6 @@ class OrganizerService:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
     ) -> Event:
-<<<<<<< Updated upstream
         """
         Update an event with complete event data.
 
@@ -188,12 +254,41 @@ class OrganizerService:
         """
         self._verify_organizer(organizer)
 
+        # Validate the request itself before any database work
+        try:
+            event_date = date.fromisoformat(event_data.date)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid date format. Use YYYY-MM-DD"
+            )
+
+        new_status = None
+        if event_data.status is not None:
+            new_status = _EVENT_STATUSES.get(event_data.status.lower())
+            if new_status is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid status. Must be one of: draft, pending, published, cancelled"
+                )
+
+            # Business rule: Organizers can only set status to 'draft' or 'pending'
+            # They cannot directly publish or cancel via update
+            if new_status == EventStatus.CANCELLED:
+                # Use the cancel_event method instead
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Use the cancel endpoint to cancel an event"
+                )
+            if new_status == EventStatus.PUBLISHED and organizer.role != UserRole.ADMIN:
+                # Only admins can publish directly
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Only admins can publish events directly. Set status to 'pending' for admin approval."
+                )
+
         # Get event
-=======
-        self._verify_organizer(organizer)
-        
->>>>>>> Stashed changes
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id(event_id, include_relations=False)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -201,36 +296,21 @@ class OrganizerService:
             )
 
         self._verify_event_ownership(event, organizer)
-<<<<<<< Updated upstream
 
         # Cannot update cancelled events
-=======
-        
->>>>>>> Stashed changes
         if event.status == EventStatus.CANCELLED:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot update a cancelled event"
             )
-<<<<<<< Updated upstream
 
         # Validate category exists
-        category = self.category_repo.get_by_id(event_data.categoryId)
-        if not category:
+        if self.category_repo.get_is_active(event_data.categoryId) is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Category with ID '{event_data.categoryId}' not found"
             )
 
-        # Validate date
-        try:
-            event_date = date.fromisoformat(event_data.date)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid date format. Use YYYY-MM-DD"
-            )
-
         # Check for venue conflicts (exclude current event)
         conflicting_event = self.event_repo.check_venue_conflict(
             venue=event_data.venue,
@@ -246,13 +326,6 @@ class OrganizerService:
                 detail=f"Venue '{event_data.venue}' is already booked on {event_data.date} from {conflicting_event.start_time.strftime('%H:%M')} to {conflicting_event.end_time.strftime('%H:%M')} for event '{conflicting_event.title}'"
             )
 
-        # Cannot reduce capacity below registered count
-        if event_data.capacity < event.registered_count:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot reduce capacity below current registered count ({event.registered_count})"
-            )
-
         # Build update dict with all fields
         update_fields = {
             'title': event_data.title,
@@ -268,60 +341,18 @@ class OrganizerService:
             'tags': event_data.tags if event_data.tags else []
         }
 
-        # Handle status update if provided
-        if event_data.status is not None:
-=======
-        
-        update_fields = {}
-        
-        if event_data.title is not None:
-            update_fields['title'] = event_data.title
-        
-        if event_data.description is not None:
-            update_fields['description'] = event_data.description
-        
-        if event_data.categoryId is not None:
-            category = self.category_repo.get_by_id(event_data.categoryId)
-            if not category:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Category with ID '{event_data.categoryId}' not found"
-                )
-            update_fields['category_id'] = event_data.categoryId
-        
-        if event_data.date is not None:
->>>>>>> Stashed changes
-            try:
-                # Validate and convert status string to EventStatus enum
-                new_status = EventStatus(event_data.status.lower())
-
-                # Business rule: Organizers can only set status to 'draft' or 'pending'
-                # They cannot directly publish or cancel via update
-                if new_status in [EventStatus.DRAFT, EventStatus.PENDING]:
-                    update_fields['status'] = new_status
-                elif new_status == EventStatus.CANCELLED:
-                    # Use the cancel_event method instead
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Use the cancel endpoint to cancel an event"
-                    )
-                elif new_status == EventStatus.PUBLISHED:
-                    # Only admins can publish directly
-                    if organizer.role.value != 'admin':
-                        raise HTTPException(
-                            status_code=status.HTTP_403_FORBIDDEN,
-                            detail="Only admins can publish events directly. Set status to 'pending' for admin approval."
-                        )
-                    update_fields['status'] = new_status
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid status. Must be one of: draft, pending, published, cancelled"
-                )
-<<<<<<< Updated upstream
+        if new_status is not None:
+            update_fields['status'] = new_status
 
-        # Update event
+        # Update event; the capacity guard is checked by the UPDATE itself
+        # so registrations landing meanwhile are counted
+        registered_count = event.registered_count
         event = self.event_repo.update(event, **update_fields)
+        if event is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot reduce capacity below current registered count ({registered_count})"
+            )
 
         # Log audit
         self.audit_repo.create(
@@ -338,52 +369,6 @@ class OrganizerService:
             user_agent=user_agent
         )
 
-=======
-        
-        if event_data.startTime is not None:
-            update_fields['start_time'] = event_data.startTime
-        
-        if event_data.endTime is not None:
-            update_fields['end_time'] = event_data.endTime
-        
-        if event_data.venue is not None:
-            update_fields['venue'] = event_data.venue
-        
-        if event_data.location is not None:
-            update_fields['location'] = event_data.location
-        
-        if event_data.capacity is not None:
-            if event_data.capacity < event.registered_count:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Cannot reduce capacity below current registered count ({event.registered_count})"
-                )
-            update_fields['capacity'] = event_data.capacity
-        
-        if event_data.imageUrl is not None:
-            update_fields['image_url'] = event_data.imageUrl
-        
-        if event_data.tags is not None:
-            update_fields['tags'] = event_data.tags
-        
-        if update_fields:
-            event = self.event_repo.update(event, **update_fields)
-            
-            self.audit_repo.create(
-                action=AuditAction.EVENT_UPDATED,
-                actor_id=organizer.id,
-                actor_name=organizer.name,
-                actor_role=organizer.role.value,
-                target_type=TargetType.EVENT,
-                target_id=event.id,
-                target_name=event.title,
-                details=f"Event '{event.title}' updated",
-                metadata={"updated_fields": list(update_fields.keys())},
-                ip_address=ip_address,
-                user_agent=user_agent
-            )
-        
->>>>>>> Stashed changes
         return event
     
     def cancel_event(
@@ -391,7 +376,8 @@ class OrganizerService:
         event_id: str,
         organizer: User,
         ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> Event:
         """
         Cancel an event.
@@ -401,6 +387,8 @@ class OrganizerService:
             organizer: Current user
             ip_address: Request IP address
             user_agent: Request user agent
+            background_tasks: If given, attendee emails are sent after the
+                response instead of before it
             
         Returns:
             Event: Cancelled event
@@ -411,7 +399,7 @@ class OrganizerService:
         self._verify_organizer(organizer)
         
         # Get event
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id(event_id, include_relations=False)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -448,33 +436,44 @@ class OrganizerService:
             user_agent=user_agent
         )
 
-        # Send cancellation notifications to all registered attendees
+        # Get all confirmed attendees for this event
+        recipients = self.registration_repo.get_event_recipients(event.id)
+        self._release_connection(event)
+
+        # One email per attendee can take minutes on a large event, and
+        # nothing in the response depends on them being sent
+        if background_tasks is not None:
+            background_tasks.add_task(self.notify_event_cancelled, event, recipients)
+        else:
+            self.notify_event_cancelled(event, recipients)
+
+        return event
+    
+    def notify_event_cancelled(
+        self,
+        event: Event,
+        recipients: List[Row]
+    ) -> None:
+        """
+        Send cancellation notifications to the attendees of a cancelled event.
+        
+        recipients are RegistrationRepository.get_event_recipients rows.
+        Failures are logged and never raised; the cancellation has already
+        been committed.
+        """
         try:
-            # Get all confirmed registrations for this event
-            registrations = self.registration_repo.get_event_registrations(
-                event_id=event.id,
-                status=RegistrationStatus.CONFIRMED
+            failed_count = _send_concurrently(
+                lambda recipient: self.email_service.send_event_cancellation_to_attendees(
+                    attendee=recipient,
+                    event=event
+                ),
+                recipients
             )
 
-            # Send email to each attendee
-            for registration in registrations:
-                user = self.user_repo.get_by_id(registration.user_id)
-                if user:
-                    try:
-                        self.email_service.send_event_cancellation_to_attendees(
-                            attendee=user,
-                            event=event
-                        )
-                    except Exception as email_error:
-                        # Log but don't fail the cancellation
-                        logger.warning(f"Failed to send cancellation email to {user.email}: {str(email_error)}")
-
-            logger.info(f"Sent cancellation notifications to {len(registrations)} attendees for event {event.id}")
+            logger.info(f"Sent cancellation notifications to {len(recipients) - failed_count}/{len(recipients)} attendees for event {event.id}")
         except Exception as e:
             # Log error but don't fail the cancellation
             logger.error(f"Error sending cancellation notifications: {str(e)}")
-
-        return event
     
     def duplicate_event(
         self,
@@ -501,7 +500,7 @@ class OrganizerService:
         self._verify_organizer(organizer)
         
         # Get original event
-        original = self.event_repo.get_by_id(event_id)
+        original = self.event_repo.get_by_id(event_id, include_relations=False)
         if not original:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -510,25 +509,9 @@ class OrganizerService:
         
         self._verify_event_ownership(original, organizer)
         
-        # Create duplicate with modified title
-        new_title = f"{original.title} (Copy)"
-        
-        # Create new event
-        new_event = self.event_repo.create(
-            title=new_title,
-            description=original.description,
-            category_id=original.category_id,
-            organizer_id=organizer.id,
-            event_date=original.date,
-            start_time=original.start_time.strftime("%H:%M") if original.start_time else "09:00",
-            end_time=original.end_time.strftime("%H:%M") if original.end_time else "17:00",
-            venue=original.venue,
-            location=original.location,
-            capacity=original.capacity,
-            image_url=original.image_url,
-            tags=original.tags if original.tags else [],
-            status=EventStatus.DRAFT  # Duplicates start as draft
-        )
+        # Copy the row in the database as a draft with " (Copy)" appended
+        # to the title
+        new_event = self.event_repo.duplicate(original, organizer_id=organizer.id)
         
         # Log audit
         self.audit_repo.create(
@@ -576,8 +559,10 @@ class OrganizerService:
         self,
         event_id: str,
         organizer: User,
-        check_in_filter: Optional[str] = None
-    ) -> Tuple[List[Dict], Dict[str, Any]]:
+        check_in_filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Dict[str, Any], Optional[str]]:
         """
         Get attendees for an event.
         
@@ -585,17 +570,20 @@ class OrganizerService:
             event_id: Event ID
             organizer: Current user
             check_in_filter: Filter by check-in status ('checked_in', 'not_checked_in')
+            limit: Page size; all attendees are returned when omitted
+            cursor: Cursor from a previous page
             
         Returns:
-            Tuple[List[Dict], Dict]: List of attendees and statistics
+            Tuple[List[Dict], Dict, Optional[str]]: Attendees, statistics for
+            every matching attendee (not just this page) and the next cursor
             
         Raises:
-            HTTPException: If event not found
+            HTTPException: If event not found or the cursor is invalid
         """
         self._verify_organizer(organizer)
         
         # Get event
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id(event_id, include_relations=False)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -612,60 +600,66 @@ class OrganizerService:
             elif check_in_filter == "not_checked_in":
                 check_in_status = CheckInStatus.NOT_CHECKED_IN
         
-        registrations = self.registration_repo.get_event_registrations(
+        try:
+            rows, next_cursor = self.registration_repo.get_event_attendees_flat(
+                event_id=event_id,
+                check_in_status=check_in_status,
+                limit=limit,
+                cursor=cursor
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+        
+        # Build attendee list (datetimes are left for the JSON encoder)
+        attendees = [
+            {
+                "id": row.user_id,
+                "registrationId": row.registration_id,
+                "name": row.name,
+                "email": row.email,
+                "registeredAt": row.registered_at,
+                "checkInStatus": row.check_in_status.value,
+                "checkedInAt": row.checked_in_at,
+                "guests": row.guests if row.guests else []
+            }
+            for row in rows
+        ]
+        
+        # Statistics are aggregated in SQL so they cover every page
+        stats = self.registration_repo.get_event_attendee_stats(
             event_id=event_id,
-            status=RegistrationStatus.CONFIRMED,
             check_in_status=check_in_status
         )
-        
-        # Build attendee list
-        attendees = []
-        checked_in_count = 0
-        total_attendees = 0  # Including guests
-        
-        for reg in registrations:
-            if reg.check_in_status == CheckInStatus.CHECKED_IN:
-                checked_in_count += 1
-            
-            guest_count = len(reg.guests) if reg.guests else 0
-            total_attendees += 1 + guest_count
-            
-            attendees.append({
-                "id": reg.user.id if reg.user else None,
-                "registrationId": reg.id,
-                "name": reg.user.name if reg.user else "Unknown",
-                "email": reg.user.email if reg.user else "Unknown",
-                "registeredAt": reg.registered_at.isoformat() if reg.registered_at else None,
-                "checkInStatus": reg.check_in_status.value,
-                "checkedInAt": reg.checked_in_at.isoformat() if reg.checked_in_at else None,
-                "guests": reg.guests if reg.guests else []
-            })
-        
-        # Calculate statistics
         statistics = {
-            "totalRegistrations": len(registrations),
-            "checkedIn": checked_in_count,
-            "notCheckedIn": len(registrations) - checked_in_count,
-            "totalAttendees": total_attendees,
+            "totalRegistrations": stats.registrations,
+            "checkedIn": stats.checked_in,
+            "notCheckedIn": stats.registrations - stats.checked_in,
+            "totalAttendees": stats.registrations + stats.guests,
             "capacityUsed": f"{(event.registered_count / event.capacity * 100):.1f}%" if event.capacity > 0 else "0%"
         }
         
-        return attendees, statistics
+        return attendees, statistics, next_cursor
     
     def export_attendees_csv(
         self,
         event_id: str,
         organizer: User
-    ) -> str:
+    ) -> Iterator[str]:
         """
         Export attendees as CSV.
         
+        Access is checked up front; rows are then streamed from the
+        database in batches so large events aren't held in memory.
+        
         Args:
             event_id: Event ID
             organizer: Current user
             
         Returns:
-            str: CSV content
+            Iterator[str]: CSV content in chunks
             
         Raises:
             HTTPException: If event not found
@@ -673,7 +667,7 @@ class OrganizerService:
         self._verify_organizer(organizer)
         
         # Get event
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id(event_id, include_relations=False)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -682,43 +676,31 @@ class OrganizerService:
         
         self._verify_event_ownership(event, organizer)
         
-        # Get registrations
-        registrations = self.registration_repo.get_event_registrations(
-            event_id=event_id,
-            status=RegistrationStatus.CONFIRMED
-        )
+        # Stream attendees as flat rows; no ORM objects per registration
+        rows = self.registration_repo.iter_event_attendees_flat(event_id=event_id)
         
-        # Create CSV
+        return self._attendee_csv_chunks(rows)
+    
+    @staticmethod
+    def _attendee_csv_chunks(
+        rows: Iterator[Row],
+        rows_per_chunk: int = 500
+    ) -> Iterator[str]:
         output = io.StringIO()
         writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            "Name",
-            "Email",
-            "Registration Date",
-            "Ticket Code",
-            "Check-in Status",
-            "Checked-in At",
-            "Guest Count",
-            "Guest Names"
-        ])
-        
-        # Data rows
-        for reg in registrations:
-            guest_names = ", ".join([g.get("name", "") for g in (reg.guests or [])])
-            writer.writerow([
-                reg.user.name if reg.user else "Unknown",
-                reg.user.email if reg.user else "Unknown",
-                reg.registered_at.isoformat() if reg.registered_at else "",
-                reg.ticket_code,
-                reg.check_in_status.value,
-                reg.checked_in_at.isoformat() if reg.checked_in_at else "",
-                len(reg.guests) if reg.guests else 0,
-                guest_names
-            ])
-        
-        return output.getvalue()
+        writer.writerow(_ATTENDEE_CSV_HEADER)
+        
+        # Data rows, written rows_per_chunk at a time by writerows; the first
+        # chunk carries the header
+        records = map(_attendee_csv_record, rows)
+        while True:
+            writer.writerows(islice(records, rows_per_chunk))
+            chunk = output.getvalue()
+            if not chunk:
+                return
+            yield chunk
+            output.seek(0)
+            output.truncate(0)
     
     def check_in_attendee(
         self,
@@ -730,7 +712,7 @@ class OrganizerService:
     ) -> Registration:
         self._verify_organizer(organizer)
         
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id(event_id, include_relations=False)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -739,32 +721,11 @@ class OrganizerService:
         
         self._verify_event_ownership(event, organizer)
         
-        registration = self.registration_repo.get_by_id(registration_id)
-        if not registration:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Registration not found"
-            )
-        
-        if registration.event_id != event_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Registration does not belong to this event"
-            )
-        
-        if registration.status != RegistrationStatus.CONFIRMED:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot check-in a cancelled registration"
-            )
-        
-        if registration.check_in_status == CheckInStatus.CHECKED_IN:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Attendee is already checked in"
-            )
-        
-        registration = self.registration_repo.check_in(registration)
+        # The eligibility rules are checked by the UPDATE itself; the
+        # registration is only read back to explain a refusal
+        registration = self.registration_repo.try_check_in(registration_id, event_id)
+        if registration is None:
+            self._raise_check_in_refused(registration_id, event_id)
         
         self.audit_repo.create(
             action=AuditAction.ATTENDEE_CHECKED_IN,
@@ -785,6 +746,31 @@ class OrganizerService:
         
         return registration
     
+    def _raise_check_in_refused(self, registration_id: str, event_id: str) -> None:
+        registration = self.registration_repo.get_by_id(registration_id, include_relations=False)
+        if not registration:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Registration not found"
+            )
+        
+        if registration.event_id != event_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Registration does not belong to this event"
+            )
+        
+        if registration.status != RegistrationStatus.CONFIRMED:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot check-in a cancelled registration"
+            )
+        
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Attendee is already checked in"
+        )
+    
     def send_announcement(
         self,
         event_id: str,
@@ -796,7 +782,7 @@ class OrganizerService:
     ) -> Dict[str, Any]:            
         self._verify_organizer(organizer)
         
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id(event_id, include_relations=False)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -805,11 +791,6 @@ class OrganizerService:
         
         self._verify_event_ownership(event, organizer)
         
-        registrations = self.registration_repo.get_event_registrations(
-            event_id=event_id,
-            status=RegistrationStatus.CONFIRMED
-        )
-        
         today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         today_announcements = self.audit_repo.count_by_action_and_actor(
             action=AuditAction.EVENT_UPDATED,
@@ -823,29 +804,27 @@ class OrganizerService:
                 detail="Daily announcement limit reached (10 per day). Please try again tomorrow."
             )
 
-        recipient_count = len(registrations)
-        for reg in registrations:
-            if reg.guests:
-                recipient_count += len([g for g in reg.guests if g.get("email")])
-
-        sent_count = 0
-        failed_count = 0
-
-        for registration in registrations:
-            user = self.user_repo.get_by_id(registration.user_id)
-            if user:
-                try:
-                    self.email_service.send_announcement(
-                        attendee=user,
-                        event=event,
-                        subject_text=subject,
-                        message=message,
-                        registration=registration
-                    )
-                    sent_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to send announcement to {user.email}: {str(e)}")
-                    failed_count += 1
+        # Recipients are plain rows, counted as they are sent, so the
+        # transaction can end before the first email goes out
+        recipients = self.registration_repo.get_event_recipients(event_id)
+        self._release_connection(event, organizer)
+
+        recipient_count = sum(
+            1 + len([g for g in recipient.guests or [] if g.get("email")])
+            for recipient in recipients
+        )
+
+        failed_count = _send_concurrently(
+            lambda recipient: self.email_service.send_announcement(
+                attendee=recipient,
+                event=event,
+                subject_text=subject,
+                message=message,
+                registration=recipient
+            ),
+            recipients
+        )
+        sent_count = len(recipients) - failed_count
 
         logger.info(f"Sent announcement to {sent_count}/{recipient_count} attendees for event {event.id}")
 
@@ -864,8 +843,12 @@ class OrganizerService:
                 "type": "announcement"
             },
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            commit=False
         )
+        # Written in this session, never batched: the daily limit above
+        # counts these entries
+        self.db.commit()
 
         return {
             "success": True,
@@ -881,7 +864,7 @@ class OrganizerService:
     ) -> List[Dict]:
         self._verify_organizer(organizer)
         
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id(event_id, include_relations=False)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -892,18 +875,17 @@ class OrganizerService:
         
         waitlist = self.waitlist_repo.get_event_waitlist(event_id)
         
-        waitlist_entries = []
-        for entry in waitlist:
-            waitlist_entries.append({
+        return [
+            {
                 "id": entry.id,
                 "userId": entry.user_id,
                 "position": entry.position,
-                "name": entry.user.name if entry.user else "Unknown",
-                "email": entry.user.email if entry.user else "Unknown",
+                "name": entry.user.name,
+                "email": entry.user.email,
                 "joinedAt": entry.joined_at.isoformat() if entry.joined_at else None,
                 "notificationPreference": entry.notification_preference.value
-            })
-        
-        return waitlist_entries
+            }
+            for entry in waitlist
+        ]
 
 
@@ -1,17 +1,20 @@
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status
-from typing import Tuple
+from sqlalchemy.exc import IntegrityError
+from fastapi import BackgroundTasks, HTTPException, status
+from typing import Callable, Optional, Tuple
 from datetime import date
 import time
 import uuid
 
+from app.core.database import commit_preserving
 from app.repositories.registration_repository import RegistrationRepository
 from app.repositories.event_repository import EventRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.audit_log_repository import AuditLogRepository
 from app.repositories.waitlist_repository import WaitlistRepository
 from app.models.registration import Registration, RegistrationStatus
-from app.models.event import Event, EventStatus
+from app.models.event import EventStatus
+from app.models.user import User
 from app.models.audit_log import AuditAction, TargetType
 from app.models.waitlist import WaitlistEntry, NotificationPreference
 from app.schemas.registration import RegistrationCreate
@@ -20,6 +23,9 @@ from app.utils.qr_generator import generate_qr_code, generate_ticket_code
 from app.utils.email_service import EmailService
 
 
+_UMD_SUFFIXES = ('@umd.edu', '@terpmail.umd.edu')
+
+
 class RegistrationService:
 
     def __init__(self, db: Session):
@@ -31,14 +37,42 @@ class RegistrationService:
         self.waitlist_repo = WaitlistRepository(db)
         self.email_service = EmailService(db)
 
+    def _dispatch_email(
+        self,
+        background_tasks: Optional[BackgroundTasks],
+        send: Callable[..., bool],
+        **kwargs
+    ) -> None:
+        """
+        Send an email after the response if background_tasks is given,
+        otherwise right away. SMTP round-trips take hundreds of ms and
+        nothing in the response depends on them.
+        """
+        if background_tasks is not None:
+            background_tasks.add_task(self._send_email, send, **kwargs)
+        else:
+            self._send_email(send, **kwargs)
+
+    @staticmethod
+    def _send_email(send: Callable[..., bool], **kwargs) -> None:
+        # The change being announced is already committed, so a failed
+        # email is reported but never raised
+        try:
+            send(**kwargs)
+        except Exception as e:
+            print(f"Warning: Failed to send email ({send.__name__}): {str(e)}")
+
     def create_registration(
         self,
         user_id: str,
-        registration_data: RegistrationCreate
+        registration_data: RegistrationCreate,
+        background_tasks: Optional[BackgroundTasks] = None,
+        user: Optional[User] = None
     ) -> Registration:
-        event = self.db.query(Event).filter(
-            Event.id == registration_data.eventId
-        ).with_for_update().first()
+        # The row lock is held until the registration and the counter
+        # increment commit together, so concurrent requests can't both pass
+        # the capacity check below.
+        event = self.event_repo.get_by_id_for_update(registration_data.eventId)
 
         if not event:
             raise HTTPException(
@@ -75,46 +109,43 @@ class RegistrationService:
                 detail="Maximum 2 guests allowed per registration"
             )
 
-        for guest in guests:
-            guest_email_lower = guest.email.lower()
-            if not (guest_email_lower.endswith('@umd.edu') or guest_email_lower.endswith('@terpmail.umd.edu')):
+        # Lowercased once; reused for the domain, duplicate and conflict checks
+        guest_emails = [g.email.lower() for g in guests]
+        for guest, guest_email in zip(guests, guest_emails):
+            if not guest_email.endswith(_UMD_SUFFIXES):
                 raise HTTPException(
                     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                     detail=f"Guest email {guest.email} must be a valid UMD email (@umd.edu or @terpmail.umd.edu)"
                 )
 
-        guest_emails = [g.email.lower() for g in guests]
         if len(guest_emails) != len(set(guest_emails)):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Duplicate guest emails are not allowed"
             )
 
-        for guest in guests:
-            guest_user = self.user_repo.get_by_email(guest.email)
-            if guest_user:
-                guest_registration = self.registration_repo.get_by_user_and_event(
-                    user_id=guest_user.id,
-                    event_id=registration_data.eventId
-                )
-                if guest_registration and guest_registration.status == RegistrationStatus.CONFIRMED:
+        if guest_emails:
+            # Two membership queries for all guests: which are already primary
+            # attendees, and which are already guests of another attendee
+            registered_emails = self.registration_repo.get_registered_emails(
+                event_id=registration_data.eventId,
+                emails=guest_emails
+            )
+            taken_guest_emails = self.registration_repo.get_guest_emails(
+                event_id=registration_data.eventId,
+                emails=guest_emails
+            )
+            for guest, guest_email in zip(guests, guest_emails):
+                if guest_email in registered_emails:
                     raise HTTPException(
                         status_code=status.HTTP_409_CONFLICT,
                         detail=f"Guest {guest.email} is already registered for this event as a primary attendee"
                     )
-
-            all_event_registrations = self.registration_repo.get_event_registrations(
-                event_id=registration_data.eventId,
-                status=RegistrationStatus.CONFIRMED
-            )
-            for reg in all_event_registrations:
-                if reg.guests:
-                    guest_emails_in_reg = [g.get('email', '').lower() for g in reg.guests]
-                    if guest.email.lower() in guest_emails_in_reg:
-                        raise HTTPException(
-                            status_code=status.HTTP_409_CONFLICT,
-                            detail=f"Guest {guest.email} is already registered for this event as a guest of another attendee"
-                        )
+                if guest_email in taken_guest_emails:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail=f"Guest {guest.email} is already registered for this event as a guest of another attendee"
+                    )
 
         total_attendees_needed = 1 + len(guests)
         remaining_capacity = event.capacity - event.registered_count
@@ -138,42 +169,42 @@ class RegistrationService:
         timestamp = int(time.time())
         ticket_code = generate_ticket_code(timestamp, event.id)
 
-        # Ensure ticket code is unique (very unlikely collision, but check anyway)
-        existing_ticket = self.db.query(Registration).filter(
-            Registration.ticket_code == ticket_code
-        ).first()
-        if existing_ticket:
-            # Add milliseconds to make it unique
-            ticket_code = f"{ticket_code}-{uuid.uuid4().hex[:4]}"
-
-        # Generate QR code from ticket code
-        qr_code = generate_qr_code(ticket_code)
-
         guests_data = [{"name": g.name, "email": g.email} for g in guests] if guests else []
 
-        registration = self.registration_repo.create(
-            user_id=user_id,
-            event_id=registration_data.eventId,
-            ticket_code=ticket_code,
-            qr_code=qr_code,
-            guests=guests_data,
-            sessions=registration_data.sessions or []
-        )
-
-        event.registered_count += total_attendees_needed
-        self.event_repo.update(event)
-
-        user = self.user_repo.get_by_id(user_id)
-
+        # ticket_code is UNIQUE, and two registrations for the same event in
+        # the same second get the same code. Rather than SELECT first on
+        # every registration, insert in a savepoint and retry once with a
+        # random suffix if the code is taken.
         try:
-            self.email_service.send_registration_confirmation(
-                user=user,
-                event=event,
-                registration=registration
+            with self.db.begin_nested():
+                registration = self.registration_repo.create(
+                    user_id=user_id,
+                    event_id=registration_data.eventId,
+                    ticket_code=ticket_code,
+                    qr_code=generate_qr_code(ticket_code),
+                    guests=guests_data,
+                    sessions=registration_data.sessions or [],
+                    commit=False
+                )
+        except IntegrityError:
+            ticket_code = f"{ticket_code}-{uuid.uuid4().hex[:4]}"
+            registration = self.registration_repo.create(
+                user_id=user_id,
+                event_id=registration_data.eventId,
+                ticket_code=ticket_code,
+                qr_code=generate_qr_code(ticket_code),
+                guests=guests_data,
+                sessions=registration_data.sessions or [],
+                commit=False
             )
-        except Exception as e:
-            print(f"Warning: Failed to send confirmation email: {str(e)}")
+        self.event_repo.increment_registered_count(event, total_attendees_needed, commit=False)
 
+        # Routes pass the authenticated user they already loaded
+        if user is None:
+            user = self.user_repo.get_by_id(user_id)
+
+        # The registration, counter increment and audit entry are written by
+        # one commit
         guests_info = f" with {len(guests)} guest(s)" if guests else ""
         self.audit_repo.create(
             action=AuditAction.REGISTRATION_CREATED,
@@ -185,12 +216,18 @@ class RegistrationService:
             target_name=event.title,
             details=f"User {user.name} registered for {event.title}{guests_info}",
             ip_address=None,
-            user_agent=None
+            user_agent=None,
+            commit=False
+        )
+        commit_preserving(self.db, registration, event, user)
+
+        self._dispatch_email(
+            background_tasks,
+            self.email_service.send_registration_confirmation,
+            user=user,
+            event=event,
+            registration=registration
         )
-
-        self.db.commit()
-
-        self.db.refresh(registration)
 
         return registration
 
@@ -216,7 +253,8 @@ class RegistrationService:
     def cancel_registration(
         self,
         registration_id: str,
-        user_id: str
+        user_id: str,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> Registration:
         registration = self.registration_repo.get_by_id(registration_id, include_relations=True)
 
@@ -241,24 +279,18 @@ class RegistrationService:
         guests_count = len(registration.guests) if registration.guests else 0
         total_attendees = 1 + guests_count
 
-        cancelled_registration = self.registration_repo.cancel(registration)
-
-        event = self.event_repo.get_by_id(registration.event_id)
-        if event:
-            event.registered_count -= total_attendees
-            if event.registered_count < 0:
-                event.registered_count = 0
-            self.event_repo.update(event)
-
-        user = self.user_repo.get_by_id(user_id)
-        try:
-            self.email_service.send_cancellation_confirmation(
-                user=user,
-                event=event,
-                registration=cancelled_registration
+        # The event and user were loaded with the registration; cancelling,
+        # the counter decrement and the audit entry commit together
+        event = registration.event
+        user = registration.user
+        cancelled_registration = self.registration_repo.cancel(registration, commit=False)
+        if cancelled_registration is None:
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Registration is already cancelled"
             )
-        except Exception as e:
-            print(f"Warning: Failed to send cancellation email: {str(e)}")
+        self.event_repo.decrement_registered_count(event, total_attendees, commit=False)
 
         self.audit_repo.create(
             action=AuditAction.REGISTRATION_CANCELLED,
@@ -270,19 +302,32 @@ class RegistrationService:
             target_name=event.title if event else "Unknown Event",
             details=f"User {user.name} cancelled registration for {event.title if event else 'event'}. Freed {total_attendees} spot(s).",
             ip_address=None,
-            user_agent=None
+            user_agent=None,
+            commit=False
         )
+        commit_preserving(self.db, cancelled_registration, event, user)
 
         try:
-            promoted = self.promote_from_waitlist(event.id)
+            promoted = self.promote_from_waitlist(event.id, background_tasks)
             if promoted:
                 print(f"Successfully promoted someone from waitlist for event {event.title}")
         except Exception as e:
+            # The cancellation is already committed; drop the half-done
+            # promotion so the popped waitlist entry isn't committed below
+            self.db.rollback()
             print(f"Warning: Failed to promote from waitlist: {str(e)}")
 
         self.db.commit()
         self.db.refresh(cancelled_registration)
 
+        self._dispatch_email(
+            background_tasks,
+            self.email_service.send_cancellation_confirmation,
+            user=user,
+            event=event,
+            registration=cancelled_registration
+        )
+
         return cancelled_registration
 
     def join_waitlist(
@@ -290,7 +335,7 @@ class RegistrationService:
         user_id: str,
         waitlist_data: WaitlistCreate
     ) -> WaitlistEntry:
-        event = self.event_repo.get_by_id(waitlist_data.eventId)
+        event = self.event_repo.get_by_id(waitlist_data.eventId, include_relations=False)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -343,8 +388,7 @@ class RegistrationService:
             notification_preference=notification_pref
         )
 
-        event.waitlist_count += 1
-        self.event_repo.update(event)
+        self.event_repo.increment_waitlist_count(event)
 
         user = self.user_repo.get_by_id(user_id)
         try:
@@ -396,15 +440,13 @@ class RegistrationService:
                 detail="You can only remove your own waitlist entries"
             )
 
-        event = self.event_repo.get_by_id(waitlist_entry.event_id)
+        # Loaded with the entry
+        event = waitlist_entry.event
 
         self.waitlist_repo.remove(waitlist_entry)
 
         if event:
-            event.waitlist_count -= 1
-            if event.waitlist_count < 0:
-                event.waitlist_count = 0
-            self.event_repo.update(event)
+            self.event_repo.decrement_waitlist_count(event)
 
         user = self.user_repo.get_by_id(user_id)
         self.audit_repo.create(
@@ -424,16 +466,25 @@ class RegistrationService:
 
         return waitlist_entry
 
-    def promote_from_waitlist(self, event_id: str) -> bool:
-        waitlist_entry = self.waitlist_repo.get_first_in_line(event_id)
+    def promote_from_waitlist(
+        self,
+        event_id: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> bool:
+        # The entry is deleted in this transaction and only committed together
+        # with the registration below; any failure before that rolls it back.
+        waitlist_entry = self.waitlist_repo.pop_first(event_id)
 
         if not waitlist_entry:
             return False
 
-        event = self.event_repo.get_by_id(event_id)
+        old_position = waitlist_entry.position
+
+        event = self.event_repo.get_by_id(event_id, include_relations=False)
         user = self.user_repo.get_by_id(waitlist_entry.user_id)
 
         if not event or not user:
+            self.db.rollback()
             return False
 
         existing_registration = self.registration_repo.get_by_user_and_event(
@@ -441,12 +492,8 @@ class RegistrationService:
             event_id=event_id
         )
         if existing_registration and existing_registration.status == RegistrationStatus.CONFIRMED:
-            self.waitlist_repo.remove(waitlist_entry)
-            event.waitlist_count -= 1
-            if event.waitlist_count < 0:
-                event.waitlist_count = 0
-            self.event_repo.update(event)
-            self.db.commit()
+            # Already registered: drop the stale entry (committed with the counter)
+            self.event_repo.decrement_waitlist_count(event)
             return False
 
         timestamp = int(time.time())
@@ -469,26 +516,17 @@ class RegistrationService:
             sessions=[]
         )
 
-        event.registered_count += 1
-        self.event_repo.update(event)
+        self.event_repo.increment_registered_count(event)
+        self.event_repo.decrement_waitlist_count(event)
 
-        old_position = waitlist_entry.position
-        try:
-            self.email_service.send_waitlist_promotion(
-                user=user,
-                event=event,
-                registration=registration,
-                old_position=old_position
-            )
-        except Exception as e:
-            print(f"Warning: Failed to send waitlist promotion email: {str(e)}")
-
-        self.waitlist_repo.remove(waitlist_entry)
-
-        event.waitlist_count -= 1
-        if event.waitlist_count < 0:
-            event.waitlist_count = 0
-        self.event_repo.update(event)
+        self._dispatch_email(
+            background_tasks,
+            self.email_service.send_waitlist_promotion,
+            user=user,
+            event=event,
+            registration=registration,
+            old_position=old_position
+        )
 
         self.audit_repo.create(
             action=AuditAction.WAITLIST_PROMOTED,
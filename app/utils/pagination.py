@@ -0,0 +1,48 @@
+import base64
+from typing import Any, List
+
+
+CURSOR_SEPARATOR = "|"
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        *values: Sort key values (dates/times/datetimes are ISO formatted)
+
+    Returns:
+        str: URL-safe base64 cursor
+    """
+    raw = CURSOR_SEPARATOR.join(
+        value.isoformat() if hasattr(value, "isoformat") else str(value)
+        for value in values
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, parts: int) -> List[str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor from a previous page
+        parts: Number of sort key values expected in the cursor
+
+    Returns:
+        List[str]: Raw sort key values, in the order they were encoded
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid pagination cursor")
+
+    values = raw.split(CURSOR_SEPARATOR, parts - 1)
+    if len(values) != parts:
+        raise ValueError("Invalid pagination cursor")
+
+    return values
@@ -4,13 +4,15 @@ Initializes the application, configures middleware, and includes routers.
 """
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import engine, Base, SessionLocal, warm_pool, check_pool_budget
 from app.api import api_router
+from app.repositories.audit_log_repository import shutdown_audit_log_batchers
+from app.repositories import category_cache
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +28,7 @@ app = FastAPI(
     description="Event management system for University of Maryland students",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -108,12 +111,25 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to create database tables: {str(e)}")
         raise
+    
+    warm_pool()
+    check_pool_budget()
+    
+    # Category filters on the events list resolve slugs from memory
+    db = SessionLocal()
+    try:
+        category_cache.warm(db)
+    finally:
+        db.close()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    
+    # Write out any audit log entries still buffered in memory
+    shutdown_audit_log_batchers()
 
 
 # Include API routers
@@ -1,6 +1,13 @@
 """
 Pytest configuration file.
 """
+import os
+
+# Write audit logs synchronously so tests see them on the test session
+os.environ.setdefault("AUDIT_LOG_BATCHING", "false")
+# Fail loudly on accidental relationship lazy loads in list queries
+os.environ.setdefault("STRICT_ORM_LOADING", "true")
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -8,6 +15,10 @@ from sqlalchemy.orm import sessionmaker
 from app.core.database import Base, get_db
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
+from app.repositories.category_repository import clear_category_cache
+from app.repositories.venue_repository import clear_venue_cache
+from app.repositories.event_count_cache import clear_event_count_cache
+from app.repositories.organizer_stats_cache import clear_organizer_stats_cache
 from main import app
 import uuid
 
@@ -38,6 +49,10 @@ def db():
     yield db
     db.close()
     Base.metadata.drop_all(bind=engine)
+    clear_category_cache()
+    clear_venue_cache()
+    clear_event_count_cache()
+    clear_organizer_stats_cache()
 
 
 @pytest.fixture(scope="function")
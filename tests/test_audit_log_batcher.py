@@ -0,0 +1,113 @@
+"""
+Tests for the background audit log batcher.
+"""
+import pytest
+import time
+from datetime import datetime, timezone
+from sqlalchemy import func, select
+from app.models.audit_log import AuditLog, AuditAction, TargetType
+from app.core.config import settings
+from app.repositories import audit_log_repository
+from app.repositories.audit_log_repository import AuditLogBatcher, AuditLogRepository
+
+
+def _row(details: str) -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc),
+        "action": AuditAction.EVENT_UPDATED,
+        "actor_id": None,
+        "actor_name": "Test Organizer",
+        "actor_role": "organizer",
+        "target_type": TargetType.EVENT,
+        "target_id": None,
+        "target_name": "Hack Night",
+        "details": details,
+        "extra_metadata": None,
+        "ip_address": None,
+        "user_agent": None,
+    }
+
+
+def _count(engine) -> int:
+    with engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(AuditLog)).scalar_one()
+
+
+def _wait_for_count(engine, expected: int, timeout: float = 5.0) -> int:
+    deadline = time.monotonic() + timeout
+    count = _count(engine)
+    while count < expected and time.monotonic() < deadline:
+        time.sleep(0.02)
+        count = _count(engine)
+    return count
+
+
+@pytest.fixture
+def engine(db):
+    """The test engine, with the schema created by the db fixture."""
+    return db.get_bind()
+
+
+def test_flushes_when_batch_is_full(engine):
+    """A full batch is written without waiting for the flush interval."""
+    batcher = AuditLogBatcher(engine, batch_size=3, flush_interval=60)
+    try:
+        for i in range(3):
+            batcher.enqueue(_row(f"entry {i}"))
+
+        assert _wait_for_count(engine, 3) == 3
+    finally:
+        batcher.stop()
+
+
+def test_flushes_partial_batch_after_interval(engine):
+    """A partial batch is written once the flush interval has passed."""
+    batcher = AuditLogBatcher(engine, batch_size=500, flush_interval=0.05)
+    try:
+        batcher.enqueue(_row("only entry"))
+
+        assert _wait_for_count(engine, 1) == 1
+    finally:
+        batcher.stop()
+
+
+def test_stop_flushes_queued_rows(engine):
+    """stop() writes rows still queued before returning."""
+    batcher = AuditLogBatcher(engine, batch_size=500, flush_interval=60)
+    batcher.enqueue(_row("first"))
+    batcher.enqueue(_row("second"))
+
+    batcher.stop()
+
+    assert _count(engine) == 2
+    with engine.connect() as connection:
+        ids = connection.execute(select(AuditLog.id)).scalars().all()
+    assert all(ids)
+
+
+def test_uncommitted_entry_skips_batcher(db, engine, monkeypatch):
+    """commit=False stages the entry on the session even with batching on."""
+    monkeypatch.setattr(settings, "AUDIT_LOG_BATCHING", True)
+
+    def no_batcher(engine):
+        raise AssertionError("commit=False must not use the batcher")
+
+    monkeypatch.setattr(audit_log_repository, "get_audit_log_batcher", no_batcher)
+
+    log = AuditLogRepository(db).create(
+        action=AuditAction.REGISTRATION_CREATED,
+        details="staged",
+        commit=False
+    )
+    assert log in db
+
+    db.rollback()
+    assert _count(engine) == 0
+
+    AuditLogRepository(db).create(
+        action=AuditAction.REGISTRATION_CREATED,
+        details="committed with the caller",
+        commit=False
+    )
+    db.commit()
+    assert _count(engine) == 1
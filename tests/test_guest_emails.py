@@ -0,0 +1,65 @@
+"""
+Tests for the guest conflict lookups used at registration.
+"""
+import uuid
+from datetime import date, time
+from app.models.category import Category
+from app.models.event import Event, EventStatus
+from app.models.registration import Registration, RegistrationStatus
+from app.repositories.registration_repository import RegistrationRepository
+
+
+def test_get_guest_emails_matches_in_database(db, sample_organizer, sample_student, sample_admin):
+    """Test only requested guest emails on confirmed registrations are returned."""
+    category = Category(
+        id=str(uuid.uuid4()),
+        name="Technology",
+        slug="technology",
+        color="blue",
+        is_active=True
+    )
+    event = Event(
+        id=str(uuid.uuid4()),
+        title="Hack Night",
+        description="Build things",
+        category_id=category.id,
+        organizer_id=sample_organizer.id,
+        date=date(2030, 1, 15),
+        start_time=time(18, 0),
+        end_time=time(21, 0),
+        venue="Iribe Center",
+        location="Room 0318",
+        capacity=50,
+        registered_count=4,
+        waitlist_count=0,
+        status=EventStatus.PUBLISHED,
+        is_featured=False
+    )
+    confirmed = Registration(
+        id=str(uuid.uuid4()),
+        user_id=sample_student.id,
+        event_id=event.id,
+        status=RegistrationStatus.CONFIRMED,
+        ticket_code="TKT-TEST-0001",
+        guests=[
+            {"name": "Guest One", "email": "Guest.One@umd.edu"},
+            {"name": "Guest Two", "email": "guest.two@umd.edu"}
+        ]
+    )
+    cancelled = Registration(
+        id=str(uuid.uuid4()),
+        user_id=sample_admin.id,
+        event_id=event.id,
+        status=RegistrationStatus.CANCELLED,
+        ticket_code="TKT-TEST-0002",
+        guests=[{"name": "Guest Three", "email": "guest.three@umd.edu"}]
+    )
+    db.add_all([category, event, confirmed, cancelled])
+    db.commit()
+
+    taken = RegistrationRepository(db).get_guest_emails(
+        event_id=event.id,
+        emails=["guest.one@umd.edu", "guest.three@umd.edu", "nobody@umd.edu"]
+    )
+
+    assert taken == {"guest.one@umd.edu"}
@@ -0,0 +1,137 @@
+"""
+Tests for strict relationship loading in repository list queries.
+"""
+import pytest
+import uuid
+from datetime import date, time
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from app.core.database import strict_loading
+from app.models.category import Category
+from app.models.event import Event, EventStatus
+from app.models.organizer_approval import OrganizerApprovalRequest, ApprovalStatus
+from app.models.registration import Registration, RegistrationStatus
+from app.models.user import User
+from app.repositories.event_repository import EventRepository
+from app.repositories.organizer_approval_repository import OrganizerApprovalRepository
+from app.repositories.registration_repository import RegistrationRepository
+
+
+@pytest.fixture
+def pending_approval(db, sample_student):
+    """Create a pending organizer approval request."""
+    request = OrganizerApprovalRequest(
+        id=str(uuid.uuid4()),
+        user_id=sample_student.id,
+        reason="I run the robotics club",
+        status=ApprovalStatus.PENDING
+    )
+    db.add(request)
+    db.commit()
+    db.expunge_all()
+    return request
+
+
+@pytest.fixture
+def pending_event_id(db, sample_organizer):
+    """Create a pending event with its category and return the event id."""
+    category = Category(
+        id=str(uuid.uuid4()),
+        name="Technology",
+        slug="technology",
+        color="blue",
+        is_active=True
+    )
+    event = Event(
+        id=str(uuid.uuid4()),
+        title="Hack Night",
+        description="Build things",
+        category_id=category.id,
+        organizer_id=sample_organizer.id,
+        date=date(2030, 1, 15),
+        start_time=time(18, 0),
+        end_time=time(21, 0),
+        venue="Iribe Center",
+        location="Room 0318",
+        capacity=50,
+        registered_count=0,
+        waitlist_count=0,
+        status=EventStatus.PENDING,
+        is_featured=False
+    )
+    event_id = event.id
+    db.add_all([category, event])
+    db.commit()
+    db.expunge_all()
+    return event_id
+
+
+@pytest.fixture
+def confirmed_registration(db, sample_student, pending_event_id):
+    """Create a confirmed registration for the sample student and return its ids."""
+    # sample_student was detached when the event fixture expunged the session
+    student_id = db.scalars(
+        select(User.id).where(User.email == "teststudent@umd.edu")
+    ).one()
+    registration = Registration(
+        id=str(uuid.uuid4()),
+        user_id=student_id,
+        event_id=pending_event_id,
+        status=RegistrationStatus.CONFIRMED,
+        ticket_code="TKT-TEST-0001"
+    )
+    db.add(registration)
+    db.commit()
+    db.expunge_all()
+    return {"user_id": student_id, "event_id": pending_event_id}
+
+
+class TestStrictLoading:
+    """Test that list queries declare the relationships they serialize."""
+
+    def test_approval_list_serializes(self, db, pending_approval):
+        """Test approval requests from get_all serialize with user details."""
+        requests = OrganizerApprovalRepository(db).get_all()
+
+        data = requests[0].to_dict(include_user=True)
+        assert data["email"] == "teststudent@umd.edu"
+
+    def test_approval_lazy_load_raises(self, db, pending_approval):
+        """Test serializing without the user loader raises instead of querying."""
+        requests = db.query(OrganizerApprovalRequest).options(*strict_loading()).all()
+
+        with pytest.raises(InvalidRequestError):
+            requests[0].to_dict(include_user=True)
+
+    def test_pending_events_serialize(self, db, pending_event_id):
+        """Test pending events serialize with category and organizer."""
+        events = EventRepository(db).get_pending_events()
+
+        data = events[0].to_dict()
+        assert data["category"]["slug"] == "technology"
+        assert data["organizer"]["email"] == "testorganizer@umd.edu"
+
+    def test_event_lazy_load_raises(self, db, pending_event_id):
+        """Test serializing without the organizer loader raises instead of querying."""
+        events = db.query(Event).options(*strict_loading()).all()
+
+        with pytest.raises(InvalidRequestError):
+            events[0].to_dict(include_organizer=True)
+
+    def test_user_registrations_serialize(self, db, confirmed_registration):
+        """Test user registrations load event and organizer up front."""
+        registrations = RegistrationRepository(db).get_user_registrations(
+            user_id=confirmed_registration["user_id"]
+        )
+
+        assert registrations[0].event.organizer.name == "Test Organizer"
+
+    def test_registration_lazy_load_raises(self, db, confirmed_registration):
+        """Test event registrations raise on relationships they did not load."""
+        registrations = RegistrationRepository(db).get_event_registrations(
+            event_id=confirmed_registration["event_id"]
+        )
+
+        assert registrations[0].user.email == "teststudent@umd.edu"
+        with pytest.raises(InvalidRequestError):
+            registrations[0].event
@@ -0,0 +1,167 @@
+"""
+Tests for keyset (cursor) pagination of events and audit logs.
+"""
+import pytest
+import uuid
+from datetime import date, datetime, time, timezone
+from fastapi import status
+from app.models.audit_log import AuditLog, AuditAction, TargetType
+from app.models.category import Category
+from app.models.event import Event, EventStatus
+
+
+def _auth_headers(client, email):
+    response = client.post(
+        "/api/auth/login",
+        json={"email": email, "password": "password123"}
+    )
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+@pytest.fixture
+def published_events(db, sample_organizer):
+    """Create five published events whose sort keys tie in pairs."""
+    category = Category(
+        id=str(uuid.uuid4()),
+        name="Technology",
+        slug="technology",
+        color="blue",
+        is_active=True
+    )
+    db.add(category)
+    for i in range(5):
+        db.add(Event(
+            id=str(uuid.uuid4()),
+            # Titles, dates/start times and counts repeat, so pages have
+            # to fall back to the id to split ties
+            title=f"Hack Night {i // 2}",
+            description="Build things",
+            category_id=category.id,
+            organizer_id=sample_organizer.id,
+            date=date(2030, 1, 15 + i // 2),
+            start_time=time(18, 0),
+            end_time=time(21, 0),
+            venue="Iribe Center",
+            location="Room 0318",
+            capacity=50,
+            registered_count=i // 2,
+            waitlist_count=0,
+            status=EventStatus.PUBLISHED,
+            is_featured=False
+        ))
+    db.commit()
+    db.expunge_all()
+
+
+@pytest.fixture
+def audit_entries(db, sample_organizer):
+    """Create five audit entries sharing one timestamp."""
+    organizer_id = sample_organizer.id
+    timestamp = datetime.now(timezone.utc)
+    for i in range(5):
+        db.add(AuditLog(
+            id=str(uuid.uuid4()),
+            timestamp=timestamp,
+            action=AuditAction.ATTENDEE_CHECKED_IN,
+            actor_id=organizer_id,
+            actor_name="Test Organizer",
+            actor_role="organizer",
+            target_type=TargetType.REGISTRATION,
+            target_name="Hack Night",
+            details=f"Check-in {i}"
+        ))
+    db.commit()
+    db.expunge_all()
+
+
+class TestEventCursor:
+    """Test cursor pagination of GET /api/events."""
+
+    @pytest.mark.parametrize("sort_by", ["date", "title", "popularity"])
+    def test_cursor_pages_match_offset_order(self, client, sample_student, published_events, sort_by):
+        """Test walking nextCursor returns every event once, in list order."""
+        headers = _auth_headers(client, "teststudent@umd.edu")
+        expected = [
+            event["id"] for event in client.get(
+                "/api/events", params={"sortBy": sort_by, "limit": 100}, headers=headers
+            ).json()["events"]
+        ]
+
+        seen = []
+        params = {"sortBy": sort_by, "limit": 2}
+        while True:
+            response = client.get("/api/events", params=params, headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            seen.extend(event["id"] for event in data["events"])
+            if not data["pagination"]["nextCursor"]:
+                break
+            params["cursor"] = data["pagination"]["nextCursor"]
+
+        assert len(expected) == 5
+        assert seen == expected
+
+    @pytest.mark.parametrize("other_sort", ["title", "popularity"])
+    def test_cursor_from_other_sort_rejected(self, client, sample_student, published_events, other_sort):
+        """Test a cursor issued for one sortBy is refused under another."""
+        headers = _auth_headers(client, "teststudent@umd.edu")
+        cursor = client.get(
+            "/api/events", params={"sortBy": "date", "limit": 2}, headers=headers
+        ).json()["pagination"]["nextCursor"]
+
+        response = client.get(
+            "/api/events",
+            params={"sortBy": other_sort, "limit": 2, "cursor": cursor},
+            headers=headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_malformed_cursor_rejected(self, client, sample_student, published_events):
+        """Test a cursor that doesn't decode is refused."""
+        headers = _auth_headers(client, "teststudent@umd.edu")
+
+        response = client.get(
+            "/api/events", params={"limit": 2, "cursor": "not-a-cursor"}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestAuditLogCursor:
+    """Test cursor pagination of GET /api/admin/audit-logs."""
+
+    def test_cursor_pages_split_timestamp_ties(self, client, sample_admin, audit_entries):
+        """Test entries sharing a timestamp are each returned once."""
+        headers = _auth_headers(client, "testadmin@umd.edu")
+        params = {"action": "ATTENDEE_CHECKED_IN", "limit": 2}
+
+        first = client.get("/api/admin/audit-logs", params=params, headers=headers).json()
+        assert first["pagination"]["totalItems"] == 5
+
+        seen = [log["id"] for log in first["logs"]]
+        cursor = first["pagination"]["nextCursor"]
+        while cursor:
+            response = client.get(
+                "/api/admin/audit-logs", params={**params, "cursor": cursor}, headers=headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            # Totals aren't computed for cursor pages
+            assert data["pagination"]["totalItems"] is None
+            assert data["pagination"]["totalPages"] is None
+            seen.extend(log["id"] for log in data["logs"])
+            cursor = data["pagination"]["nextCursor"]
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    def test_malformed_cursor_rejected(self, client, sample_admin, audit_entries):
+        """Test a cursor that doesn't decode is refused."""
+        headers = _auth_headers(client, "testadmin@umd.edu")
+
+        response = client.get(
+            "/api/admin/audit-logs", params={"cursor": "not-a-cursor"}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,182 @@
+"""
+Tests for waitlist promotion.
+"""
+import pytest
+import uuid
+from datetime import date, time
+from sqlalchemy import event as sa_event, select
+from sqlalchemy.dialects import postgresql
+from app.models.category import Category
+from app.models.event import Event, EventStatus
+from app.models.registration import Registration, RegistrationStatus
+from app.models.user import User, UserRole
+from app.models.waitlist import WaitlistEntry
+from app.repositories.waitlist_repository import WaitlistRepository
+from app.services import registration_service
+from app.services.registration_service import RegistrationService
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def full_event_id(db, sample_organizer, sample_student):
+    """Create a published, full event (one seat, taken by the sample student) and return its id."""
+    category = Category(
+        id=str(uuid.uuid4()),
+        name="Technology",
+        slug="technology",
+        color="blue",
+        is_active=True
+    )
+    event = Event(
+        id=str(uuid.uuid4()),
+        title="Hack Night",
+        description="Build things",
+        category_id=category.id,
+        organizer_id=sample_organizer.id,
+        date=date(2030, 1, 15),
+        start_time=time(18, 0),
+        end_time=time(21, 0),
+        venue="Iribe Center",
+        location="Room 0318",
+        capacity=1,
+        registered_count=1,
+        waitlist_count=3,
+        status=EventStatus.PUBLISHED,
+        is_featured=False
+    )
+    registration = Registration(
+        id=str(uuid.uuid4()),
+        user_id=sample_student.id,
+        event_id=event.id,
+        status=RegistrationStatus.CONFIRMED,
+        ticket_code="TKT-TEST-0001"
+    )
+    event_id = event.id
+    db.add_all([category, event, registration])
+    db.commit()
+    db.expunge_all()
+    return event_id
+
+
+@pytest.fixture
+def waitlisted_users(db, full_event_id):
+    """Put three users on the event's waitlist, at positions 1-3."""
+    user_ids = []
+    for position in range(1, 4):
+        user = User(
+            id=str(uuid.uuid4()),
+            email=f"waiting{position}@umd.edu",
+            password="not-a-real-hash",
+            name=f"Waiting Student {position}",
+            role=UserRole.STUDENT,
+            is_approved=True
+        )
+        entry = WaitlistEntry(
+            id=str(uuid.uuid4()),
+            user_id=user.id,
+            event_id=full_event_id,
+            position=position
+        )
+        db.add_all([user, entry])
+        db.flush()
+        user_ids.append(user.id)
+    db.commit()
+    db.expunge_all()
+    return user_ids
+
+
+def _positions(db, event_id):
+    return db.execute(
+        select(WaitlistEntry.user_id, WaitlistEntry.position).where(
+            WaitlistEntry.event_id == event_id
+        ).order_by(WaitlistEntry.position)
+    ).all()
+
+
+class TestPopFirst:
+    """Test taking the head of a waitlist."""
+
+    def test_pops_head_and_shifts_positions(self, db, full_event_id, waitlisted_users):
+        """Test the head entry is removed and everyone behind moves up."""
+        entry = WaitlistRepository(db).pop_first(full_event_id)
+        # The popped row is gone once committed, so read it first
+        popped_user_id = entry.user_id
+        db.commit()
+
+        assert popped_user_id == waitlisted_users[0]
+        assert _positions(db, full_event_id) == [
+            (waitlisted_users[1], 1),
+            (waitlisted_users[2], 2)
+        ]
+
+    def test_successive_pops_take_successive_entries(self, db, full_event_id, waitlisted_users):
+        """Test a second promotion after the first still finds the next entry."""
+        first_session = TestingSessionLocal()
+        second_session = TestingSessionLocal()
+        try:
+            first = WaitlistRepository(first_session).pop_first(full_event_id)
+            first_user_id = first.user_id
+            first_session.commit()
+            second = WaitlistRepository(second_session).pop_first(full_event_id)
+            second_user_id = second.user_id if second is not None else None
+            second_session.commit()
+        finally:
+            first_session.close()
+            second_session.close()
+
+        assert first_user_id == waitlisted_users[0]
+        assert second_user_id == waitlisted_users[1]
+        assert _positions(db, full_event_id) == [(waitlisted_users[2], 1)]
+
+    def test_empty_waitlist_returns_none(self, db, full_event_id):
+        """Test popping an empty waitlist returns None."""
+        assert WaitlistRepository(db).pop_first(full_event_id) is None
+
+    def test_locks_event_instead_of_skipping_entries(self, db, full_event_id, waitlisted_users):
+        """Test promotions serialize on the event row rather than SKIP LOCKED."""
+        statements = []
+
+        def capture(orm_execute_state):
+            statements.append(str(
+                orm_execute_state.statement.compile(dialect=postgresql.dialect())
+            ))
+
+        sa_event.listen(db, "do_orm_execute", capture)
+        try:
+            WaitlistRepository(db).pop_first(full_event_id)
+        finally:
+            sa_event.remove(db, "do_orm_execute", capture)
+        db.rollback()
+
+        assert "FROM events" in statements[0] and "FOR UPDATE" in statements[0]
+        assert not any("SKIP LOCKED" in statement for statement in statements)
+
+
+class TestCancelPromotion:
+    """Test the waitlist promotion triggered by a cancellation."""
+
+    def test_failed_promotion_keeps_waitlist_entry(
+        self, db, monkeypatch, full_event_id, waitlisted_users
+    ):
+        """Test a promotion that fails after popping rolls the pop back."""
+        def broken_qr_code(ticket_code):
+            raise RuntimeError("QR generation failed")
+
+        monkeypatch.setattr(registration_service, "generate_qr_code", broken_qr_code)
+        registration_id, user_id = db.execute(
+            select(Registration.id, Registration.user_id).where(
+                Registration.event_id == full_event_id
+            )
+        ).one()
+
+        cancelled = RegistrationService(db).cancel_registration(
+            registration_id=registration_id,
+            user_id=user_id
+        )
+
+        assert cancelled.status == RegistrationStatus.CANCELLED
+        assert _positions(db, full_event_id) == [
+            (waitlisted_users[0], 1),
+            (waitlisted_users[1], 2),
+            (waitlisted_users[2], 3)
+        ]